@@ -0,0 +1,83 @@
+"""
+Startup cost of the client.
+
+Compares the lazy client, which imports and creates services on first access, with a client
+whose services are all touched right away, i.e. what every client used to pay up front.
+
+Usage::
+
+  $ python benchmarks/client_startup.py
+"""
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fortnox  # noqa: E402
+
+OPTIONS = dict(access_token='access-token', client_secret='client-secret')
+SERVICES = [name for name, value in vars(fortnox.Client).items() if isinstance(value, property)]
+
+IMPORT_LAZY = 'import fortnox'
+IMPORT_EAGER = 'import fortnox; [getattr(fortnox, name) for name in fortnox.services.SERVICE_MODULES]'
+
+
+def import_time(statement, repeat=5):
+    """
+    Best wall time of importing the package in a fresh interpreter, in milliseconds.
+    """
+    code = 'import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)'
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timings = [
+        float(subprocess.check_output([sys.executable, '-c', code.format(statement=statement)], cwd=root))
+        for _ in range(repeat)
+    ]
+    return min(timings) * 1000
+
+
+def build_client(eager):
+    client = fortnox.Client(**OPTIONS)
+    if eager:
+        for name in SERVICES:
+            getattr(client, name)
+    return client
+
+
+def construction_time(eager, number=2000):
+    """
+    Average time to create a client, in microseconds.
+    """
+    return timeit.timeit(lambda: build_client(eager), number=number) / number * 1e6
+
+
+def memory_per_client(eager, clients=500):
+    """
+    Memory held by one client, in bytes, measured over many clients as for a multi tenant setup.
+    """
+    build_client(eager)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [build_client(eager) for _ in range(clients)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del kept
+    return allocated / clients
+
+
+def main():
+    rows = [
+        ('import fortnox (ms)', import_time(IMPORT_LAZY), import_time(IMPORT_EAGER)),
+        ('Client() (us)', construction_time(False), construction_time(True)),
+        ('memory per client (bytes)', memory_per_client(False), memory_per_client(True)),
+    ]
+    print('{:<28}{:>14}{:>14}'.format('', 'lazy', 'eager'))
+    for label, lazy, eager in rows:
+        print('{:<28}{:>14.1f}{:>14.1f}'.format(label, lazy, eager))
+
+
+if __name__ == '__main__':
+    main()
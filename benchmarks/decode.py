@@ -0,0 +1,75 @@
+"""
+Cost of decoding a large list response in every decode mode and json backend.
+
+Usage::
+
+  $ python benchmarks/decode.py
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fortnox.decoders import Decoder, orjson  # noqa: E402
+from fortnox.http_client import BaseHttpClient  # noqa: E402
+
+
+def invoice(number, rows=20):
+    return {
+        '@url': 'https://api.fortnox.se/3/invoices/{0}'.format(number),
+        'DocumentNumber': str(number),
+        'CustomerNumber': str(number % 300),
+        'CustomerName': 'Customer {0}'.format(number % 300),
+        'InvoiceDate': '2020-01-01',
+        'DueDate': '2020-01-31',
+        'Currency': 'SEK',
+        'Total': 1250.5,
+        'Balance': 0,
+        'Booked': True,
+        'InvoiceRows': [
+            {
+                'ArticleNumber': str(row),
+                'Description': 'Article {0}'.format(row),
+                'DeliveredQuantity': '1.00',
+                'Price': 62.5,
+                'VAT': 25,
+                'AccountNumber': 3001,
+            }
+            for row in range(rows)
+        ],
+    }
+
+
+def page(size=500):
+    return json.dumps({
+        'MetaInformation': {'@TotalResources': size, '@TotalPages': 1, '@CurrentPage': 1},
+        'Invoices': [invoice(number) for number in range(size)],
+    }).encode('utf-8')
+
+
+def decode(decoder, content, touch):
+    items = BaseHttpClient.unwrap_envelope(decoder.loads(content), decoder.convert)
+    if touch:
+        for item in items:
+            item['InvoiceRows'][0]['Price']
+    return items
+
+
+def main(number=20):
+    content = page()
+    backends = ['json'] + (['orjson'] if orjson is not None else [])
+    print('{:<8}{:<8}{:>18}{:>22}'.format('mode', 'json', 'decode (ms)', 'decode + rows (ms)'))
+    for backend in backends:
+        for mode in ('munch', 'dict', 'attr'):
+            decoder = Decoder(mode, backend)
+            timings = [
+                timeit.timeit(lambda: decode(decoder, content, touch), number=number) / number * 1000
+                for touch in (False, True)
+            ]
+            print('{:<8}{:<8}{:>18.1f}{:>22.1f}'.format(mode, backend, *timings))
+
+
+if __name__ == '__main__':
+    main()
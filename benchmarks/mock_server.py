@@ -0,0 +1,305 @@
+"""
+In-process stand-in for the Fortnox API, used by the benchmarks instead of real credentials.
+
+Serves paginated invoices, vouchers and accounts with their ``MetaInformation``, single records,
+invoice writes, inbox uploads and ranged file downloads over a local threaded http server, and
+can inject latency, 429 responses and 5xx errors.
+
+Usage::
+
+  >>> with MockFortnox(latency=0.005, rate_limit_rate=0.05) as server:
+  ...     client = fortnox.Client(access_token='token', client_secret='secret', base_url=server.base_url)
+  ...     client.invoices.list(limit=500)
+"""
+import collections
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+API_VERSION = '/3'
+
+
+def invoice(number, rows=10):
+    return {
+        '@url': 'https://api.fortnox.se/3/invoices/{0}'.format(number),
+        'DocumentNumber': str(number),
+        'CustomerNumber': str(number % 300),
+        'CustomerName': 'Customer {0}'.format(number % 300),
+        'InvoiceDate': '2020-01-{0:02d}'.format(number % 28 + 1),
+        'DueDate': '2020-02-{0:02d}'.format(number % 28 + 1),
+        'Currency': 'SEK',
+        'CurrencyRate': 1,
+        'Total': 1250.5 + number % 100,
+        'Balance': 0 if number % 3 else 1250.5,
+        'Booked': bool(number % 2),
+        'Cancelled': False,
+        'Sent': True,
+        'OCR': '{0}1'.format(number),
+        'InvoiceRows': [
+            {
+                'ArticleNumber': str(row),
+                'AccountNumber': 3001,
+                'Description': 'Article {0}'.format(row),
+                'DeliveredQuantity': '1.00',
+                'Price': 125.05,
+                'VAT': 25,
+                'Total': 125.05,
+            }
+            for row in range(rows)
+        ],
+    }
+
+
+def voucher(number, rows=4):
+    return {
+        '@url': 'https://api.fortnox.se/3/vouchers/A/{0}?financialyear=1'.format(number),
+        'VoucherSeries': 'A',
+        'VoucherNumber': number,
+        'Year': 1,
+        'TransactionDate': '2020-01-{0:02d}'.format(number % 28 + 1),
+        'Description': 'Voucher {0}'.format(number),
+        'ReferenceNumber': str(number),
+        'ReferenceType': 'MANUAL',
+        'VoucherRows': [
+            {
+                'Account': 1930 if row % 2 else 3001,
+                'Debit': 100.0 if row % 2 else 0,
+                'Credit': 0 if row % 2 else 100.0,
+                'Description': 'Row {0}'.format(row),
+                'TransactionInformation': '',
+                'CostCenter': '',
+                'Project': '',
+                'Removed': False,
+            }
+            for row in range(rows)
+        ],
+    }
+
+
+def account(number):
+    return {
+        '@url': 'https://api.fortnox.se/3/accounts/{0}?financialyear=1'.format(number),
+        'Active': True,
+        'BalanceBroughtForward': 0,
+        'CostCenter': None,
+        'CostCenterSettings': 'ALLOWED',
+        'Description': 'Account {0}'.format(number),
+        'Number': number,
+        'Project': '',
+        'ProjectSettings': 'ALLOWED',
+        'SRU': 7201,
+        'Year': 1,
+        'VATCode': None,
+    }
+
+
+"""
+Collection key, single record key, record builder and number of the first record of every list endpoint.
+"""
+Collection = collections.namedtuple('Collection', ['key', 'item_key', 'build', 'first'])
+
+COLLECTIONS = {
+    'invoices': Collection('Invoices', 'Invoice', invoice, 1),
+    'vouchers': Collection('Vouchers', 'Voucher', voucher, 1),
+    'accounts': Collection('Accounts', 'Account', account, 1000),
+}
+
+
+class MockFortnox(object):
+    """
+    Local Fortnox stand-in running on a background thread.
+
+    Encoded pages are cached so that building payloads does not compete with the client for the
+    interpreter; every request still goes through the http stack and fault injection.
+    """
+
+    def __init__(self, invoices=2000, vouchers=2000, accounts=1200, file_size=1024 * 1024, latency=0.0,
+                 jitter=0.0, rate_limit_rate=0.0, server_error_rate=0.0, seed=1):
+        """
+        :param int invoices: (optional) Number of invoices served.
+        :param int vouchers: (optional) Number of vouchers served.
+        :param int accounts: (optional) Number of accounts served.
+        :param int file_size: (optional) Size of the files of the inbox, in bytes.
+        :param float latency: (optional) Seconds added to every response.
+        :param float jitter: (optional) Random seconds, up to this value, added on top of the latency.
+        :param float rate_limit_rate: (optional) Share of requests answered with 429.
+        :param float server_error_rate: (optional) Share of requests answered with 503.
+        :param int seed: (optional) Seed of the fault injection, for reproducible runs.
+        """
+        self.sizes = {'invoices': invoices, 'vouchers': vouchers, 'accounts': accounts}
+        self.file = bytes(range(256)) * (file_size // 256)
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.server_error_rate = server_error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.pages = {}
+        self.statuses = collections.Counter()
+        self.server = None
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return 'http://{host}:{port}'.format(host=host, port=port)
+
+    @property
+    def requests(self):
+        return sum(self.statuses.values())
+
+    def start(self):
+        handler = type('Handler', (MockHandler,), {'fortnox': self})
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, name='mock-fortnox', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def fault(self):
+        """
+        :return: Status of an injected error, ``None`` to serve the request.
+        :rtype: int
+        """
+        with self.lock:
+            delay = self.latency + (self.random.random() * self.jitter if self.jitter else 0)
+            draw = self.random.random()
+        if delay:
+            time.sleep(delay)
+        if draw < self.rate_limit_rate:
+            return 429
+        if draw < self.rate_limit_rate + self.server_error_rate:
+            return 503
+        return None
+
+    def page(self, resource, page, limit):
+        key = (resource, page, limit)
+        content = self.pages.get(key)
+        if content is None:
+            collection = COLLECTIONS[resource]
+            total = self.sizes[resource]
+            total_pages = max(1, -(-total // limit))
+            start = collection.first + (page - 1) * limit
+            stop = collection.first + min(total, page * limit)
+            content = json.dumps({
+                'MetaInformation': {'@TotalResources': total, '@TotalPages': total_pages, '@CurrentPage': page},
+                collection.key: [collection.build(number) for number in range(start, stop)],
+            }).encode('utf-8')
+            self.pages[key] = content
+        return content
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """
+    Routes the requests of :class:`MockFortnox`.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    fortnox = None
+
+    RECORD = re.compile(r'^/(invoices|accounts)/(\w+)$')
+    VOUCHER = re.compile(r'^/vouchers/(\w+)/(\d+)$')
+    INBOX_FILE = re.compile(r'^/inbox/([\w-]+)$')
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.handle_request('GET')
+
+    def do_POST(self):
+        self.handle_request('POST')
+
+    def do_PUT(self):
+        self.handle_request('PUT')
+
+    def handle_request(self, method):
+        url = urlsplit(self.path)
+        path = url.path[len(API_VERSION):] if url.path.startswith(API_VERSION) else url.path
+        query = dict((key, values[0]) for key, values in parse_qs(url.query).items())
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+        status = self.fortnox.fault()
+        if status == 429:
+            return self.send_json(429, {'message': 'Too many requests'}, {'Retry-After': '0'})
+        if status is not None:
+            return self.send_json(status, {'ErrorInformation': {'code': status, 'message': 'Service unavailable'}})
+
+        resource = path.strip('/')
+        if method == 'GET' and resource in COLLECTIONS:
+            limit = min(int(query.get('limit', 100)), 500)
+            return self.send_content(200, self.fortnox.page(resource, int(query.get('page', 1)), limit))
+
+        match = self.RECORD.match(path)
+        if match:
+            collection = COLLECTIONS[match.group(1)]
+            number = int(match.group(2)) if match.group(2).isdigit() else collection.first
+            if method == 'GET':
+                return self.send_json(200, {collection.item_key: collection.build(number)})
+            if method == 'PUT':
+                return self.send_json(200, {collection.item_key: dict(collection.build(number), **self.item(body))})
+
+        match = self.VOUCHER.match(path)
+        if match and method == 'GET':
+            return self.send_json(200, {'Voucher': voucher(int(match.group(2)))})
+
+        if path == '/invoices' and method == 'POST':
+            return self.send_json(201, {'Invoice': dict(invoice(self.fortnox.requests), **self.item(body))})
+
+        if path == '/inbox' and method == 'POST':
+            return self.send_json(201, {'File': {'Id': str(uuid.uuid4()), 'Name': 'upload', 'Size': len(body),
+                                                 'Path': query.get('path', 'inbox_s')}})
+
+        match = self.INBOX_FILE.match(path)
+        if match and method == 'GET':
+            return self.send_file()
+
+        self.send_json(404, {'ErrorInformation': {'code': 2000428, 'message': 'Not found'}})
+
+    @staticmethod
+    def item(body):
+        try:
+            envelope = json.loads(body.decode('utf-8')) if body else {}
+        except ValueError:
+            return {}
+        return next(iter(envelope.values()), {}) if isinstance(envelope, dict) else {}
+
+    def send_file(self):
+        content = self.fortnox.file
+        requested = self.headers.get('Range')
+        if requested and requested.startswith('bytes='):
+            start = int(requested[len('bytes='):].split('-', 1)[0])
+            headers = {'Content-Range': 'bytes {0}-{1}/{2}'.format(start, len(content) - 1, len(content))}
+            return self.send_content(206, content[start:], headers, 'application/octet-stream')
+        self.send_content(200, content, content_type='application/octet-stream')
+
+    def send_json(self, status, data, headers=None):
+        self.send_content(status, json.dumps(data).encode('utf-8'), headers)
+
+    def send_content(self, status, content, headers=None, content_type='application/json'):
+        with self.fortnox.lock:
+            self.fortnox.statuses[status] += 1
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
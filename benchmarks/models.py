@@ -0,0 +1,87 @@
+"""
+Memory and decoding speed of voucher rows held as Munch objects and as models.
+
+Usage::
+
+  $ python benchmarks/models.py
+"""
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from munch import munchify  # noqa: E402
+
+from fortnox.models import Voucher  # noqa: E402
+
+
+def voucher(number, rows=10):
+    return {
+        '@url': 'https://api.fortnox.se/3/vouchers/A/{0}'.format(number),
+        'VoucherSeries': 'A',
+        'VoucherNumber': number,
+        'Year': 1,
+        'TransactionDate': '2020-01-01',
+        'Description': 'Voucher {0}'.format(number),
+        'Comments': '',
+        'ReferenceNumber': str(number),
+        'ReferenceType': 'INVOICE',
+        'ApprovalState': 0,
+        'CostCenter': '',
+        'Project': '',
+        'VoucherRows': [
+            {
+                'Account': 1930 + row,
+                'Debit': 125.5 if row % 2 else 0,
+                'Credit': 0 if row % 2 else 125.5,
+                'Quantity': 0,
+                'Description': 'Row {0}'.format(row),
+                'TransactionInformation': '',
+                'CostCenter': '',
+                'Project': '',
+                'Removed': False,
+            }
+            for row in range(rows)
+        ],
+    }
+
+
+def measure(decode, content):
+    """
+    Decode a body and return the seconds spent and the bytes kept alive by the result.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = decode(content)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, size
+
+
+def main(vouchers=50000):
+    content = json.dumps([voucher(number) for number in range(vouchers)])
+    candidates = [
+        ('munch', lambda body: [munchify(item) for item in json.loads(body)]),
+        ('dict', json.loads),
+        ('model', lambda body: Voucher.from_list(json.loads(body))),
+    ]
+    print('{} vouchers, {} rows'.format(vouchers, vouchers * 10))
+    print('{:<8}{:>14}{:>14}{:>18}'.format('', 'decode (s)', 'memory (MB)', 'bytes per row'))
+    for label, decode in candidates:
+        # timings are taken without tracing, memory with it
+        start = time.perf_counter()
+        decode(content)
+        elapsed = time.perf_counter() - start
+        _, size = measure(decode, content)
+        print('{:<8}{:>14.2f}{:>14.1f}{:>18.0f}'.format(label, elapsed, size / 1e6, size / (vouchers * 10)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+"""
+Reproducible benchmark suite run against the local Fortnox stand-in of ``mock_server.py``.
+
+Every scenario drives a real :class:`fortnox.Client` over http and reports requests per second,
+p50 and p99 latency, the share of time spent decoding and the peak memory allocated. Results are
+compared with ``baseline.json``, a scenario being flagged when its throughput drops or its latency
+or memory grows by more than the threshold.
+
+Usage::
+
+  $ python benchmarks/suite.py                      # run and compare with the baseline
+  $ python benchmarks/suite.py --save-baseline      # run and store the results as the new baseline
+  $ python benchmarks/suite.py list pagination --latency 0.005 --server-error-rate 0.02
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fortnox  # noqa: E402
+from mock_server import MockFortnox, invoice  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+"""
+Metrics where a higher value is better, the others are better lower.
+"""
+HIGHER_IS_BETTER = ('rps',)
+
+
+class LatencyRecorder(object):
+    """
+    Hook listener keeping the timings of every response.
+    """
+
+    def __init__(self):
+        self.responses = []
+        self.retries = 0
+
+    def after_response(self, event):
+        self.responses.append(event)
+
+    def on_retry(self, event):
+        self.retries += 1
+
+
+def percentile(values, share):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(share * (len(values) - 1))))]
+
+
+def list_invoices(client, scale):
+    for _ in range(10 * scale):
+        client.invoices.list(limit=500)
+
+
+def paginate_vouchers(client, scale):
+    for _ in range(scale):
+        for _ in client.vouchers.iter_all(limit=100, prefetch=True):
+            pass
+
+
+def paginate_accounts(client, scale):
+    for _ in range(2 * scale):
+        for _ in client.accounts.iter_all(limit=100):
+            pass
+
+
+def bulk_write(client, scale):
+    items = [dict(invoice(number, rows=3), service='Invoice') for number in range(100 * scale)]
+    result = client.invoices.create_many(items)
+    if result.failed:
+        raise result.failed[0].error
+
+
+def upload_files(client, scale):
+    content = bytes(range(256)) * 4096
+    for number in range(5 * scale):
+        client.inbox.create(path='inbox_s', file=content, file_name='scan{0}.pdf'.format(number))
+
+
+def download_files(client, scale):
+    for number in range(5 * scale):
+        client.inbox.download(str(number), io.BytesIO())
+
+
+"""
+Scenario name: (function, options of its mock server, options of its client).
+"""
+SCENARIOS = {
+    'list': (list_invoices, {}, {}),
+    'pagination': (paginate_vouchers, {}, {}),
+    'bulk_write': (bulk_write, {}, {}),
+    'upload': (upload_files, {}, {}),
+    'download': (download_files, {}, {}),
+    'retries': (paginate_accounts, {'rate_limit_rate': 0.1, 'server_error_rate': 0.05},
+                {'retry_policy': fortnox.RetryPolicy(max_attempts=10, backoff_base=0.001, backoff_cap=0.01)}),
+}
+
+
+def make_client(server, recorder, **options):
+    options = dict(dict(access_token='access-token', client_secret='client-secret', base_url=server.base_url,
+                        rate_limit=None, hooks=fortnox.Hooks(recorder)), **options)
+    return fortnox.Client(**options)
+
+
+def run_scenario(name, scale=1, **server_options):
+    """
+    Run a scenario twice, once timed and once under :mod:`tracemalloc` for its peak memory.
+
+    :return: Results of the scenario.
+    :rtype: dict
+    """
+    scenario, scenario_server_options, client_options = SCENARIOS[name]
+    with MockFortnox(**dict(scenario_server_options, **server_options)) as server:
+        # warm up the connection pool and the cached pages of the server
+        warm_up = LatencyRecorder()
+        with make_client(server, warm_up, **client_options) as client:
+            scenario(client, 1)
+
+        recorder = LatencyRecorder()
+        with make_client(server, recorder, **client_options) as client:
+            started = time.perf_counter()
+            scenario(client, scale)
+            elapsed = time.perf_counter() - started
+
+        tracemalloc.start()
+        try:
+            with make_client(server, LatencyRecorder(), **client_options) as client:
+                scenario(client, scale)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    latencies = [event.elapsed for event in recorder.responses]
+    decode_time = sum(event.decode_time for event in recorder.responses)
+    return {
+        'requests': len(latencies),
+        'retries': recorder.retries,
+        'rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'decode_share': round(decode_time / sum(latencies), 3) if latencies else 0.0,
+        'peak_mb': round(peak / 1024 / 1024, 1),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    :return: Lines describing every metric that regressed by more than ``threshold``.
+    :rtype: list
+    """
+    regressions = []
+    for name, result in results.items():
+        for metric in ('rps', 'p50_ms', 'p99_ms', 'peak_mb'):
+            previous = baseline.get(name, {}).get(metric)
+            if not previous:
+                continue
+            change = (result[metric] - previous) / previous
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            if change > threshold:
+                regressions.append('{name} {metric}: {previous} -> {current} ({change:+.0%})'.format(
+                    name=name, metric=metric, previous=previous, current=result[metric], change=change))
+    return regressions
+
+
+def print_results(results, baseline):
+    header = '{:<12}{:>10}{:>9}{:>10}{:>10}{:>10}{:>10}{:>10}'
+    row = '{:<12}{:>10}{:>9}{:>10.1f}{:>10.2f}{:>10.2f}{:>10.1%}{:>10.1f}'
+    print(header.format('scenario', 'requests', 'retries', 'rps', 'p50 ms', 'p99 ms', 'decode', 'peak MB'))
+    for name, result in results.items():
+        print(row.format(name, result['requests'], result['retries'], result['rps'], result['p50_ms'],
+                         result['p99_ms'], result['decode_share'], result['peak_mb']))
+        previous = baseline.get(name)
+        if previous:
+            print(row.format('  baseline', previous['requests'], previous['retries'], previous['rps'],
+                             previous['p50_ms'], previous['p99_ms'], previous['decode_share'], previous['peak_mb']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the client against a local Fortnox stand-in.')
+    parser.add_argument('scenarios', nargs='*', metavar='scenario',
+                        help='scenarios to run, all by default: {0}'.format(', '.join(SCENARIOS)))
+    parser.add_argument('--scale', type=int, default=1, help='multiplies the work of every scenario')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random seconds added on top of the latency')
+    parser.add_argument('--rate-limit-rate', type=float, help='share of requests answered with 429')
+    parser.add_argument('--server-error-rate', type=float, help='share of requests answered with 503')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline file, default: %(default)s')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='relative change reported as regression, default: %(default)s')
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error('unknown scenarios: {0}'.format(', '.join(unknown)))
+
+    server_options = {'latency': args.latency, 'jitter': args.jitter}
+    if args.rate_limit_rate is not None:
+        server_options['rate_limit_rate'] = args.rate_limit_rate
+    if args.server_error_rate is not None:
+        server_options['server_error_rate'] = args.server_error_rate
+
+    results = dict((name, run_scenario(name, args.scale, **server_options)) for name in args.scenarios or SCENARIOS)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as handle:
+            json.dump(dict(baseline, **results), handle, indent=2, sort_keys=True)
+            handle.write('\n')
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print('regression: ' + regression)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,26 +1,67 @@
+import importlib
+
 from fortnox.errors import (
     ConfigurationError, RateLimitError, BaseError,
     RequestError, ResourceError, ServerError
 )
 
 from fortnox.configuration import Configuration
+from fortnox.rate_limiter import RateLimiter, TokenBucket
+from fortnox.retry import RetryPolicy, RetryEvent
+from fortnox.hooks import Hooks, RequestEvent, ResponseEvent, ErrorEvent
+from fortnox.metrics import MetricsCollector
+from fortnox.tracing import TracedService, RecordingTracer
 from fortnox.http_client import HttpClient
 
-from fortnox.services import (
-    AbsenceTransactionsService, CurrencyService, CompanyInformationService, ProjectService,
-    CustomerService, CompanySettingsService, AccountChartsService, AccountsService,
-    FinancialYearService, InvoiceService, AssetTypeService, PredefinedAccountService,
-    EmployeeService, ArticleService, ExpenseService, PredefinedVoucherSeriesService,
-    AssetService, AccessTokenService, AttendanceTransactionsService, ArchiveService,
-    ArticleFileConnectionsService, AssetFileConnectionService, ContractAccrualService,
-    ContractService, ContractTemplateService, CostCenterService, InvoiceAccrualService,
-    InvoicePaymentService, LabelService, LockedPeriodService, ModesOfPaymentService,
-    NoxFinansInvoiceService, OfferService, OrderService, PriceListService,
-    PriceService, PrintTemplateService, SalaryTransactionService, ScheduleTimeService,
-    SIEService, SupplierInvoiceAccrualService, SupplierInvoiceExternalURLConnectionService,
-    SupplierInvoiceFileConnectionService, SupplierInvoicePaymentService, SupplierInvoiceService,
-    SupplierService, TaxReductionService, TermsOfDeliveryService, TermsOfPaymentService,
-    TrustedDomainService, TrustedSenderService, UnitService, VoucherFileConnectionService,
-    VoucherSeriesService, VoucherService, WayOfDeliveryService, InboxService,
-)
 from fortnox.client import Client
+from fortnox.services.helpers import BulkResult, BulkItemResult
+
+import fortnox.services
+
+"""
+Names imported on first access, so that ``import fortnox`` neither loads every service module,
+the optional asyncio and arrow dependencies, nor the caches, sync engine, mirror and their
+sqlite3 and mmap imports.
+"""
+LAZY_MODULES = {
+    'AsyncHttpClient': 'fortnox.async_http_client',
+    'AsyncClient': 'fortnox.async_client',
+    'ArrowExporter': 'fortnox.export',
+    'ResponseCache': 'fortnox.cache',
+    'HttpCache': 'fortnox.cache',
+    'MemoryBackend': 'fortnox.cache',
+    'SQLiteBackend': 'fortnox.cache',
+    'DirectoryBackend': 'fortnox.cache',
+    'MmapBackend': 'fortnox.cache',
+    'ClientPool': 'fortnox.pool',
+    'SyncEngine': 'fortnox.sync',
+    'SyncResource': 'fortnox.sync',
+    'SyncResult': 'fortnox.sync',
+    'JSONCheckpointStore': 'fortnox.sync',
+    'MemoryCheckpointStore': 'fortnox.sync',
+    'Mirror': 'fortnox.mirror',
+    'AccountIndex': 'fortnox.account_index',
+    'RowError': 'fortnox.account_index',
+}
+
+"""
+Submodules imported on first access, e.g. ``fortnox.models``.
+"""
+LAZY_SUBMODULES = ('models',)
+
+
+def __getattr__(name):
+    if name in LAZY_SUBMODULES:
+        return importlib.import_module('{package}.{name}'.format(package=__name__, name=name))
+    module_name = LAZY_MODULES.get(name)
+    if module_name is None:
+        if name not in fortnox.services.SERVICE_MODULES:
+            raise AttributeError("module '{module}' has no attribute '{name}'".format(module=__name__, name=name))
+        module_name = 'fortnox.services'
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_MODULES) | set(LAZY_SUBMODULES) | set(fortnox.services.SERVICE_MODULES))
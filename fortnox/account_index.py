@@ -0,0 +1,238 @@
+import bisect
+import collections
+import threading
+
+from fortnox.sync import LAST_MODIFIED_FORMAT, fortnox_now
+
+"""
+Problem found while validating a row against the chart of accounts.
+
+:attribute int index: Position of the row in the input.
+:attribute int account: Account number of the row.
+:attribute str message: What is wrong with the row.
+"""
+RowError = collections.namedtuple('RowError', ['index', 'account', 'message'])
+
+
+class AccountIndex(object):
+    """
+    In-memory chart of accounts answering lookups without api calls.
+
+    Accounts are kept by financial year, in a dictionary by number for constant time lookups and in
+    a sorted list of numbers for range queries, e.g. every revenue account between 3000 and 3999.
+    The index is built once from :meth:`AccountsService.list <fortnox.services.AccountsService.list>`
+    and kept up to date with :meth:`refresh`, which only downloads the accounts modified since the
+    previous build or refresh. Deleted accounts are not reported by Fortnox, :meth:`build` again
+    from time to time to drop them.
+
+    Usage::
+
+      >>> index = fortnox.AccountIndex.build(client.accounts, financial_years=[4, 5])
+      >>> index[1930].Description
+      >>> revenue = index.between(3000, 3999)
+      >>> errors = index.validate_rows(voucher['VoucherRows'], year=5)
+    """
+
+    def __init__(self, accounts=(), year=None, clock=fortnox_now):
+        """
+        :param iterable accounts: (optional) Accounts to index, each with a ``Number`` and a ``Year``.
+        :param int year: (optional) Financial year used when a lookup names none. Default: the latest indexed one.
+        :param callable clock: (optional) Returns the current time in Fortnox's time zone.
+        """
+        self.year = year
+        self.clock = clock
+        self.financial_years = None
+        self.high_water_mark = None
+        # year -> (accounts by number, sorted numbers), never changed once published: updates swap in a new one
+        self.__years = {}
+        self.__lock = threading.Lock()
+        self.update(accounts)
+
+    @classmethod
+    def build(cls, service, financial_years=None, **options):
+        """
+        Build an index from the accounts of one or several financial years.
+
+        :param service: :class:`AccountsService <fortnox.services.AccountsService>` the accounts are listed with.
+        :param list financial_years: (optional) Ids of the financial years to index. Default: the current one.
+        :param dict **options: (optional) Other arguments of :class:`AccountIndex`.
+        :rtype: AccountIndex
+        """
+        index = cls(**options)
+        index.high_water_mark = index.clock().strftime(LAST_MODIFIED_FORMAT)
+        index.financial_years = list(financial_years) if financial_years else [None]
+        for financial_year in index.financial_years:
+            index.update(index.list(service, financial_year))
+        return index
+
+    @staticmethod
+    def list(service, financial_year=None, **params):
+        if financial_year is not None:
+            params['financialyear'] = financial_year
+        return service.list(**params)
+
+    def refresh(self, service):
+        """
+        Update the index with the accounts modified since the previous build or refresh.
+
+        :param service: :class:`AccountsService <fortnox.services.AccountsService>` the accounts are listed with.
+        :return: Number of accounts added or updated.
+        :rtype: int
+        """
+        started = self.clock().strftime(LAST_MODIFIED_FORMAT)
+        count = 0
+        for financial_year in self.financial_years or self.years or [None]:
+            params = {'lastmodified': self.high_water_mark} if self.high_water_mark else {}
+            count += self.update(self.list(service, financial_year, **params))
+        self.high_water_mark = started
+        return count
+
+    def update(self, accounts):
+        """
+        Add accounts to the index, replacing those with the same year and number.
+
+        :param iterable accounts: Accounts, each with a ``Number`` and a ``Year``.
+        :return: Number of accounts added or updated.
+        :rtype: int
+        """
+        count = 0
+        with self.__lock:
+            changed = {}
+            for account in accounts:
+                year = account.get('Year')
+                if year not in changed:
+                    changed[year] = dict(self.__years.get(year, ({}, []))[0])
+                changed[year][int(account.get('Number'))] = account
+                count += 1
+            if changed:
+                # readers keep using the previous maps, the new ones are swapped in with one assignment
+                years = dict(self.__years)
+                for year, by_number in changed.items():
+                    years[year] = (by_number, sorted(by_number))
+                self.__years = years
+        return count
+
+    @property
+    def years(self):
+        """
+        Financial years of the indexed accounts.
+        """
+        return sorted(year for year in self.__years if year is not None)
+
+    def resolve(self, year=None):
+        """
+        :return: Financial year a lookup applies to: ``year``, else :attr:`year`, else the latest indexed one.
+        """
+        if year is None:
+            year = self.year
+        if year is None:
+            years = self.years
+            year = years[-1] if years else None
+        return year
+
+    def accounts(self, year=None):
+        """
+        :param int year: (optional) Financial year. Default: :attr:`year`, or the latest indexed one.
+        :return: Accounts of a financial year by number, as they were at the call: later updates leave it unchanged.
+        :rtype: dict
+        """
+        return self.__years.get(self.resolve(year), ({}, []))[0]
+
+    @staticmethod
+    def lookup(accounts, number, default=None):
+        try:
+            return accounts.get(int(number), default)
+        except (TypeError, ValueError):
+            return default
+
+    def get(self, number, year=None, default=None):
+        """
+        :param int number: Account number.
+        :param int year: (optional) Financial year. Default: :attr:`year`, or the latest indexed one.
+        :return: Account, ``default`` if the year has no such account.
+        """
+        return self.lookup(self.accounts(year), number, default)
+
+    def __getitem__(self, number):
+        account = self.get(number)
+        if account is None:
+            raise KeyError(number)
+        return account
+
+    def __contains__(self, number):
+        return self.get(number) is not None
+
+    def __len__(self):
+        return len(self.accounts())
+
+    def between(self, low, high, year=None):
+        """
+        :param int low: First account number, included.
+        :param int high: Last account number, included.
+        :param int year: (optional) Financial year. Default: :attr:`year`, or the latest indexed one.
+        :return: Accounts numbered from ``low`` to ``high``, in number order.
+        :rtype: list
+        """
+        accounts, numbers = self.__years.get(self.resolve(year), ({}, []))
+        start = bisect.bisect_left(numbers, low)
+        stop = bisect.bisect_right(numbers, high)
+        return [accounts[number] for number in numbers[start:stop]]
+
+    def is_active(self, number, year=None):
+        account = self.get(number, year)
+        return account is not None and bool(account.get('Active'))
+
+    def validate(self, number, year=None, cost_center=None, project=None):
+        """
+        Check that a posting on an account is allowed.
+
+        :param int number: Account number.
+        :param int year: (optional) Financial year. Default: :attr:`year`, or the latest indexed one.
+        :param str cost_center: (optional) Cost center of the posting.
+        :param str project: (optional) Project of the posting.
+        :return: Messages describing what is wrong, empty when the posting is allowed.
+        :rtype: list
+        """
+        return self.check(self.get(number, year), number, cost_center, project)
+
+    @staticmethod
+    def check(account, number, cost_center=None, project=None):
+        """
+        :param account: Account posted on, ``None`` if it does not exist.
+        :return: Messages describing what is wrong with a posting on the account, empty when it is allowed.
+        :rtype: list
+        """
+        if account is None:
+            return ['Account {number} does not exist'.format(number=number)]
+        errors = []
+        if not account.get('Active'):
+            errors.append('Account {number} is inactive'.format(number=number))
+        for name, setting, value in (('cost center', 'CostCenterSettings', cost_center),
+                                     ('project', 'ProjectSettings', project)):
+            if account.get(setting) == 'MANDATORY' and not value:
+                errors.append('Account {number} requires a {name}'.format(number=number, name=name))
+            elif account.get(setting) == 'NOTALLOWED' and value:
+                errors.append('Account {number} does not allow a {name}'.format(number=number, name=name))
+        return errors
+
+    def validate_rows(self, rows, year=None):
+        """
+        Check rows, e.g. voucher rows, against the chart of accounts.
+
+        :param iterable rows: Rows with an ``Account`` and optionally a ``CostCenter`` and a ``Project``.
+        :param int year: (optional) Financial year. Default: :attr:`year`, or the latest indexed one.
+        :return: One :class:`RowError` per problem, in row order, empty when every row is valid.
+        :rtype: list
+        """
+        accounts = self.accounts(year)
+        checked = {}
+        errors = []
+        for index, row in enumerate(rows):
+            # rows mostly repeat a few accounts, each combination is only checked once
+            key = (row.get('Account'), bool(row.get('CostCenter')), bool(row.get('Project')))
+            messages = checked.get(key)
+            if messages is None:
+                messages = checked[key] = self.check(self.lookup(accounts, key[0]), *key)
+            for message in messages:
+                errors.append(RowError(index, key[0], message))
+        return errors
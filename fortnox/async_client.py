@@ -0,0 +1,393 @@
+import asyncio
+
+import fortnox.services
+from fortnox.async_http_client import AsyncHttpClient
+from fortnox.configuration import Configuration
+from fortnox.services.helpers import get_collection
+from fortnox.tracing import TracedService
+
+
+class AsyncService(object):
+    """
+    Base class of every asynchronous service.
+
+    Concrete services are generated by :func:`async_service` from their synchronous
+    counterpart, which provides the ``SERVICE`` envelope key and the supported actions.
+
+    Normally you won't instantiate this class directly.
+    """
+
+    SERVICE = None
+
+    """
+    Resource path, e.g. ``/customers``, and per action overrides of it.
+    """
+    PATH = None
+    PATHS = {}
+
+    """
+    Whether ``list`` walks through every page when no ``page`` is requested.
+    """
+    PAGINATE = False
+
+    def __init__(self, http_client):
+        """
+        :param :class:`fortnox.AsyncHttpClient` http_client: Pre configured high-level http client.
+        """
+
+        self.__http_client = http_client
+
+    @property
+    def http_client(self):
+        return self.__http_client
+
+    def path_for(self, action, *ids):
+        """
+        Build the sub URL of an action, appending the resource identifiers as path segments.
+
+        :param str action: Action name, e.g. ``retrieve``.
+        :param tuple ids: Identifiers of the resource, e.g. ``(voucher_series, voucher_number)``.
+        :rtype: str
+        """
+        path = self.PATHS.get(action, self.PATH).rstrip('/')
+        return '/'.join([path] + [str(id) for id in ids])
+
+    def attributes_from(self, args, kwargs):
+        """
+        Build the request attributes the same way synchronous services do.
+        """
+        if not args and not kwargs:
+            raise Exception('attributes for {service} are missing'.format(service=self.SERVICE))
+
+        initial_attributes = args[0] if args else kwargs
+        attributes = dict((k, v) for k, v in initial_attributes.items())
+        attributes.update({'service': self.SERVICE})
+        return attributes
+
+
+class ListAction(object):
+
+    async def list(self, **params):
+        """
+        Retrieve all resources, according to the parameters provided
+
+        :calls: ``get /{resource}``
+        :param dict params: (optional) Search options.
+        :return: List of dictionaries that support attriubte-style access.
+        :rtype: list
+        """
+        if self.PAGINATE and 'page' not in params:
+            return await self.list_all(**params)
+        _, _, items = await self.http_client.get(self.path_for('list'), params=params)
+        return items
+
+    async def list_all(self, **params):
+        """
+        Retrieve the resources of every page
+
+        The first page tells how many pages there are, the remaining ones are fetched concurrently
+        and joined in page order.
+
+        :param dict params: (optional) Search options.
+        :return: List of dictionaries that support attriubte-style access.
+        :rtype: list
+        """
+        url = self.path_for('list')
+        _, _, raw_response = await self.http_client.get(url, params=params, raw=True)
+        meta_data = raw_response.get('MetaInformation') or {}
+        total_pages = meta_data.get('@TotalPages', 0)
+
+        items = list(get_collection(raw_response))
+        pages = await asyncio.gather(*[self.http_client.get(url, params=dict(params, page=page))
+                                       for page in range(2, total_pages + 1)])
+        for _, _, page_items in pages:
+            items.extend(page_items)
+        return items
+
+    async def iter_all(self, **params):
+        """
+        Iterate over the resources of every page
+
+        Pages are fetched lazily, one at a time, while the iterator is consumed.
+
+        :param dict params: (optional) Search options.
+        :return: Asynchronous generator of dictionaries that support attriubte-style access.
+        :rtype: async generator
+        """
+        url = self.path_for('list')
+        page = 1
+        while True:
+            _, _, raw_response = await self.http_client.get(url, params=dict(params, page=page), raw=True)
+            meta_data = raw_response.get('MetaInformation') or {}
+            items = get_collection(raw_response)
+            for item in items if isinstance(items, list) else [items]:
+                yield item
+            if page >= meta_data.get('@TotalPages', page):
+                return
+            page += 1
+
+
+class RetrieveAction(object):
+
+    async def retrieve(self, *ids, **params):
+        """
+        Retrieve a single resource
+
+        :calls: ``get /{resource}/{id}``
+        :param tuple ids: Unique identifier(s) of the resource, in path order.
+        :param dict params: (optional) Search options.
+        :return: Dictionary that support attriubte-style access.
+        :rtype: dict
+        """
+        _, _, item = await self.http_client.get(self.path_for('retrieve', *ids), params=params or None)
+        return item
+
+
+class CreateAction(object):
+
+    async def create(self, *args, **kwargs):
+        """
+        Create a resource
+
+        :calls: ``post /{resource}``
+        :param tuple *args: (optional) Single object representing the resource.
+        :param dict **kwargs: (optional) Resource attributes.
+        :return: Dictionary that support attriubte-style access and represents newely created resource.
+        :rtype: dict
+        """
+        attributes = self.attributes_from(args, kwargs)
+        _, _, item = await self.http_client.post(self.path_for('create'), body=attributes)
+        return item
+
+
+class UpdateAction(object):
+
+    async def update(self, *args, **kwargs):
+        """
+        Update a resource
+
+        Positional arguments are the identifier(s) of the resource, optionally followed by
+        a single object holding the attributes to update.
+
+        :calls: ``put /{resource}/{id}``
+        :param tuple *args: Unique identifier(s) and an optional attributes object.
+        :param dict **kwargs: (optional) Attributes to update.
+        :return: Dictionary that support attriubte-style access and represents updated resource.
+        :rtype: dict
+        """
+        ids = args
+        attributes = ()
+        if args and isinstance(args[-1], dict):
+            ids, attributes = args[:-1], args[-1:]
+        attributes = self.attributes_from(attributes, kwargs)
+        _, _, item = await self.http_client.put(self.path_for('update', *ids), body=attributes)
+        return item
+
+
+class DestroyAction(object):
+
+    async def destroy(self, *ids):
+        """
+        Delete a resource
+
+        :calls: ``delete /{resource}/{id}``
+        :param tuple ids: Unique identifier(s) of the resource, in path order.
+        :return: True if the operation succeeded.
+        :rtype: bool
+        """
+        status_code, _, _ = await self.http_client.delete(self.path_for('destroy', *ids))
+        return status_code == 204
+
+
+class InfoAction(object):
+
+    async def info(self, **params):
+        """
+        Retrieve a singleton resource, such as company settings
+
+        :calls: ``get /{resource}``
+        :param dict params: (optional) Search options.
+        :return: Dictionary that support attriubte-style access.
+        :rtype: dict
+        """
+        _, _, item = await self.http_client.get(self.path_for('info'), params=params)
+        return item
+
+
+"""
+Actions an asynchronous service may support, keyed by the name of the synchronous method.
+"""
+ACTIONS = (
+    ('list', ListAction),
+    ('retrieve', RetrieveAction),
+    ('create', CreateAction),
+    ('update', UpdateAction),
+    ('destroy', DestroyAction),
+    ('info', InfoAction),
+)
+
+
+def async_service(service_class, path, paths=None, exclude=(), paginate=False):
+    """
+    Generate the asynchronous counterpart of a synchronous service class.
+
+    The generated class supports the actions the synchronous service implements.
+
+    :param type service_class: Synchronous service class, e.g. :class:`fortnox.CustomerService`.
+    :param str path: Resource path, e.g. ``/customers``.
+    :param dict paths: (optional) Per action path overrides.
+    :param tuple exclude: (optional) Actions not to generate.
+    :param bool paginate: (optional) Whether ``list`` walks through every page by default.
+    :rtype: type
+    """
+    actions = tuple(action for name, action in ACTIONS
+                    if hasattr(service_class, name) and name not in exclude)
+    return type('Async' + service_class.__name__, actions + (AsyncService,), {
+        '__doc__': 'Asynchronous counterpart of :class:`fortnox.{name}`.'.format(name=service_class.__name__),
+        'SERVICE': service_class.SERVICE,
+        'PATH': path,
+        'PATHS': paths or {},
+        'PAGINATE': paginate,
+    })
+
+
+class AsyncClient(object):
+    """
+    The :class:`AsyncClient <AsyncClient>` is the asyncio entry point to the services.
+
+    Services are exposed under the same names as on :class:`Client <fortnox.Client>` and
+    offer ``async`` versions of their ``list``, ``retrieve``, ``create``, ``update``, ``destroy``
+    and ``info`` actions. Every service shares one connection pool and one limit on requests in flight.
+
+    Usage::
+
+      >>> async with fortnox.AsyncClient(access_token=token, client_secret=secret) as client:
+      ...     customers, invoices = await asyncio.gather(client.customers.list(), client.invoices.list())
+    """
+
+    """
+    Services exposed by the client: attribute name, synchronous service class name, resource path
+    and options passed to :func:`async_service`.
+    """
+    SERVICES = (
+        ('absence_transactions', 'AbsenceTransactionsService', '/absencetransactions', {}),
+        ('account_charts', 'AccountChartsService', '/accountcharts', {}),
+        ('accounts', 'AccountsService', '/accounts', {'paginate': True}),
+        ('archives', 'ArchiveService', '/archive', {}),
+        ('article_file_connections', 'ArticleFileConnectionsService', '/articlefileconnections', {}),
+        ('articles', 'ArticleService', '/articles', {}),
+        ('asset_file_connections', 'AssetFileConnectionService', '/assetfileconnections', {}),
+        ('asset_types', 'AssetTypeService', '/assets/types', {}),
+        ('assets', 'AssetService', '/assets', {}),
+        ('attendance_transactions', 'AttendanceTransactionsService', '/attendancetransactions', {}),
+        ('company_information', 'CompanyInformationService', '/companyinformation', {}),
+        ('company_settings', 'CompanySettingsService', '/settings/company', {}),
+        ('contract_accruals', 'ContractAccrualService', '/contractaccruals', {}),
+        ('contract_templates', 'ContractTemplateService', '/contracttemplates', {}),
+        ('contracts', 'ContractService', '/contracts', {}),
+        ('cost_centers', 'CostCenterService', '/costcenters', {}),
+        ('currencies', 'CurrencyService', '/currencies', {}),
+        ('customers', 'CustomerService', '/customers', {}),
+        ('email_trusted_domains', 'TrustedDomainService', '/emailtrusteddomains', {}),
+        ('employees', 'EmployeeService', '/employees', {}),
+        ('expenses', 'ExpenseService', '/expenses', {}),
+        ('financial_years', 'FinancialYearService', '/financialyears', {}),
+        ('inbox', 'InboxService', '/inbox', {'exclude': ('create',)}),
+        ('invoice_accruals', 'InvoiceAccrualService', '/invoiceaccruals', {}),
+        ('invoice_payments', 'InvoicePaymentService', '/invoicepayments', {}),
+        ('invoices', 'InvoiceService', '/invoices', {}),
+        ('labels', 'LabelService', '/labels', {}),
+        ('locked_periods', 'LockedPeriodService', '/settings/lockedperiod', {}),
+        ('modes_of_payments', 'ModesOfPaymentService', '/modesofpayments', {}),
+        ('nox_finans_invoices', 'NoxFinansInvoiceService', '/noxfinansinvoices', {}),
+        ('offers', 'OfferService', '/offers', {}),
+        ('orders', 'OrderService', '/orders', {}),
+        ('predefined_accounts', 'PredefinedAccountService', '/predefinedaccounts', {}),
+        ('predefined_voucher_series', 'PredefinedVoucherSeriesService', '/predefinedvoucherseries', {}),
+        ('price_lists', 'PriceListService', '/pricelists', {}),
+        ('prices', 'PriceService', '/prices', {}),
+        ('print_templates', 'PrintTemplateService', '/printtemplates', {}),
+        ('projects', 'ProjectService', '/projects', {}),
+        ('salary_transactions', 'SalaryTransactionService', '/salarytransactions', {}),
+        ('schedule_times', 'ScheduleTimeService', '/scheduletimes', {}),
+        ('sie', 'SIEService', '/sie', {}),
+        ('supplier_invoice_accruals', 'SupplierInvoiceAccrualService', '/supplierinvoiceaccruals', {}),
+        ('supplier_invoice_external_url_connections', 'SupplierInvoiceExternalURLConnectionService',
+         '/supplierinvoiceexternalurlconnections', {}),
+        ('supplier_invoice_file_connections', 'SupplierInvoiceFileConnectionService',
+         '/supplierinvoicefileconnections', {}),
+        ('supplier_invoice_payments', 'SupplierInvoicePaymentService', '/supplierinvoicepayments', {}),
+        ('supplier_invoices', 'SupplierInvoiceService', '/supplierinvoices', {}),
+        ('suppliers', 'SupplierService', '/suppliers', {}),
+        ('tax_reductions', 'TaxReductionService', '/taxreductions', {}),
+        ('terms_of_deliveries', 'TermsOfDeliveryService', '/termsofdeliveries', {}),
+        ('terms_of_payments', 'TermsOfPaymentService', '/termsofpayments', {}),
+        ('trusted_email_senders', 'TrustedSenderService', '/emailsenders/trusted', {'paths': {'list': '/emailsenders'}}),
+        ('units', 'UnitService', '/units', {}),
+        ('voucher_file_connections', 'VoucherFileConnectionService', '/voucherfileconnections', {}),
+        ('voucher_series', 'VoucherSeriesService', '/voucherseries', {}),
+        ('vouchers', 'VoucherService', '/vouchers', {'paths': {'retrieve': '/vouchers/sublist'}}),
+        ('way_of_deliveries', 'WayOfDeliveryService', '/wayofdeliveries', {}),
+    )
+
+    """
+    Generated service classes, shared by every client instance.
+    """
+    service_classes = {}
+
+    def __init__(self, **options):
+        """
+        Usage::
+
+          >>> import fortnox
+          >>> client = fortnox.AsyncClient(access_token=os.environ.get('ACCESS_TOKEN'), client_secret=os.environ.get('CLIENT_SECRET'))
+          <fortnox.AsyncClient>
+
+        Accepts the same options as :class:`Client <fortnox.Client>`, plus:
+
+        :param int max_in_flight: (optional) Maximum number of concurrent requests. Default: **10**.
+
+        :raises ConfigurationError: if the configuration is invalid or :module:`httpx` is not installed.
+        """
+
+        self.config = Configuration(**options)
+        self.config.validate()
+
+        self.http_client = AsyncHttpClient(self.config)
+
+        self.__registry = dict((name, (service_name, path, service_options))
+                               for name, service_name, path, service_options in self.SERVICES)
+        self.__services = {}
+
+    def __getattr__(self, name):
+        registry = self.__dict__.get('_AsyncClient__registry', {})
+        if name not in registry:
+            raise AttributeError("'AsyncClient' object has no attribute '{name}'".format(name=name))
+
+        service = self.__services.get(name)
+        if service is None:
+            service_class = self.service_classes.get(name)
+            if service_class is None:
+                service_name, path, service_options = registry[name]
+                service_class = async_service(getattr(fortnox.services, service_name), path, **service_options)
+                self.service_classes[name] = service_class
+            service = service_class(self.http_client)
+            if self.config.tracer is not None:
+                service = TracedService(service, self.config.tracer)
+            self.__services[name] = service
+        return service
+
+    def __dir__(self):
+        return sorted(set(super(AsyncClient, self).__dir__()) | set(self.__registry))
+
+    async def close(self):
+        """
+        Close the connection pool shared by all services.
+        """
+        await self.http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
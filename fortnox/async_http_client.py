@@ -0,0 +1,265 @@
+import asyncio
+import time
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from requests.structures import CaseInsensitiveDict
+from requests_toolbelt import MultipartEncoder
+
+from fortnox.errors import ConfigurationError, RateLimitError, ServerError
+from fortnox.hooks import ErrorEvent, RequestEvent, ResponseEvent, endpoint_template
+from fortnox.http_client import BaseHttpClient
+from fortnox.retry import parse_retry_after
+from fortnox.uploads import UploadBody
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """
+    Asyncio counterpart of :class:`HttpClient <fortnox.HttpClient>` built on :module:`httpx`.
+
+    It shares the envelope, encoding and decoding schema with :class:`HttpClient <fortnox.HttpClient>`,
+    keeps one pooled :class:`httpx.AsyncClient` and never has more than ``max_in_flight``
+    requests on the wire at once.
+    """
+
+    """
+    Size of the chunks streamed from multipart file uploads.
+    """
+    UPLOAD_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, config):
+        """
+        :param :class:`fortnox.Configuration` config: Base CRM client configuration.
+        :raises ConfigurationError: if :module:`httpx` is not installed.
+        """
+        if httpx is None:
+            raise ConfigurationError('AsyncHttpClient requires httpx. '
+                                     'Install it using: "pip install pyfortnox[async]"')
+
+        super(AsyncHttpClient, self).__init__(config)
+
+        self.__session = None
+        self.__semaphore = None
+
+    @property
+    def session(self):
+        """
+        Pooled :class:`httpx.AsyncClient` shared by every asynchronous service.
+        """
+        if self.__session is None:
+            self.__session = self.build_session()
+        return self.__session
+
+    @property
+    def semaphore(self):
+        """
+        Semaphore bounding the number of requests in flight.
+        """
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.config.max_in_flight)
+        return self.__semaphore
+
+    def build_session(self):
+        """
+        Build an :class:`httpx.AsyncClient` with connection limits taken from the configuration.
+
+        :rtype: httpx.AsyncClient
+        """
+        limits = httpx.Limits(max_connections=self.config.pool_maxsize,
+                              max_keepalive_connections=self.config.pool_maxsize if self.config.keep_alive else 0,
+                              keepalive_expiry=self.config.pool_idle_timeout)
+        return httpx.AsyncClient(limits=limits, timeout=float(self.config.timeout))
+
+    async def get(self, url, params=None, **kwargs):
+        """
+        Send a GET request, see :meth:`request`.
+        """
+
+        return await self.request('get', url, params=params, **kwargs)
+
+    async def post(self, url, body=None, **kwargs):
+        """
+        Send a POST request, see :meth:`request`.
+        """
+
+        return await self.request('post', url, body=body, **kwargs)
+
+    async def put(self, url, body=None, **kwargs):
+        """
+        Send a PUT request, see :meth:`request`.
+        """
+
+        return await self.request('put', url, body=body, **kwargs)
+
+    async def delete(self, url, params=None, **kwargs):
+        """
+        Send a DELETE request, see :meth:`request`.
+        """
+
+        return await self.request('delete', url, params=params, **kwargs)
+
+    async def request(self, method, url, params=None, body=None, **kwargs):
+        """
+        Send an HTTP request.
+
+        Behaves like :meth:`HttpClient.request <fortnox.HttpClient.request>`.
+
+        :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
+        :param dict params: (optional) Dictionary of query parameters.
+        :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
+        :raises RequestError: if authentication failed, invalid query parameter etc.
+        :raises RateLimitError: if rate limit exceeded and the retry policy gave up.
+        :raises ResourceError: if requests payload included invalid attributes or were missing.
+        :raises ServerError: if Fortnox backend servers encounterered an unexpected condition
+            and the retry policy gave up.
+        :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
+        :rtype: tuple
+
+        :Keyword Arguments:
+            * :param dict headers: (optional) Dictionary of headers. Default: ``{}``.
+            * :param bool raw: (optional) Whether to wrap and uwrap the envelope. Default: ``False``.
+        """
+
+        if self.tracer is None:
+            return await self.send_request(method, url, params, body, **kwargs)
+
+        name, attributes = self.http_span(method, url, params)
+        with self.tracer.start_as_current_span(name, attributes=attributes) as span:
+            try:
+                response = await self.send_request(method, url, params, body, **kwargs)
+            except Exception as e:
+                self.end_http_span(span, error=e)
+                raise
+            self.end_http_span(span, response)
+            return response
+
+    async def send_request(self, method, url, params=None, body=None, **kwargs):
+        """
+        Send an HTTP request, retries included, see :meth:`request`.
+        """
+
+        started = time.perf_counter()
+        path = url
+        url = self.build_url(url)
+        headers = self.build_headers(params, kwargs.get('headers'))
+        raw = bool(kwargs['raw']) if 'raw' in kwargs else False
+        endpoint = endpoint_template(path) if self.hooks else None
+
+        cached = self.cached_response(method, path, params, raw)
+        if cached is not None:
+            if self.hooks:
+                elapsed = time.perf_counter() - started
+                self.hooks.emit('after_response', ResponseEvent(method, url, endpoint, cached[0], 0, elapsed,
+                                                                0.0, elapsed, 0.0, 0, 0, True))
+            return cached
+
+        validated = self.validated_response(method, path, params)
+        if validated is not None:
+            headers.update(self.http_cache.conditional_headers(validated))
+
+        body = self.encode_body(body, headers)
+        bytes_sent = self.body_size(body) if self.hooks else 0
+
+        retryable = self.is_retryable_body(body)
+        streamed = isinstance(body, (MultipartEncoder, UploadBody))
+        if streamed:
+            headers['Content-Length'] = str(body.len)
+        if params:
+            params = dict((k, v) for k, v in params.items() if v is not None)
+
+        network_time = rate_limit_wait = 0.0
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                if self.rate_limiter is not None:
+                    rate_limit_wait += await self.rate_limiter.acquire_async(self.rate_limit_key)
+                if self.hooks:
+                    self.hooks.emit('before_request', RequestEvent(method, url, endpoint, attempt, headers))
+                if attempt > 1 and isinstance(body, UploadBody):
+                    body.rewind()
+
+                try:
+                    async with self.semaphore:
+                        sent_at = time.perf_counter()
+                        try:
+                            resp = await self.session.request(method, url, params=params, headers=headers,
+                                                              content=self.iter_multipart(body) if streamed else body)
+                        finally:
+                            network_time += time.perf_counter() - sent_at
+                except httpx.TransportError as e:
+                    sent = not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                    delay = self.retry_delay(method, url, attempt, error=e, sent=sent) if retryable else None
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+                    continue
+
+                if not (200 <= resp.status_code < 300) and resp.status_code != 304:
+                    try:
+                        self.handle_error_response(resp)
+                    except (RateLimitError, ServerError) as e:
+                        delay = None
+                        if retryable:
+                            delay = self.retry_delay(method, url, attempt, status=resp.status_code, error=e,
+                                                     retry_after=parse_retry_after(resp.headers.get('Retry-After')))
+                        if delay is None:
+                            raise
+                        await asyncio.sleep(delay)
+                        continue
+                break
+        except Exception as e:
+            if self.hooks:
+                self.hooks.emit('on_error', ErrorEvent(method, url, endpoint, getattr(e, 'http_status', None),
+                                                       attempt, time.perf_counter() - started, e))
+            raise
+
+        status, resp_headers, content = resp.status_code, resp.headers, resp.content
+        revalidated = status == 304 and validated is not None
+        if revalidated:
+            status, resp_headers, content = validated.status, CaseInsensitiveDict(validated.headers), validated.content
+        if status != 304:
+            self.cache_response(method, path, params, status, resp_headers, content, revalidated)
+
+        decode_started = time.perf_counter()
+        if status == 304:
+            # not modified since the validators sent by the caller itself, e.g. its own If-None-Match
+            resp_body = None
+        elif self.http_cache is not None and method.lower() == 'get' and self.http_cache.is_cached(path):
+            resp_body = self.decode_cached(path, params, resp_headers, content, raw)
+        else:
+            resp_body = self.decode_response(resp_headers, content, raw)
+        if self.hooks:
+            finished = time.perf_counter()
+            self.hooks.emit('after_response', ResponseEvent(method, url, endpoint, resp.status_code, attempt,
+                                                            finished - started, network_time,
+                                                            finished - decode_started, rate_limit_wait,
+                                                            bytes_sent, len(resp.content), revalidated))
+        return (status, resp_headers, resp_body)
+
+    async def iter_multipart(self, encoder):
+        """
+        Stream a multipart upload in chunks instead of reading it in memory at once.
+        """
+        while True:
+            chunk = encoder.read(self.UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+    async def close(self):
+        """
+        Close the pooled connections.
+        """
+        session, self.__session = self.__session, None
+        if session is not None:
+            await session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
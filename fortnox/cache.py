@@ -0,0 +1,821 @@
+import collections
+import hashlib
+import json
+import mmap
+import os
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+from urllib.parse import urlencode
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from fortnox.errors import ConfigurationError
+
+"""
+Cached response.
+
+:attribute int status: Http status of the response.
+:attribute dict headers: Response headers.
+:attribute bytes content: Undecoded response body, decoded again on every hit so callers never share objects.
+"""
+CacheEntry = collections.namedtuple('CacheEntry', ['status', 'headers', 'content'])
+
+
+def entry_size(entry):
+    """
+    :return: Approximate number of bytes held by an entry, its body and headers.
+    :rtype: int
+    """
+    return len(entry.content) + sum(len(name) + len(str(value)) for name, value in entry.headers.items())
+
+
+class MemoryBackend(object):
+    """
+    Thread safe in-process cache store, evicting the least recently used entries beyond ``maxsize``
+    entries or ``max_bytes`` bytes.
+    """
+
+    def __init__(self, maxsize=1024, clock=time.monotonic, max_bytes=None):
+        """
+        :param int maxsize: (optional) Maximum number of entries kept. Default: **1024**.
+        :param callable clock: (optional) Clock returning seconds.
+        :param int max_bytes: (optional) Maximum size of the entries kept, ``None`` for no limit.
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.size = 0
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        """
+        :param str key: Cache key.
+        :return: Stored entry, ``None`` if it is missing or expired.
+        :rtype: CacheEntry
+        """
+        with self.__lock:
+            item = self.__entries.get(key)
+            if item is None:
+                return None
+            expires, entry, size = item
+            if expires is not None and expires <= self.clock():
+                self.discard(key)
+                return None
+            self.__entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry, ttl=None):
+        """
+        :param str key: Cache key.
+        :param CacheEntry entry: Entry to store, skipped if it alone exceeds ``max_bytes``.
+        :param float ttl: (optional) Seconds the entry stays valid, ``None`` keeps it until evicted.
+        """
+        expires = self.clock() + ttl if ttl is not None else None
+        size = entry_size(entry)
+        with self.__lock:
+            self.discard(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self.__entries[key] = (expires, entry, size)
+            self.size += size
+            while len(self.__entries) > self.maxsize or (self.max_bytes is not None and self.size > self.max_bytes):
+                self.discard(next(iter(self.__entries)))
+
+    def discard(self, key):
+        """
+        Remove an entry, must be called with the lock held.
+        """
+        item = self.__entries.pop(key, None)
+        if item is not None:
+            self.size -= item[2]
+
+    def delete_prefix(self, prefix):
+        """
+        Remove every entry whose key starts with ``prefix``.
+
+        :param str prefix: Key prefix.
+        """
+        with self.__lock:
+            for key in [key for key in self.__entries if key.startswith(prefix)]:
+                self.discard(key)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+class SQLiteBackend(object):
+    """
+    Cache store in a SQLite database, shared by every process that opens the same file.
+
+    Entries beyond ``maxsize`` are evicted least recently used first.
+    """
+
+    def __init__(self, path, maxsize=10000, clock=time.time, timeout=30):
+        """
+        :param str path: Database file, created if missing.
+        :param int maxsize: (optional) Maximum number of entries kept. Default: **10000**.
+        :param callable clock: (optional) Wall clock returning seconds, shared between processes.
+        :param float timeout: (optional) Seconds to wait for a lock held by another process. Default: **30**.
+        """
+        self.path = path
+        self.maxsize = maxsize
+        self.clock = clock
+        self.timeout = timeout
+        self.__local = threading.local()
+        with self.connection as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS fortnox_cache ('
+                               'key TEXT PRIMARY KEY, status INTEGER, headers TEXT, content BLOB, '
+                               'expires REAL, accessed REAL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS fortnox_cache_accessed ON fortnox_cache (accessed)')
+
+    @property
+    def connection(self):
+        """
+        Connection of the calling thread, sqlite connections cannot be shared between threads.
+        """
+        connection = getattr(self.__local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute('PRAGMA journal_mode=WAL')
+            self.__local.connection = connection
+        return connection
+
+    def get(self, key):
+        now = self.clock()
+        with self.connection as connection:
+            row = connection.execute('SELECT status, headers, content, expires FROM fortnox_cache WHERE key = ?',
+                                     (key,)).fetchone()
+            if row is None:
+                return None
+            status, headers, content, expires = row
+            if expires is not None and expires <= now:
+                connection.execute('DELETE FROM fortnox_cache WHERE key = ?', (key,))
+                return None
+            connection.execute('UPDATE fortnox_cache SET accessed = ? WHERE key = ?', (now, key))
+        return CacheEntry(status, json.loads(headers), bytes(content))
+
+    def set(self, key, entry, ttl=None):
+        now = self.clock()
+        expires = now + ttl if ttl is not None else None
+        with self.connection as connection:
+            connection.execute('INSERT OR REPLACE INTO fortnox_cache VALUES (?, ?, ?, ?, ?, ?)',
+                               (key, entry.status, json.dumps(dict(entry.headers)), sqlite3.Binary(entry.content),
+                                expires, now))
+            connection.execute('DELETE FROM fortnox_cache WHERE key IN ('
+                               'SELECT key FROM fortnox_cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+                               (self.maxsize,))
+
+    def delete_prefix(self, prefix):
+        with self.connection as connection:
+            connection.execute('DELETE FROM fortnox_cache WHERE substr(key, 1, ?) = ?', (len(prefix), prefix))
+
+    def clear(self):
+        with self.connection as connection:
+            connection.execute('DELETE FROM fortnox_cache')
+
+    def close(self):
+        connection = getattr(self.__local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self.__local.connection = None
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM fortnox_cache').fetchone()[0]
+
+
+class DirectoryBackend(object):
+    """
+    Cache store keeping every entry in a file of a directory, so that bodies are not held in
+    memory and survive a restart.
+
+    Keys, sizes and expiry times are indexed in memory, the index is rebuilt from the files when the
+    store is opened. Entries beyond ``max_bytes`` are evicted least recently used first. A directory
+    belongs to one process at a time, share a :class:`SQLiteBackend` between processes instead.
+    """
+
+    SUFFIX = '.entry'
+
+    def __init__(self, path, max_bytes=256 * 1024 * 1024, clock=time.time):
+        """
+        :param str path: Directory of the entries, created if missing.
+        :param int max_bytes: (optional) Maximum size of the files kept, ``None`` for no limit. Default: **256** MiB.
+        :param callable clock: (optional) Wall clock returning seconds, expiry times outlive the process.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.size = 0
+        self.__index = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self.load()
+
+    def file(self, key):
+        return os.path.join(self.path, hashlib.sha256(key.encode('utf-8')).hexdigest() + self.SUFFIX)
+
+    def load(self):
+        """
+        Index the entries found in the directory, least recently written first, and remove leftovers of interrupted writes.
+        """
+        found = []
+        for name in os.listdir(self.path):
+            path = os.path.join(self.path, name)
+            if name.endswith('.tmp'):
+                self.remove(path)
+                continue
+            if not name.endswith(self.SUFFIX):
+                continue
+            try:
+                with open(path, 'rb') as handle:
+                    header = json.loads(handle.readline().decode('utf-8'))
+                stat = os.stat(path)
+            except (OSError, ValueError):
+                self.remove(path)
+                continue
+            found.append((stat.st_mtime, header['key'], path, stat.st_size, header.get('expires')))
+
+        with self.__lock:
+            for _, key, path, size, expires in sorted(found):
+                self.__index[key] = (path, size, expires)
+                self.size += size
+
+    @staticmethod
+    def remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def get(self, key):
+        """
+        :param str key: Cache key.
+        :return: Stored entry, ``None`` if it is missing or expired.
+        :rtype: CacheEntry
+        """
+        with self.__lock:
+            item = self.__index.get(key)
+            if item is None:
+                return None
+            path, _, expires = item
+            if expires is not None and expires <= self.clock():
+                # files are only replaced and removed with the lock held, a concurrent set is not lost
+                self.remove(self.discard(key))
+                return None
+            self.__index.move_to_end(key)
+
+        try:
+            with open(path, 'rb') as handle:
+                header = json.loads(handle.readline().decode('utf-8'))
+                content = handle.read()
+        except (OSError, ValueError):
+            with self.__lock:
+                if self.__index.get(key) is item:
+                    self.discard(key)
+            return None
+        return CacheEntry(header['status'], header['headers'], content)
+
+    def set(self, key, entry, ttl=None):
+        """
+        :param str key: Cache key.
+        :param CacheEntry entry: Entry to store, skipped if it alone exceeds ``max_bytes``.
+        :param float ttl: (optional) Seconds the entry stays valid, ``None`` keeps it until evicted.
+        """
+        expires = self.clock() + ttl if ttl is not None else None
+        header = json.dumps({'key': key, 'status': entry.status, 'headers': dict(entry.headers),
+                             'expires': expires}).encode('utf-8') + b'\n'
+        size = len(header) + len(entry.content)
+        path = self.file(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.delete(key)
+            return
+
+        # written aside and moved in place, readers never see a partial entry
+        descriptor, temporary = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as handle:
+                handle.write(header)
+                handle.write(entry.content)
+            with self.__lock:
+                os.replace(temporary, path)
+                self.discard(key)
+                self.__index[key] = (path, size, expires)
+                self.size += size
+                while self.max_bytes is not None and self.size > self.max_bytes:
+                    self.remove(self.discard(next(iter(self.__index))))
+        except BaseException:
+            self.remove(temporary)
+            raise
+
+    def discard(self, key):
+        """
+        Remove an entry from the index, must be called with the lock held.
+
+        :return: File of the entry, ``None`` if it was not indexed.
+        :rtype: str
+        """
+        item = self.__index.pop(key, None)
+        if item is None:
+            return None
+        self.size -= item[1]
+        return item[0]
+
+    def delete(self, key):
+        with self.__lock:
+            path = self.discard(key)
+            if path is not None:
+                self.remove(path)
+
+    def delete_prefix(self, prefix):
+        """
+        Remove every entry whose key starts with ``prefix``.
+
+        :param str prefix: Key prefix.
+        """
+        with self.__lock:
+            for key in [key for key in self.__index if key.startswith(prefix)]:
+                self.remove(self.discard(key))
+
+    def clear(self):
+        with self.__lock:
+            for path, _, _ in self.__index.values():
+                self.remove(path)
+            self.__index.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self.__index)
+
+
+"""
+Location of a stored body in the file of a :class:`MmapBackend <MmapBackend>`.
+
+:attribute int offset: Position of the body in the file.
+:attribute int length: Length of the body.
+:attribute int size: Length of the whole record, header included.
+:attribute int status: Http status of the response.
+:attribute dict headers: Response headers.
+:attribute float expires: Expiry time, ``None`` if the entry does not expire.
+"""
+Slot = collections.namedtuple('Slot', ['offset', 'length', 'size', 'status', 'headers', 'expires'])
+
+
+class MmapBackend(object):
+    """
+    Cache store appending every entry to a single file read through a memory map.
+
+    Bodies are returned as :class:`memoryview` slices of the map, never copied. Removed, replaced
+    and evicted entries are recorded by appending a tombstone, the index of the live entries is
+    rebuilt by replaying the file when the store is opened, so a restarted process finds what the
+    previous one stored. Entries beyond ``max_bytes`` are evicted least recently used first and the
+    file is rewritten with the live entries only once it is ``compact_ratio`` times larger than them.
+    A file belongs to one backend at a time: an exclusive lock is held on ``path + '.lock'`` until
+    :meth:`close`, on platforms with :mod:`fcntl`. Share a :class:`SQLiteBackend` between processes instead.
+
+    Usage::
+
+      >>> cache = fortnox.ResponseCache(fortnox.MmapBackend('/var/cache/fortnox.cache'),
+      ...                               policies=dict(fortnox.ResponseCache.REFERENCE_DATA, **{'/articles': 86400}))
+    """
+
+    """
+    Lengths of the json header and of the body preceding every record.
+    """
+    RECORD = struct.Struct('>II')
+
+    def __init__(self, path, max_bytes=256 * 1024 * 1024, compact_ratio=2, clock=time.time):
+        """
+        :param str path: File of the entries, created if missing.
+        :param int max_bytes: (optional) Maximum size of the live entries, ``None`` for no limit. Default: **256** MiB.
+        :param float compact_ratio: (optional) Ratio of the file size to the live entries size beyond which
+            the file is rewritten. Default: **2**.
+        :param callable clock: (optional) Wall clock returning seconds, expiry times outlive the process.
+        :raises ConfigurationError: if another backend, in this process or another one, holds the file.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compact_ratio = compact_ratio
+        self.clock = clock
+        self.size = 0
+        self.__index = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__map = None
+        self.__owner = self.acquire(path)
+        self.__file = open(path, 'a+b')
+        self.__length = self.__file.seek(0, os.SEEK_END)
+        self.load()
+
+    @staticmethod
+    def acquire(path):
+        """
+        Take the exclusive lock of a file of entries. The lock is held on a file of its own,
+        ``path + '.lock'``, since compaction replaces the file of the entries.
+
+        :return: Open lock file, the lock is released when it is closed.
+        """
+        handle = open(path + '.lock', 'a+b')
+        if fcntl is None:
+            return handle
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            raise ConfigurationError('Cache file {path} is used by another MmapBackend. '
+                                     'Use a SQLiteBackend to share a cache between processes.'.format(path=path))
+        return handle
+
+    def load(self):
+        """
+        Replay the file into the index, cutting off a record left incomplete by an interrupted write.
+        """
+        view = self.view()
+        offset = 0
+        while offset + self.RECORD.size <= self.__length:
+            header_length, length = self.RECORD.unpack_from(view, offset)
+            start = offset + self.RECORD.size + header_length
+            if start + length > self.__length:
+                break
+            try:
+                header = json.loads(bytes(view[offset + self.RECORD.size:start]).decode('utf-8'))
+            except ValueError:
+                break
+            self.replay(header, Slot(start, length, start + length - offset, header.get('status'),
+                                     header.get('headers'), header.get('expires')))
+            offset = start + length
+        if offset < self.__length:
+            del view
+            self.__map = None
+            self.__file.truncate(offset)
+            self.__length = offset
+
+    def replay(self, header, slot):
+        if 'delete' in header:
+            self.discard(header['delete'])
+        elif 'delete_prefix' in header:
+            for key in [key for key in self.__index if key.startswith(header['delete_prefix'])]:
+                self.discard(key)
+        else:
+            self.discard(header['key'])
+            self.__index[header['key']] = slot
+            self.size += slot.size
+
+    def view(self):
+        """
+        :return: Memory view of the whole file, remapped when records were appended since the last one.
+        :rtype: memoryview
+        """
+        if self.__length == 0:
+            return memoryview(b'')
+        if self.__map is None or len(self.__map) < self.__length:
+            # the previous map stays alive as long as bodies returned from it are referenced
+            self.__map = mmap.mmap(self.__file.fileno(), self.__length, access=mmap.ACCESS_READ)
+        return memoryview(self.__map)
+
+    def append(self, header, content=b''):
+        """
+        Append a record, must be called with the lock held.
+
+        :return: Slot of the record.
+        :rtype: Slot
+        """
+        encoded = json.dumps(header).encode('utf-8')
+        offset = self.__length
+        self.__file.write(self.RECORD.pack(len(encoded), len(content)))
+        self.__file.write(encoded)
+        self.__file.write(content)
+        self.__file.flush()
+        start = offset + self.RECORD.size + len(encoded)
+        self.__length = start + len(content)
+        return Slot(start, len(content), self.__length - offset, header.get('status'), header.get('headers'),
+                    header.get('expires'))
+
+    def discard(self, key):
+        """
+        Remove an entry from the index, must be called with the lock held.
+        """
+        slot = self.__index.pop(key, None)
+        if slot is not None:
+            self.size -= slot.size
+        return slot
+
+    def get(self, key):
+        """
+        :param str key: Cache key.
+        :return: Stored entry, ``None`` if it is missing or expired. Its content is a read only
+            :class:`memoryview`, valid until the entry is evicted from the store.
+        :rtype: CacheEntry
+        """
+        with self.__lock:
+            slot = self.__index.get(key)
+            if slot is None:
+                return None
+            if slot.expires is not None and slot.expires <= self.clock():
+                self.discard(key)
+                self.append({'delete': key})
+                return None
+            self.__index.move_to_end(key)
+            content = self.view()[slot.offset:slot.offset + slot.length]
+        return CacheEntry(slot.status, slot.headers, content)
+
+    def set(self, key, entry, ttl=None):
+        """
+        :param str key: Cache key.
+        :param CacheEntry entry: Entry to store, skipped if it alone exceeds ``max_bytes``.
+        :param float ttl: (optional) Seconds the entry stays valid, ``None`` keeps it until evicted.
+        """
+        expires = self.clock() + ttl if ttl is not None else None
+        header = {'key': key, 'status': entry.status, 'headers': dict(entry.headers), 'expires': expires}
+        with self.__lock:
+            if self.max_bytes is not None and len(entry.content) > self.max_bytes:
+                if self.discard(key) is not None:
+                    self.append({'delete': key})
+                return
+            self.discard(key)
+            slot = self.append(header, entry.content)
+            self.__index[key] = slot
+            self.size += slot.size
+            while self.max_bytes is not None and self.size > self.max_bytes and len(self.__index) > 1:
+                evicted = next(iter(self.__index))
+                self.discard(evicted)
+                self.append({'delete': evicted})
+            if self.__length > self.compact_ratio * max(self.size, mmap.PAGESIZE):
+                self.compact()
+
+    def compact(self):
+        """
+        Rewrite the file with the live entries only, must be called with the lock held.
+        """
+        view = self.view()
+        compacted = self.path + '.compact'
+        index = collections.OrderedDict()
+        with open(compacted, 'wb') as handle:
+            offset = 0
+            for key, slot in self.__index.items():
+                encoded = json.dumps({'key': key, 'status': slot.status, 'headers': slot.headers,
+                                      'expires': slot.expires}).encode('utf-8')
+                handle.write(self.RECORD.pack(len(encoded), slot.length))
+                handle.write(encoded)
+                handle.write(view[slot.offset:slot.offset + slot.length])
+                start = offset + self.RECORD.size + len(encoded)
+                index[key] = slot._replace(offset=start)
+                offset = start + slot.length
+        del view
+        self.reopen(compacted)
+        self.__length = offset
+        self.__index = index
+
+    def reopen(self, replacement):
+        """
+        Move a new file in place of the current one, must be called with the lock held.
+
+        The file is replaced rather than rewritten in place, bodies still referenced keep reading the previous one.
+        """
+        os.replace(replacement, self.path)
+        self.__file.close()
+        self.__file = open(self.path, 'a+b')
+        self.__map = None
+
+    def delete_prefix(self, prefix):
+        """
+        Remove every entry whose key starts with ``prefix``.
+
+        :param str prefix: Key prefix.
+        """
+        with self.__lock:
+            keys = [key for key in self.__index if key.startswith(prefix)]
+            for key in keys:
+                self.discard(key)
+            if keys:
+                self.append({'delete_prefix': prefix})
+
+    def clear(self):
+        with self.__lock:
+            open(self.path + '.compact', 'wb').close()
+            self.reopen(self.path + '.compact')
+            self.__index.clear()
+            self.size = 0
+            self.__length = 0
+
+    def close(self):
+        with self.__lock:
+            self.__map = None
+            self.__file.close()
+            self.__owner.close()
+
+    def __len__(self):
+        return len(self.__index)
+
+
+class ResponseCache(object):
+    """
+    Read-through cache of GET responses for resources that rarely change.
+
+    Only resources with a policy are cached, for ``ttl`` seconds. A successful ``POST``, ``PUT``
+    or ``DELETE`` sent by the client on a resource drops every cached response of that resource.
+    Entries are namespaced by access token, so clients of different tenants may share a backend.
+
+    Usage::
+
+      >>> cache = fortnox.ResponseCache(fortnox.SQLiteBackend('/tmp/fortnox.db'), policies={'/units': 600})
+      >>> client = fortnox.Client(access_token=token, client_secret=secret, cache=cache)
+    """
+
+    """
+    Default time to live, in seconds, of the reference data resources.
+    Account balances move with every voucher, so accounts expire sooner.
+    """
+    REFERENCE_DATA = {
+        '/accounts': 300,
+        '/costcenters': 3600,
+        '/currencies': 3600,
+        '/modesofpayments': 3600,
+        '/pricelists': 3600,
+        '/termsofdeliveries': 3600,
+        '/termsofpayments': 3600,
+        '/units': 3600,
+        '/voucherseries': 3600,
+        '/wayofdeliveries': 3600,
+    }
+
+    def __init__(self, backend=None, policies=None):
+        """
+        :param backend: (optional) Store of the entries. Default: :class:`MemoryBackend <MemoryBackend>`.
+        :param dict policies: (optional) Time to live in seconds by resource path, ``None`` meaning
+            until evicted. Default: ``REFERENCE_DATA``.
+        """
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.policies = dict(self.REFERENCE_DATA if policies is None else policies)
+
+    @staticmethod
+    def resource(url):
+        """
+        Resource of a sub url, e.g. ``/accounts`` for ``/accounts/1010``.
+        """
+        return '/' + url.split('?', 1)[0].strip('/').split('/', 1)[0]
+
+    @staticmethod
+    def namespace(key):
+        """
+        Namespace of an access token, hashed so that tokens are never written to a shared store.
+        """
+        return hashlib.sha256((key or '').encode('utf-8')).hexdigest()[:16]
+
+    def prefix(self, token, url):
+        return '{namespace}:{resource}:'.format(namespace=self.namespace(token), resource=self.resource(url))
+
+    def key(self, token, url, params=None):
+        query = urlencode(sorted((k, v) for k, v in (params or {}).items() if v is not None), doseq=True)
+        return '{prefix}{url}?{query}'.format(prefix=self.prefix(token, url), url=url, query=query)
+
+    def is_cached(self, url):
+        return self.resource(url) in self.policies
+
+    def get(self, token, url, params=None):
+        """
+        :param str token: Access token the request is sent with.
+        :param str url: Sub url of the request.
+        :param dict params: (optional) Query parameters.
+        :return: Cached response, ``None`` on a miss or for resources without a policy.
+        :rtype: CacheEntry
+        """
+        if not self.is_cached(url):
+            return None
+        return self.backend.get(self.key(token, url, params))
+
+    def set(self, token, url, params, status, headers, content):
+        """
+        Store a successful response if its resource has a policy.
+        """
+        if not self.is_cached(url):
+            return
+        entry = CacheEntry(status, dict(headers), content)
+        self.backend.set(self.key(token, url, params), entry, self.policies[self.resource(url)])
+
+    def invalidate(self, token, url):
+        """
+        Drop every cached response of the resource of ``url`` for an access token.
+        """
+        if self.is_cached(url):
+            self.backend.delete_prefix(self.prefix(token, url))
+
+    def forget(self, token):
+        """
+        Drop every cached response of an access token, e.g. once its client has been evicted.
+        """
+        self.backend.delete_prefix('{namespace}:'.format(namespace=self.namespace(token)))
+
+    def clear(self):
+        self.backend.clear()
+
+
+class HttpCache(object):
+    """
+    Cache of GET responses revalidated with the server on every request.
+
+    Responses are stored with their ``ETag`` and ``Last-Modified`` validators and the next request
+    for the same url is sent with ``If-None-Match`` and ``If-Modified-Since``; a ``304 Not Modified``
+    answer is served from the stored body. When the server ignores the validators and sends the
+    whole body again, an unchanged body, told by its content hash, is not parsed again: the client
+    converts the json document it parsed last time, so every caller still gets objects of its own.
+
+    Unlike :class:`ResponseCache <ResponseCache>` nothing is served without asking the server, so
+    responses are never stale. Entries are namespaced by access token and dropped on writes of their
+    resource. Both caches may be used together and take the same backends.
+
+    Usage::
+
+      >>> cache = fortnox.HttpCache(fortnox.DirectoryBackend('/var/cache/fortnox', max_bytes=512 * 1024 * 1024))
+      >>> client = fortnox.Client(access_token=token, client_secret=secret, http_cache=cache)
+    """
+
+    def __init__(self, backend=None, resources=None, max_decoded=128):
+        """
+        :param backend: (optional) Store of the entries. Default: :class:`MemoryBackend <MemoryBackend>`
+            holding up to **64** MiB.
+        :param iterable resources: (optional) Resource paths whose responses are cached, e.g. ``['/accounts']``.
+            Default: the resources of ``ResponseCache.REFERENCE_DATA``.
+        :param int max_decoded: (optional) Number of parsed json documents a client keeps to reuse when
+            an unchanged body is sent again. Default: **128**.
+        """
+        self.backend = backend if backend is not None else MemoryBackend(max_bytes=64 * 1024 * 1024)
+        self.resources = frozenset(ResponseCache.REFERENCE_DATA if resources is None else resources)
+        self.max_decoded = max_decoded
+
+    def prefix(self, token, url):
+        return '{namespace}:{resource}:'.format(namespace=ResponseCache.namespace(token),
+                                                resource=ResponseCache.resource(url))
+
+    def key(self, token, url, params=None):
+        query = urlencode(sorted((k, v) for k, v in (params or {}).items() if v is not None), doseq=True)
+        return '{prefix}{url}?{query}'.format(prefix=self.prefix(token, url), url=url, query=query)
+
+    def is_cached(self, url):
+        return ResponseCache.resource(url) in self.resources
+
+    @staticmethod
+    def conditional_headers(entry):
+        """
+        :return: Headers revalidating a stored response, empty if it has no validator.
+        :rtype: dict
+        """
+        headers = {}
+        for name, value in entry.headers.items():
+            if name.lower() == 'etag':
+                headers['If-None-Match'] = value
+            elif name.lower() == 'last-modified':
+                headers['If-Modified-Since'] = value
+        return headers
+
+    @staticmethod
+    def digest(content):
+        """
+        Content hash telling whether a body changed.
+        """
+        return hashlib.sha256(content).digest()
+
+    def get(self, token, url, params=None):
+        """
+        :param str token: Access token the request is sent with.
+        :param str url: Sub url of the request.
+        :param dict params: (optional) Query parameters.
+        :return: Stored response, ``None`` on a miss or for resources that are not cached.
+        :rtype: CacheEntry
+        """
+        if not self.is_cached(url):
+            return None
+        return self.backend.get(self.key(token, url, params))
+
+    def set(self, token, url, params, status, headers, content):
+        """
+        Store a successful response if its resource is cached.
+        """
+        if not self.is_cached(url):
+            return
+        self.backend.set(self.key(token, url, params), CacheEntry(status, dict(headers), content))
+
+    def invalidate(self, token, url):
+        """
+        Drop every stored response of the resource of ``url`` for an access token.
+        """
+        if self.is_cached(url):
+            self.backend.delete_prefix(self.prefix(token, url))
+
+    def forget(self, token):
+        """
+        Drop every stored response of an access token, e.g. once its client has been evicted.
+        """
+        self.backend.delete_prefix('{namespace}:'.format(namespace=ResponseCache.namespace(token)))
+
+    def clear(self):
+        self.backend.clear()
@@ -1,5 +1,6 @@
 from fortnox.configuration import Configuration
 from fortnox.http_client import HttpClient
+from fortnox.tracing import TracedService
 
 import fortnox.services
 
@@ -30,6 +31,10 @@ class Client(object):
         :param str base_url: (optional) Base url for the api. Default: ``https://api.getbase.com``.
         :param bool verbose: (optional) Verbose/debug mode. Default: ``False``.
         :param int timeout: (optional) Connection and response timeout. Default: **30** seconds.
+        :param int pool_connections: (optional) Number of per-host connection pools to keep. Default: **10**.
+        :param int pool_maxsize: (optional) Maximum number of connections kept per host. Default: **10**.
+        :param bool keep_alive: (optional) Reuse connections between requests. Default: ``True``.
+        :param int pool_idle_timeout: (optional) Seconds before idle pooled connections are closed. Default: **60**.
 
         :raises ConfigurationError: if no ``access_token`` provided.
         :raises ConfigurationError: if provided ``access_token`` is invalid - contains disallowed characters.
@@ -42,65 +47,42 @@ class Client(object):
 
         self.http_client = HttpClient(self.config)
 
-        self.__access_token = fortnox.services.AccessTokenService(self.http_client)
-        self.__customers = fortnox.services.CustomerService(self.http_client)
-        self.__company_settings = fortnox.services.CompanySettingsService(self.http_client)
-        self.__account_charts = fortnox.services.AccountChartsService(self.http_client)
-        self.__accounts = fortnox.services.AccountsService(self.http_client)
-        self.__absence_transactions = fortnox.services.AbsenceTransactionsService(self.http_client)
-        self.__currencies = fortnox.services.CurrencyService(self.http_client)
-        self.__company_information = fortnox.services.CompanyInformationService(self.http_client)
-        self.__employees = fortnox.services.EmployeeService(self.http_client)
-        self.__projects = fortnox.services.ProjectService(self.http_client)
-        self.__articles = fortnox.services.ArticleService(self.http_client)
-        self.__expenses = fortnox.services.ExpenseService(self.http_client)
-        self.__financial_years = fortnox.services.FinancialYearService(self.http_client)
-        self.__invoices = fortnox.services.InvoiceService(self.http_client)
-        self.__asset_types = fortnox.services.AssetTypeService(self.http_client)
-        self.__predefined_accounts = fortnox.services.PredefinedAccountService(self.http_client)
-        self.__predefined_voucher_series = fortnox.services.PredefinedVoucherSeriesService(self.http_client)
-        self.__assets = fortnox.services.AssetService(self.http_client)
-        self.__attendance_transactions = fortnox.services.AttendanceTransactionsService(self.http_client)
-        self.__archives = fortnox.services.ArchiveService(self.http_client)
-        self.__article_file_connections = fortnox.services.ArticleFileConnectionsService(self.http_client)
-        self.__asset_file_connections = fortnox.services.AssetFileConnectionService(self.http_client)
-        self.__contract_accruals = fortnox.services.ContractAccrualService(self.http_client)
-        self.__contracts = fortnox.services.ContractService(self.http_client)
-        self.__contract_templates = fortnox.services.ContractTemplateService(self.http_client)
-        self.__cost_centers = fortnox.services.CostCenterService(self.http_client)
-        self.__inbox = fortnox.services.InboxService(self.http_client)
-        self.__invoice_accruals = fortnox.services.InvoiceAccrualService(self.http_client)
-        self.__invoice_payments = fortnox.services.InvoicePaymentService(self.http_client)
-        self.__labels = fortnox.services.LabelService(self.http_client)
-        self.__locked_periods = fortnox.services.LockedPeriodService(self.http_client)
-        self.__modes_of_payments = fortnox.services.ModesOfPaymentService(self.http_client)
-        self.__nox_finans_invoices = fortnox.services.NoxFinansInvoiceService(self.http_client)
-        self.__offers = fortnox.services.OfferService(self.http_client)
-        self.__orders = fortnox.services.OrderService(self.http_client)
-        self.__price_lists = fortnox.services.PriceListService(self.http_client)
-        self.__prices = fortnox.services.PriceService(self.http_client)
-        self.__print_templates = fortnox.services.PrintTemplateService(self.http_client)
-        self.__salary_transactions = fortnox.services.SalaryTransactionService(self.http_client)
-        self.__schedule_times = fortnox.services.ScheduleTimeService(self.http_client)
-        self.__sie = fortnox.services.SIEService(self.http_client)
-        self.__supplier_invoice_accruals = fortnox.services.SupplierInvoiceAccrualService(self.http_client)
-        self.__supplier_invoice_external_url_connections = fortnox.services.SupplierInvoiceExternalURLConnectionService(
-            self.http_client)
-        self.__supplier_invoice_file_connections = fortnox.services.SupplierInvoiceFileConnectionService(
-            self.http_client)
-        self.__supplier_invoice_payments = fortnox.services.SupplierInvoicePaymentService(self.http_client)
-        self.__supplier_invoices = fortnox.services.SupplierInvoiceService(self.http_client)
-        self.__suppliers = fortnox.services.SupplierService(self.http_client)
-        self.__tax_reductions = fortnox.services.TaxReductionService(self.http_client)
-        self.__terms_of_deliveries = fortnox.services.TermsOfDeliveryService(self.http_client)
-        self.__terms_of_payments = fortnox.services.TermsOfPaymentService(self.http_client)
-        self.__email_trusted_domains = fortnox.services.TrustedDomainService(self.http_client)
-        self.__trusted_email_senders = fortnox.services.TrustedSenderService(self.http_client)
-        self.__units = fortnox.services.UnitService(self.http_client)
-        self.__voucher_file_connections = fortnox.services.VoucherFileConnectionService(self.http_client)
-        self.__voucher_series = fortnox.services.VoucherSeriesService(self.http_client)
-        self.__vouchers = fortnox.services.VoucherService(self.http_client)
-        self.__way_of_deliveries = fortnox.services.WayOfDeliveryService(self.http_client)
+        self.__services = {}
+
+    def __service(self, service_name):
+        """
+        Return the service of this client, creating it on first access.
+
+        Services are created lazily, so a client only pays for the services it actually uses.
+        With a ``tracer`` configured every service method runs in its own span.
+
+        :param str service_name: Name of the service class in :mod:`fortnox.services`.
+        """
+        service = self.__services.get(service_name)
+        if service is None:
+            service_class = getattr(fortnox.services, service_name)
+            service = service_class(self.http_client)
+            if self.config.tracer is not None:
+                service = TracedService(service, self.config.tracer)
+            service = self.__services.setdefault(service_name, service)
+        return service
+
+    def close(self):
+        """
+        Close the connection pool shared by all services.
+
+        Usage::
+
+          >>> with fortnox.Client(access_token=token, client_secret=secret) as client:
+          ...     client.customers.list()
+        """
+        self.http_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     @property
     def token(self):
@@ -108,7 +90,7 @@ class Client(object):
         :return: :class:`AccessTokenService <fortnox.AccessTokenService>` object that gives you an access token that will be used in all other  actions.
         :rtype: fortnox.AccessTokenService
         """
-        return self.__access_token
+        return self.__service('AccessTokenService')
 
     @property
     def customers(self):
@@ -116,7 +98,7 @@ class Client(object):
         :return: :class:`CustomerService <fortnox.CustomerService>` object that gives you an access to all Customers related actions.
         :rtype: fortnox.CustomerService
         """
-        return self.__customers
+        return self.__service('CustomerService')
 
     @property
     def company_settings(self):
@@ -124,7 +106,7 @@ class Client(object):
         :return: :class:`CompanySettingsService <fortnox.CompanySettingsService>` object that gives you an access to CompanySettings related actions.
         :rtype: fortnox.CompanySettingsService
         """
-        return self.__company_settings
+        return self.__service('CompanySettingsService')
 
     @property
     def account_charts(self):
@@ -132,7 +114,7 @@ class Client(object):
         :return: :class:`AccountChartsService <fortnox.AccountChartsService>` object that gives you an access to AccountChartsService related actions.
         :rtype: fortnox.AccountChartsService
         """
-        return self.__account_charts
+        return self.__service('AccountChartsService')
 
     @property
     def accounts(self):
@@ -140,7 +122,7 @@ class Client(object):
         :return: :class:`AccountsService <fortnox.AccountsService>` object that gives you an access to AccountsService related actions.
         :rtype: fortnox.AccountsService
         """
-        return self.__accounts
+        return self.__service('AccountsService')
 
     @property
     def absence_transactions(self):
@@ -148,7 +130,7 @@ class Client(object):
         :return: :class:`AbsenceTransactionsService <fortnox.AbsenceTransactionsService>` object that gives you an access to AbsenceTransactionsService related actions.
         :rtype: fortnox.AbsenceTransactionsService
         """
-        return self.__absence_transactions
+        return self.__service('AbsenceTransactionsService')
 
     @property
     def currencies(self):
@@ -156,7 +138,7 @@ class Client(object):
         :return: :class:`CurrencyService <fortnox.CurrencyService>` object that gives you an access to CurrencyService related actions.
         :rtype: fortnox.CurrencyService
         """
-        return self.__currencies
+        return self.__service('CurrencyService')
 
     @property
     def company_information(self):
@@ -164,7 +146,7 @@ class Client(object):
         :return: :class:`CompanyInformationService <fortnox.CompanyInformationService>` object that gives you an access to CompanyInformationService related actions.
         :rtype: fortnox.CompanyInformationService
         """
-        return self.__company_information
+        return self.__service('CompanyInformationService')
 
     @property
     def employees(self):
@@ -172,7 +154,7 @@ class Client(object):
         :return: :class:`EmployeeService <fortnox.EmployeeService>` object that gives you an access to Employees related actions.
         :rtype: fortnox.EmployeeService
         """
-        return self.__employees
+        return self.__service('EmployeeService')
 
     @property
     def projects(self):
@@ -180,7 +162,7 @@ class Client(object):
         :return: :class:`ProjectService <fortnox.ProjectService>` object that gives you an access to Projects related actions.
         :rtype: fortnox.ProjectService
         """
-        return self.__projects
+        return self.__service('ProjectService')
 
     @property
     def articles(self):
@@ -188,7 +170,7 @@ class Client(object):
         :return: :class:`ArticleService <fortnox.ArticleService>` object that gives you an access to Articles related actions.
         :rtype: fortnox.ArticleService
         """
-        return self.__articles
+        return self.__service('ArticleService')
 
     @property
     def expenses(self):
@@ -196,7 +178,7 @@ class Client(object):
         :return: :class:`ExpenseService <fortnox.ExpenseService>` object that gives you an access to Expense related actions.
         :rtype: fortnox.ExpenseService
         """
-        return self.__expenses
+        return self.__service('ExpenseService')
 
     @property
     def financial_years(self):
@@ -204,7 +186,7 @@ class Client(object):
         :return: :class:`FinancialYearService <fortnox.FinancialYearService>` object that gives you an access to Financial Year related actions.
         :rtype: fortnox.FinancialYearService
         """
-        return self.__financial_years
+        return self.__service('FinancialYearService')
 
     @property
     def invoices(self):
@@ -212,7 +194,7 @@ class Client(object):
         :return: :class:`InvoiceService <fortnox.InvoiceService>` object that gives you an access to Invoice related actions.
         :rtype: fortnox.InvoiceService
         """
-        return self.__invoices
+        return self.__service('InvoiceService')
 
     @property
     def asset_types(self):
@@ -220,7 +202,7 @@ class Client(object):
         :return: :class:`AssetTypeService <fortnox.AssetTypeService>` object that gives you an access to Asset Type related actions.
         :rtype: fortnox.AssetTypeService
         """
-        return self.__asset_types
+        return self.__service('AssetTypeService')
 
     @property
     def predefined_accounts(self):
@@ -228,7 +210,7 @@ class Client(object):
         :return: :class:`PredefinedAccountService <fortnox.PredefinedAccountService>` object that gives you an access to Predefined Accounts related actions.
         :rtype: fortnox.PredefinedAccountService
         """
-        return self.__predefined_accounts
+        return self.__service('PredefinedAccountService')
 
     @property
     def predefined_voucher_series(self):
@@ -236,7 +218,7 @@ class Client(object):
         :return: :class:`PredefinedVoucherSeriesService <fortnox.PredefinedVoucherSeriesService>` object that gives you an access to Predefined Voucher Series related actions.
         :rtype: fortnox.PredefinedVoucherSeriesService
         """
-        return self.__predefined_voucher_series
+        return self.__service('PredefinedVoucherSeriesService')
 
     @property
     def assets(self):
@@ -244,7 +226,7 @@ class Client(object):
         :return: :class:`AssetService <fortnox.AssetService>` object that gives you an access to Asset related actions.
         :rtype: fortnox.AssetService
         """
-        return self.__assets
+        return self.__service('AssetService')
 
     @property
     def attendance_transactions(self):
@@ -252,7 +234,7 @@ class Client(object):
         :return: :class:`AttendanceTransactionsService <fortnox.AttendanceTransactionsService>` object that gives you an access to Attendance Transactions related actions.
         :rtype: fortnox.AttendanceTransactionsService
         """
-        return self.__attendance_transactions
+        return self.__service('AttendanceTransactionsService')
 
     @property
     def archives(self):
@@ -260,7 +242,7 @@ class Client(object):
         :return: :class:`ArchiveService <fortnox.ArchiveService>` object that gives you an access to Archive Transactions related actions.
         :rtype: fortnox.ArchiveService
         """
-        return self.__archives
+        return self.__service('ArchiveService')
 
     @property
     def article_file_connections(self):
@@ -268,7 +250,7 @@ class Client(object):
         :return: :class:`ArticleFileConnectionsService <fortnox.ArticleFileConnectionsService>` object that gives you an access to Article File Connections related actions.
         :rtype: fortnox.ArticleFileConnectionsService
         """
-        return self.__article_file_connections
+        return self.__service('ArticleFileConnectionsService')
 
     @property
     def asset_file_connections(self):
@@ -276,7 +258,7 @@ class Client(object):
         :return: :class:`AssetFileConnectionService <fortnox.AssetFileConnectionService>` object that gives you an access to Asset File Connection related actions.
         :rtype: fortnox.AssetFileConnectionService
         """
-        return self.__asset_file_connections
+        return self.__service('AssetFileConnectionService')
 
     @property
     def contract_accruals(self):
@@ -284,7 +266,7 @@ class Client(object):
         :return: :class:`ContractAccrualService <fortnox.ContractAccrualService>` object that gives you an access to Contract Accrual related actions.
         :rtype: fortnox.ContractAccrualService
         """
-        return self.__contract_accruals
+        return self.__service('ContractAccrualService')
 
     @property
     def contracts(self):
@@ -292,7 +274,7 @@ class Client(object):
         :return: :class:`ContractService <fortnox.ContractService>` object that gives you an access to Contract related actions.
         :rtype: fortnox.ContractService
         """
-        return self.__contracts
+        return self.__service('ContractService')
 
     @property
     def contract_templates(self):
@@ -300,7 +282,7 @@ class Client(object):
         :return: :class:`ContractTemplateService <fortnox.ContractTemplateService>` object that gives you an access to Contract Template related actions.
         :rtype: fortnox.ContractTemplateService
         """
-        return self.__contract_templates
+        return self.__service('ContractTemplateService')
 
     @property
     def cost_centers(self):
@@ -308,7 +290,7 @@ class Client(object):
         :return: :class:`CostCenterService <fortnox.CostCenterService>` object that gives you an access to Cost Center related actions.
         :rtype: fortnox.CostCenterService
         """
-        return self.__cost_centers
+        return self.__service('CostCenterService')
 
     @property
     def invoice_accruals(self):
@@ -316,7 +298,7 @@ class Client(object):
         :return: :class:`InvoiceAccrualService <fortnox.InvoiceAccrualService>` object that gives you an access to Invoice Accrual related actions.
         :rtype: fortnox.InvoiceAccrualService
         """
-        return self.__invoice_accruals
+        return self.__service('InvoiceAccrualService')
 
     @property
     def invoice_payments(self):
@@ -324,7 +306,7 @@ class Client(object):
         :return: :class:`InvoicePaymentService <fortnox.InvoicePaymentService>` object that gives you an access to Invoice Payment related actions.
         :rtype: fortnox.InvoicePaymentService
         """
-        return self.__invoice_payments
+        return self.__service('InvoicePaymentService')
 
     @property
     def labels(self):
@@ -332,7 +314,7 @@ class Client(object):
         :return: :class:`LabelService <fortnox.LabelService>` object that gives you an access to Label related actions.
         :rtype: fortnox.LabelService
         """
-        return self.__labels
+        return self.__service('LabelService')
 
     @property
     def locked_periods(self):
@@ -340,7 +322,7 @@ class Client(object):
         :return: :class:`LockedPeriodService <fortnox.LockedPeriodService>` object that gives you an access to Locked Period related actions.
         :rtype: fortnox.LockedPeriodService
         """
-        return self.__locked_periods
+        return self.__service('LockedPeriodService')
 
     @property
     def modes_of_payments(self):
@@ -348,7 +330,7 @@ class Client(object):
         :return: :class:`ModesOfPaymentService <fortnox.ModesOfPaymentService>` object that gives you an access to Modes Of Payment related actions.
         :rtype: fortnox.ModesOfPaymentService
         """
-        return self.__modes_of_payments
+        return self.__service('ModesOfPaymentService')
 
     @property
     def nox_finans_invoices(self):
@@ -356,7 +338,7 @@ class Client(object):
         :return: :class:`NoxFinansInvoiceService <fortnox.NoxFinansInvoiceService>` object that gives you an access to Nox Finans Invoice related actions.
         :rtype: fortnox.NoxFinansInvoiceService
         """
-        return self.__nox_finans_invoices
+        return self.__service('NoxFinansInvoiceService')
 
     @property
     def offers(self):
@@ -364,7 +346,7 @@ class Client(object):
         :return: :class:`OfferService <fortnox.OfferService>` object that gives you an access to Offer related actions.
         :rtype: fortnox.OfferService
         """
-        return self.__offers
+        return self.__service('OfferService')
 
     @property
     def orders(self):
@@ -372,7 +354,7 @@ class Client(object):
         :return: :class:`OrderService <fortnox.OrderService>` object that gives you an access to Order related actions.
         :rtype: fortnox.OrderService
         """
-        return self.__orders
+        return self.__service('OrderService')
 
     @property
     def price_lists(self):
@@ -380,7 +362,7 @@ class Client(object):
         :return: :class:`PriceListService <fortnox.PriceListService>` object that gives you an access to Price List related actions.
         :rtype: fortnox.PriceListService
         """
-        return self.__price_lists
+        return self.__service('PriceListService')
 
     @property
     def prices(self):
@@ -388,7 +370,7 @@ class Client(object):
         :return: :class:`PriceService <fortnox.PriceService>` object that gives you an access to Price related actions.
         :rtype: fortnox.PriceService
         """
-        return self.__prices
+        return self.__service('PriceService')
 
     @property
     def print_templates(self):
@@ -396,7 +378,7 @@ class Client(object):
         :return: :class:`PrintTemplateService <fortnox.PrintTemplateService>` object that gives you an access to Print Template related actions.
         :rtype: fortnox.PrintTemplateService
         """
-        return self.__print_templates
+        return self.__service('PrintTemplateService')
 
     @property
     def salary_transactions(self):
@@ -404,7 +386,7 @@ class Client(object):
         :return: :class:`SalaryTransactionService <fortnox.SalaryTransactionService>` object that gives you an access to Salary Transaction related actions.
         :rtype: fortnox.SalaryTransactionService
         """
-        return self.__salary_transactions
+        return self.__service('SalaryTransactionService')
 
     @property
     def schedule_times(self):
@@ -412,7 +394,7 @@ class Client(object):
         :return: :class:`ScheduleTimeService <fortnox.ScheduleTimeService>` object that gives you an access to Schedule Time related actions.
         :rtype: fortnox.ScheduleTimeService
         """
-        return self.__schedule_times
+        return self.__service('ScheduleTimeService')
 
     @property
     def sie(self):
@@ -420,7 +402,7 @@ class Client(object):
         :return: :class:`SIEService <fortnox.SIEService>` object that gives you an access to SIE related actions.
         :rtype: fortnox.SIEService
         """
-        return self.__sie
+        return self.__service('SIEService')
 
     @property
     def supplier_invoice_accruals(self):
@@ -428,7 +410,7 @@ class Client(object):
         :return: :class:`SupplierInvoiceAccrualService <fortnox.SupplierInvoiceAccrualService>` object that gives you an access to Supplier Invoice Accrual related actions.
         :rtype: fortnox.SupplierInvoiceAccrualService
         """
-        return self.__supplier_invoice_accruals
+        return self.__service('SupplierInvoiceAccrualService')
 
     @property
     def supplier_invoice_external_url_connections(self):
@@ -436,7 +418,7 @@ class Client(object):
         :return: :class:`SupplierInvoiceExternalURLConnectionService <fortnox.SupplierInvoiceExternalURLConnectionService>` object that gives you an access to Supplier Invoice External URL Connection related actions.
         :rtype: fortnox.SupplierInvoiceExternalURLConnectionService
         """
-        return self.__supplier_invoice_external_url_connections
+        return self.__service('SupplierInvoiceExternalURLConnectionService')
 
     @property
     def supplier_invoice_file_connections(self):
@@ -444,7 +426,7 @@ class Client(object):
         :return: :class:`SupplierInvoiceFileConnectionService <fortnox.SupplierInvoiceFileConnectionService>` object that gives you an access to Supplier Invoice File Connection related actions.
         :rtype: fortnox.SupplierInvoiceFileConnectionService
         """
-        return self.__supplier_invoice_file_connections
+        return self.__service('SupplierInvoiceFileConnectionService')
 
     @property
     def supplier_invoice_payments(self):
@@ -452,7 +434,7 @@ class Client(object):
         :return: :class:`SupplierInvoicePaymentService <fortnox.SupplierInvoicePaymentService>` object that gives you an access to Supplier Invoice Payment related actions.
         :rtype: fortnox.SupplierInvoicePaymentService
         """
-        return self.__supplier_invoice_payments
+        return self.__service('SupplierInvoicePaymentService')
 
     @property
     def supplier_invoices(self):
@@ -460,7 +442,7 @@ class Client(object):
         :return: :class:`SupplierInvoiceService <fortnox.SupplierInvoiceService>` object that gives you an access to Supplier Invoice related actions.
         :rtype: fortnox.SupplierInvoiceService
         """
-        return self.__supplier_invoices
+        return self.__service('SupplierInvoiceService')
 
     @property
     def suppliers(self):
@@ -468,7 +450,7 @@ class Client(object):
         :return: :class:`SupplierService <fortnox.SupplierService>` object that gives you an access to Supplier related actions.
         :rtype: fortnox.SupplierService
         """
-        return self.__suppliers
+        return self.__service('SupplierService')
 
     @property
     def tax_reductions(self):
@@ -476,7 +458,7 @@ class Client(object):
         :return: :class:`TaxReductionService <fortnox.TaxReductionService>` object that gives you an access to Tax Reduction related actions.
         :rtype: fortnox.TaxReductionService
         """
-        return self.__tax_reductions
+        return self.__service('TaxReductionService')
 
     @property
     def terms_of_deliveries(self):
@@ -484,7 +466,7 @@ class Client(object):
         :return: :class:`TermsOfDeliveryService <fortnox.TermsOfDeliveryService>` object that gives you an access to Terms Of Delivery related actions.
         :rtype: fortnox.TermsOfDeliveryService
         """
-        return self.__terms_of_deliveries
+        return self.__service('TermsOfDeliveryService')
 
     @property
     def terms_of_payments(self):
@@ -492,7 +474,7 @@ class Client(object):
         :return: :class:`TermsOfPaymentService <fortnox.TermsOfPaymentService>` object that gives you an access to Terms Of Payment related actions.
         :rtype: fortnox.TermsOfPaymentService
         """
-        return self.__terms_of_payments
+        return self.__service('TermsOfPaymentService')
 
     @property
     def email_trusted_domains(self):
@@ -500,7 +482,7 @@ class Client(object):
         :return: :class:`TrustedDomainService <fortnox.TrustedDomainService>` object that gives you an access to Trusted Domain related actions.
         :rtype: fortnox.TrustedDomainService
         """
-        return self.__email_trusted_domains
+        return self.__service('TrustedDomainService')
 
     @property
     def trusted_email_senders(self):
@@ -508,7 +490,7 @@ class Client(object):
         :return: :class:`TrustedSenderService <fortnox.TrustedSenderService>` object that gives you an access to Trusted Email Sender related actions.
         :rtype: fortnox.TrustedSenderService
         """
-        return self.__trusted_email_senders
+        return self.__service('TrustedSenderService')
 
     @property
     def units(self):
@@ -516,7 +498,7 @@ class Client(object):
         :return: :class:`UnitService <fortnox.UnitService>` object that gives you an access to Unit related actions.
         :rtype: fortnox.UnitService
         """
-        return self.__units
+        return self.__service('UnitService')
 
     @property
     def voucher_file_connections(self):
@@ -524,7 +506,7 @@ class Client(object):
         :return: :class:`VoucherFileConnectionService <fortnox.VoucherFileConnectionService>` object that gives you an access to Voucher File Connection related actions.
         :rtype: fortnox.VoucherFileConnectionService
         """
-        return self.__voucher_file_connections
+        return self.__service('VoucherFileConnectionService')
 
     @property
     def voucher_series(self):
@@ -532,7 +514,7 @@ class Client(object):
         :return: :class:`VoucherSeriesService <fortnox.VoucherSeriesService>` object that gives you an access to Voucher Series related actions.
         :rtype: fortnox.VoucherSeriesService
         """
-        return self.__voucher_series
+        return self.__service('VoucherSeriesService')
 
     @property
     def vouchers(self):
@@ -540,7 +522,7 @@ class Client(object):
         :return: :class:`VoucherService <fortnox.VoucherService>` object that gives you an access to Voucher related actions.
         :rtype: fortnox.VoucherService
         """
-        return self.__vouchers
+        return self.__service('VoucherService')
 
     @property
     def way_of_deliveries(self):
@@ -548,7 +530,7 @@ class Client(object):
         :return: :class:`WayOfDeliveryService <fortnox.WayOfDeliveryService>` object that gives you an access to Way Of Delivery related actions.
         :rtype: fortnox.WayOfDeliveryService
         """
-        return self.__way_of_deliveries
+        return self.__service('WayOfDeliveryService')
 
     @property
     def inbox(self):
@@ -556,4 +538,4 @@ class Client(object):
         :return: :class:`InboxService <fortnox.InboxService>` object that gives you an access to Inbox related actions.
         :rtype: fortnox.InboxService
         """
-        return self.__inbox
+        return self.__service('InboxService')
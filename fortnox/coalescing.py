@@ -0,0 +1,61 @@
+import threading
+from concurrent.futures import Future
+from urllib.parse import urlencode
+
+
+class SingleFlight(object):
+    """
+    Thread safe request coalescing.
+
+    The first caller of a key runs the call, callers arriving with the same key while it is in
+    flight wait for it and receive its result, or its exception, instead of running their own.
+    A key is forgotten as soon as its call finishes, later callers run the call again.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(method, url, params=None, token=None, raw=False):
+        """
+        Key of a request: its method, sub url, query parameters, access token and whether the envelope is kept.
+
+        :rtype: tuple
+        """
+        query = urlencode(sorted((k, v) for k, v in (params or {}).items() if v is not None), doseq=True)
+        return (method.lower(), url, query, token, raw)
+
+    def do(self, key, func):
+        """
+        Run ``func`` unless a call of the same key is in flight, in which case wait for that call.
+
+        :param key: Hashable key of the call.
+        :param callable func: Call to run, without arguments.
+        :return: Tuple of (result of the call, whether it was shared with a call already in flight).
+        :rtype: tuple
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            shared = call is not None
+            if not shared:
+                call = self.calls[key] = Future()
+        if shared:
+            return call.result(), True
+
+        try:
+            result = func()
+        except BaseException as e:
+            self.forget(key)
+            call.set_exception(e)
+            raise
+        self.forget(key)
+        call.set_result(result)
+        return result, False
+
+    def forget(self, key):
+        with self.lock:
+            self.calls.pop(key, None)
+
+    def __len__(self):
+        return len(self.calls)
@@ -1,6 +1,9 @@
 import re
 
+from fortnox.decoders import Decoder
 from fortnox.errors import ConfigurationError
+from fortnox.retry import RetryPolicy
+from fortnox.tracing import is_tracer
 
 
 class Configuration(object):
@@ -17,6 +20,46 @@ class Configuration(object):
         :param str base_url: (optional) Base url for the api. Default: ``https://api.fortnox.se``.
         :param bool verbose: (optional) Verbose/debug mode. Default: ``False``.
         :param int timeout: (optional) Connection and response timeout. Default: **30** seconds.
+        :param int pool_connections: (optional) Number of per-host connection pools to keep. Default: **10**.
+        :param int pool_maxsize: (optional) Maximum number of connections kept per host. Default: **10**.
+        :param bool pool_block: (optional) Block when all pooled connections are busy instead of
+            opening a throwaway connection. Default: ``False``.
+        :param bool keep_alive: (optional) Reuse connections between requests. Default: ``True``.
+        :param int pool_idle_timeout: (optional) Seconds a pool may stay unused before its connections
+            are closed, ``None`` keeps them open. Default: **60** seconds.
+        :param int max_workers: (optional) Size of the worker pool fetching pages concurrently. Default: **4**.
+        :param int max_in_flight: (optional) Maximum number of concurrent requests sent by
+            :class:`AsyncClient <fortnox.AsyncClient>`. Default: **10**.
+        :param float rate_limit: (optional) Requests per second sent for the access token,
+            ``None`` disables client side rate limiting. Default: **4**.
+        :param int rate_limit_burst: (optional) Requests that may be sent back to back. Default: **5**.
+        :param :class:`fortnox.RateLimiter` rate_limiter: (optional) Limiter shared with other clients,
+            takes precedence over ``rate_limit`` and ``rate_limit_burst``.
+        :param :class:`fortnox.RetryPolicy` retry_policy: (optional) When and how often failed requests
+            are sent again, ``None`` disables retries. Default: ``RetryPolicy()``.
+        :param str decode_mode: (optional) Objects json responses are decoded into: ``munch``,
+            ``dict`` or ``attr`` (attribute access converted lazily). Default: ``munch``.
+        :param str json_backend: (optional) Json parser: ``auto`` (orjson when installed), ``json``
+            or ``orjson``. Default: ``auto``.
+        :param :class:`fortnox.decoders.Decoder` decoder: (optional) Custom decoder, takes precedence
+            over ``decode_mode`` and ``json_backend``.
+        :param :class:`fortnox.ResponseCache` cache: (optional) Read-through cache of reference data
+            responses, ``None`` disables caching. Default: ``None``.
+        :param :class:`fortnox.HttpCache` http_cache: (optional) Cache of GET responses revalidated with
+            conditional requests, ``None`` disables it. Default: ``None``.
+        :param bool coalesce_requests: (optional) Identical GET requests sent concurrently by
+            :class:`HttpClient <fortnox.HttpClient>`, same url, parameters and access token, share one
+            request and receive the same decoded response, which callers must then not modify. Default: ``False``.
+        :param :class:`fortnox.Hooks` hooks: (optional) Callbacks run before every attempt, after every
+            response, on errors and on retries. Default: ``None``.
+        :param :class:`fortnox.MetricsCollector` metrics: (optional) Collector recording latency, statuses,
+            bytes and timings of every request. Default: ``None``.
+        :param tracer: (optional) Tracer, e.g. an OpenTelemetry one, whose ``start_as_current_span`` opens
+            a span around every service call and every request, ``None`` disables tracing. Default: ``None``.
+        :param :class:`requests.Session` session: (optional) Session whose connection pool is shared with
+            other clients, it is not closed with the client. Default: a session of the client's own.
+        :param :class:`concurrent.futures.Executor` executor: (optional) Worker pool shared with other clients,
+            it is not shut down with the client. Default: a pool of ``max_workers`` threads of the client's own.
         """
 
         self.access_token = options.get('access_token')
@@ -25,6 +68,28 @@ class Configuration(object):
         self.client_secret = options.get('client_secret')
         self.base_url = options['base_url'] if 'base_url' in options else 'https://api.fortnox.se'
         self.timeout = options['timeout'] if 'timeout' in options else 30
+        self.pool_connections = options.get('pool_connections', 10)
+        self.pool_maxsize = options.get('pool_maxsize', 10)
+        self.pool_block = options.get('pool_block', False)
+        self.keep_alive = options.get('keep_alive', True)
+        self.pool_idle_timeout = options.get('pool_idle_timeout', 60)
+        self.max_workers = options.get('max_workers', 4)
+        self.max_in_flight = options.get('max_in_flight', 10)
+        self.rate_limit = options.get('rate_limit', 4)
+        self.rate_limit_burst = options.get('rate_limit_burst', 5)
+        self.rate_limiter = options.get('rate_limiter')
+        self.retry_policy = options['retry_policy'] if 'retry_policy' in options else RetryPolicy()
+        self.decode_mode = options.get('decode_mode', 'munch')
+        self.json_backend = options.get('json_backend', 'auto')
+        self.decoder = options.get('decoder')
+        self.cache = options.get('cache')
+        self.http_cache = options.get('http_cache')
+        self.coalesce_requests = options.get('coalesce_requests', False)
+        self.hooks = options.get('hooks')
+        self.metrics = options.get('metrics')
+        self.tracer = options.get('tracer')
+        self.session = options.get('session')
+        self.executor = options.get('executor')
 
     def validate(self):
         """Validates whether a configuration is valid.
@@ -34,6 +99,8 @@ class Configuration(object):
         :raises ConfigurationError: if provided ``access_token`` is invalid - contains disallowed characters.
         :raises ConfigurationError: if provided ``access_token`` is invalid - has invalid length.
         :raises ConfigurationError: if provided ``base_url`` is invalid.
+        :raises ConfigurationError: if provided ``decode_mode`` or ``json_backend`` is invalid.
+        :raises ConfigurationError: if provided ``tracer`` has no ``start_as_current_span``.
         """
 
         if self.client_secret is None:
@@ -48,6 +115,31 @@ class Configuration(object):
                                      'both http and https are accepted, '
                                      'and the hierarchical part')
 
+        for option in ('pool_connections', 'pool_maxsize', 'max_workers', 'max_in_flight'):
+            value = getattr(self, option)
+            if not isinstance(value, int) or value < 1:
+                raise ConfigurationError('Provided {option} is invalid '
+                                         'as it must be a positive integer.'.format(option=option))
+
+        if self.rate_limit is not None and self.rate_limit <= 0:
+            raise ConfigurationError('Provided rate_limit is invalid '
+                                     'as it must be a positive number of requests per second or None.')
+
+        if not isinstance(self.rate_limit_burst, int) or self.rate_limit_burst < 1:
+            raise ConfigurationError('Provided rate_limit_burst is invalid '
+                                     'as it must be a positive integer.')
+
+        if self.pool_idle_timeout is not None and self.pool_idle_timeout <= 0:
+            raise ConfigurationError('Provided pool_idle_timeout is invalid '
+                                     'as it must be a positive number of seconds or None.')
+
+        if self.decoder is None:
+            Decoder(self.decode_mode, self.json_backend)
+
+        if self.tracer is not None and not is_tracer(self.tracer):
+            raise ConfigurationError('Provided tracer is invalid '
+                                     'as it has no start_as_current_span method.')
+
         if self.access_token is None:
             if self.authorization_code:
                 return True
@@ -0,0 +1,159 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from munch import munchify
+
+from fortnox.errors import ConfigurationError
+
+
+def json_loads(content):
+    """
+    :func:`json.loads` also accepting a :class:`memoryview`, e.g. a body read from a memory mapped cache.
+    """
+    return json.loads(bytes(content) if isinstance(content, memoryview) else content)
+
+
+class AttrDict(dict):
+    """
+    Dictionary that supports attribute-style access and converts nested values only when they are read.
+
+    Unlike :func:`munch.munchify`, which walks the whole response up front, wrapping a large page is
+    a shallow copy of each item: nested rows such as ``InvoiceRows`` are only converted, once, when
+    they are accessed through an attribute, indexing, :meth:`get`, :meth:`values` or :meth:`items`.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is dict or type(value) is list:
+            value = wrap(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __delattr__(self, name):
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, dict.__repr__(self))
+
+
+class AttrList(list):
+    """
+    List whose dictionaries are wrapped in :class:`AttrDict <AttrDict>` when they are read.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return AttrList(list.__getitem__(self, index))
+        value = list.__getitem__(self, index)
+        if type(value) is dict or type(value) is list:
+            value = wrap(value)
+            list.__setitem__(self, index, value)
+        return value
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+def wrap(value):
+    """
+    Wrap a decoded json value for attribute-style access without converting its children.
+
+    :param value: Decoded json value.
+    :return: :class:`AttrDict <AttrDict>` for dictionaries, :class:`AttrList <AttrList>` for lists,
+        the value itself otherwise.
+    """
+    if type(value) is dict:
+        return AttrDict(value)
+    if type(value) is list:
+        return AttrList(value)
+    return value
+
+
+def plain(value):
+    return value
+
+
+class Decoder(object):
+    """
+    Turns json response bodies into python objects.
+
+    The object mode decides what a decoded body is made of:
+
+    * ``munch`` - :class:`munch.Munch` objects converted recursively, the historical behaviour.
+    * ``dict`` - plain dictionaries and lists, the fastest option.
+    * ``attr`` - :class:`AttrDict <AttrDict>` objects, attribute-style access converted lazily.
+
+    The json backend is :module:`orjson` when it is installed and ``auto`` is chosen, the
+    standard :module:`json` module otherwise.
+    """
+
+    MODES = {
+        'munch': munchify,
+        'dict': plain,
+        'attr': wrap,
+    }
+    JSON_BACKENDS = ('auto', 'json', 'orjson')
+
+    def __init__(self, mode='munch', json_backend='auto'):
+        """
+        :param str mode: (optional) One of ``munch``, ``dict`` or ``attr``. Default: ``munch``.
+        :param str json_backend: (optional) One of ``auto``, ``json`` or ``orjson``. Default: ``auto``.
+        :raises ConfigurationError: if the mode or the json backend is unknown, or ``orjson`` is not installed.
+        """
+        if mode not in self.MODES:
+            raise ConfigurationError('Provided decode_mode is invalid '
+                                     'as it must be one of: {modes}.'.format(modes=', '.join(sorted(self.MODES))))
+        if json_backend not in self.JSON_BACKENDS:
+            raise ConfigurationError('Provided json_backend is invalid '
+                                     'as it must be one of: {backends}.'.format(backends=', '.join(self.JSON_BACKENDS)))
+        if json_backend == 'orjson' and orjson is None:
+            raise ConfigurationError('The orjson json backend requires orjson. '
+                                     'Install it using: "pip install pyfortnox[fast]"')
+
+        self.mode = mode
+        self.convert = self.MODES[mode]
+        if json_backend == 'json' or orjson is None:
+            self.json_backend = 'json'
+            self.loads = json_loads
+        else:
+            self.json_backend = 'orjson'
+            self.loads = orjson.loads
+
+    def decode(self, content):
+        """
+        Parse a json body and convert it according to the object mode.
+
+        :param bytes content: Json document, may be empty.
+        :return: Decoded body, ``None`` for an empty body.
+        """
+        return self.convert(self.loads(content)) if content else None
@@ -0,0 +1,135 @@
+import collections
+import hashlib
+import io
+import os
+
+"""
+Suffix of the file a download is written to until it is complete, kept on failure so it can be resumed.
+"""
+PARTIAL_SUFFIX = '.part'
+
+"""
+Outcome of a download.
+
+:attribute str path: Destination file, ``None`` for file objects without a name.
+:attribute int size: Bytes written, including those of a resumed partial file.
+:attribute str checksum: Hex digest of the whole file, ``None`` without checksum algorithm.
+:attribute bool resumed: Whether part of the file was fetched by an earlier, interrupted download.
+"""
+DownloadResult = collections.namedtuple('DownloadResult', ['path', 'size', 'checksum', 'resumed'])
+
+
+def parse_content_range(value):
+    """
+    :param str value: ``Content-Range`` header, e.g. ``bytes 100-999/1000``.
+    :return: Total size of the file, ``None`` if unknown.
+    :rtype: int
+    """
+    if not value or '/' not in value:
+        return None
+    total = value.rsplit('/', 1)[1].strip()
+    return int(total) if total.isdigit() else None
+
+
+class DownloadTarget(object):
+    """
+    Destination of a streamed download, a path or a writable binary file object.
+
+    Chunks are checksummed as they are written. Paths are written to ``<path>.part`` and renamed once
+    the download is complete; a partial file left by an interrupted download is picked up again so
+    only the missing bytes are requested. File objects are written from their current position, which
+    the download returns to if the server sends the whole file again; a file object that is not
+    seekable cannot start over once bytes were written to it.
+    """
+
+    def __init__(self, destination, checksum='sha256', resume=True, chunk_size=64 * 1024):
+        """
+        :param destination: File path or writable binary file object.
+        :param str checksum: (optional) :module:`hashlib` algorithm, ``None`` to skip the checksum.
+            Default: ``sha256``.
+        :param bool resume: (optional) Continue a partial file of an earlier download. Default: ``True``.
+        :param int chunk_size: (optional) Bytes read at once when checksumming a partial file.
+        """
+        self.algorithm = checksum
+        self.hash = hashlib.new(checksum) if checksum else None
+        self.offset = 0
+        self.resumed = False
+
+        if isinstance(destination, (str, os.PathLike)):
+            self.path = os.fspath(destination)
+            self.partial_path = self.path + PARTIAL_SUFFIX
+            self.owned = True
+            self.start = 0
+            if resume and os.path.exists(self.partial_path):
+                self.file = open(self.partial_path, 'r+b')
+                self.resume(chunk_size)
+            else:
+                self.file = open(self.partial_path, 'wb')
+        else:
+            name = getattr(destination, 'name', None)
+            self.path = name if isinstance(name, str) else None
+            self.partial_path = None
+            self.owned = False
+            self.file = destination
+            self.start = destination.tell() if self.is_seekable(destination) else None
+
+    @staticmethod
+    def is_seekable(file):
+        try:
+            return file.seekable()
+        except (AttributeError, OSError, ValueError):
+            return False
+
+    def resume(self, chunk_size):
+        chunk = self.file.read(chunk_size)
+        while chunk:
+            self.update(chunk)
+            chunk = self.file.read(chunk_size)
+        self.resumed = self.offset > 0
+
+    def update(self, chunk):
+        self.offset += len(chunk)
+        if self.hash is not None:
+            self.hash.update(chunk)
+
+    def write(self, chunk):
+        self.file.write(chunk)
+        self.update(chunk)
+
+    def rewind(self):
+        """
+        Start over, the server sent the whole file rather than the requested range.
+
+        :raises io.UnsupportedOperation: if bytes were already written to a file object that is not seekable.
+        """
+        if self.start is not None:
+            self.file.seek(self.start)
+            self.file.truncate()
+        elif self.offset:
+            raise io.UnsupportedOperation('The download must start over but the destination is not seekable, '
+                                          'download to a path or a seekable file object.')
+        self.hash = hashlib.new(self.algorithm) if self.algorithm else None
+        self.offset = 0
+        self.resumed = False
+
+    @property
+    def checksum(self):
+        return self.hash.hexdigest() if self.hash is not None else None
+
+    def finish(self):
+        """
+        Complete the download, a partial file is moved to its destination.
+
+        :rtype: DownloadResult
+        """
+        if self.owned:
+            self.file.close()
+            os.replace(self.partial_path, self.path)
+        return DownloadResult(self.path, self.offset, self.checksum, self.resumed)
+
+    def close(self):
+        """
+        Close the partial file, leaving it on disk to be resumed.
+        """
+        if self.owned and not self.file.closed:
+            self.file.close()
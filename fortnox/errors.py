@@ -12,8 +12,22 @@ class ConfigurationError(Exception):
 class RateLimitError(Exception):
     """
     Exception raised when the rate limit was exceeded.
+
+    :attribute int http_status: Http status code.
+    :attribute float retry_after: Seconds the server asked to wait before the next request, if it said so.
     """
-    pass
+
+    def __init__(self, retry_after=None, http_status=429):
+        """
+        :param float retry_after: (optional) Seconds to wait, parsed from the ``Retry-After`` header.
+        :param int http_status: (optional) Http status code. Default: **429**.
+        """
+        self.http_status = http_status
+        self.retry_after = retry_after
+        message = 'Rate limit exceeded'
+        if retry_after is not None:
+            message = '{message}, retry after {seconds:.1f} seconds'.format(message=message, seconds=retry_after)
+        super(RateLimitError, self).__init__(message)
 
 
 class BaseError(Exception):
@@ -43,19 +57,19 @@ class BaseError(Exception):
         :param dict errors_payload: Json decoded payload from the errors response.
         """
         self.http_status = http_status
-        self.errors = munchify(errors_payload['ErrorInformation'])
+        self.errors = munchify(errors_payload.get('ErrorInformation', errors_payload))
 
         try:
             error_code = self.errors.Code
         except:
-            error_code = self.errors.code
+            error_code = self.errors.get('code')
 
         self.code = error_code
 
         try:
             error_message = self.errors.Message
         except:
-            error_message = self.errors.message
+            error_message = self.errors.get('message')
 
         message = "\n".join([str(error_message)])
         super(BaseError, self).__init__(message)
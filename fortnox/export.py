@@ -0,0 +1,355 @@
+import collections
+from decimal import Decimal, ROUND_HALF_UP
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from fortnox.coercion import Coercion
+from fortnox.errors import ConfigurationError
+from fortnox.services.helpers import iterate_pages_from_paginators, map_bounded
+
+"""
+Resource that can be exported.
+
+:attribute str service: Name of the service property on :class:`Client <fortnox.Client>`.
+:attribute str path: Sub url of the list endpoint.
+:attribute tuple columns: ``(column, json key, type)`` of the exported fields, the types being
+    ``string``, ``int64``, ``float64``, ``money``, ``price``, ``bool`` or ``date32``. Amounts are
+    ``money``, exact decimals of :data:`MONEY`; unit prices are ``price``, exact decimals of
+    :data:`PRICE` keeping every decimal Fortnox sends.
+:attribute str rows: Key of the nested rows, ``None`` if the resource has none.
+:attribute tuple row_columns: Columns of the child table holding the nested rows.
+:attribute callable detail_url: Returns the sub url and query parameters of a complete record,
+    rows included, from a list item.
+"""
+ExportResource = collections.namedtuple('ExportResource', ['service', 'path', 'columns', 'rows', 'row_columns',
+                                                           'detail_url'])
+
+"""
+Outcome of an export.
+
+:attribute str resource: Name of the resource.
+:attribute int rows: Number of records written.
+:attribute int child_rows: Number of nested rows written, **0** without child table.
+"""
+ExportResult = collections.namedtuple('ExportResult', ['resource', 'rows', 'child_rows'])
+
+RESOURCES = {
+    'invoices': ExportResource('invoices', '/invoices', (
+        ('document_number', 'DocumentNumber', 'string'),
+        ('customer_number', 'CustomerNumber', 'string'),
+        ('customer_name', 'CustomerName', 'string'),
+        ('invoice_date', 'InvoiceDate', 'date32'),
+        ('due_date', 'DueDate', 'date32'),
+        ('currency', 'Currency', 'string'),
+        ('currency_rate', 'CurrencyRate', 'float64'),
+        ('total', 'Total', 'money'),
+        ('balance', 'Balance', 'money'),
+        ('booked', 'Booked', 'bool'),
+        ('cancelled', 'Cancelled', 'bool'),
+        ('sent', 'Sent', 'bool'),
+        ('ocr', 'OCR', 'string'),
+    ), 'InvoiceRows', (
+        ('article_number', 'ArticleNumber', 'string'),
+        ('account_number', 'AccountNumber', 'int64'),
+        ('description', 'Description', 'string'),
+        ('delivered_quantity', 'DeliveredQuantity', 'float64'),
+        ('price', 'Price', 'price'),
+        ('vat', 'VAT', 'float64'),
+        ('total', 'Total', 'money'),
+    ), lambda item: ('/invoices/{0}'.format(item.get('DocumentNumber')), None)),
+    'supplier_invoices': ExportResource('supplier_invoices', '/supplierinvoices', (
+        ('given_number', 'GivenNumber', 'string'),
+        ('supplier_number', 'SupplierNumber', 'string'),
+        ('supplier_name', 'SupplierName', 'string'),
+        ('invoice_number', 'InvoiceNumber', 'string'),
+        ('invoice_date', 'InvoiceDate', 'date32'),
+        ('due_date', 'DueDate', 'date32'),
+        ('currency', 'Currency', 'string'),
+        ('total', 'Total', 'money'),
+        ('balance', 'Balance', 'money'),
+        ('booked', 'Booked', 'bool'),
+        ('cancelled', 'Cancelled', 'bool'),
+    ), 'SupplierInvoiceRows', (
+        ('account', 'Account', 'int64'),
+        ('article_number', 'ArticleNumber', 'string'),
+        ('description', 'ItemDescription', 'string'),
+        ('quantity', 'Quantity', 'float64'),
+        ('price', 'Price', 'price'),
+        ('debit', 'Debit', 'money'),
+        ('credit', 'Credit', 'money'),
+        ('total', 'Total', 'money'),
+    ), lambda item: ('/supplierinvoices/{0}'.format(item.get('GivenNumber')), None)),
+    'vouchers': ExportResource('vouchers', '/vouchers', (
+        ('voucher_series', 'VoucherSeries', 'string'),
+        ('voucher_number', 'VoucherNumber', 'int64'),
+        ('year', 'Year', 'int64'),
+        ('transaction_date', 'TransactionDate', 'date32'),
+        ('description', 'Description', 'string'),
+        ('reference_number', 'ReferenceNumber', 'string'),
+        ('reference_type', 'ReferenceType', 'string'),
+    ), 'VoucherRows', (
+        ('account', 'Account', 'int64'),
+        ('debit', 'Debit', 'money'),
+        ('credit', 'Credit', 'money'),
+        ('quantity', 'Quantity', 'float64'),
+        ('description', 'Description', 'string'),
+        ('transaction_information', 'TransactionInformation', 'string'),
+        ('cost_center', 'CostCenter', 'string'),
+        ('project', 'Project', 'string'),
+        ('removed', 'Removed', 'bool'),
+    ), lambda item: ('/vouchers/{0}/{1}'.format(item.get('VoucherSeries'), item.get('VoucherNumber')),
+                     {'financialyear': item.get('Year')})),
+}
+
+
+"""
+Precision and scale of the ``money`` columns, amounts in kronor and öre.
+"""
+MONEY = (18, 2)
+
+"""
+Precision and scale of the ``price`` columns, unit prices which may have more decimals than amounts.
+"""
+PRICE = (18, 6)
+
+
+def arrow_type(name):
+    if name == 'money':
+        return pyarrow.decimal128(*MONEY)
+    if name == 'price':
+        return pyarrow.decimal128(*PRICE)
+    return {
+        'string': pyarrow.string,
+        'int64': pyarrow.int64,
+        'float64': pyarrow.float64,
+        'bool': pyarrow.bool_,
+        'date32': pyarrow.date32,
+    }[name]()
+
+
+def to_int(value):
+    return int(value) if value not in (None, '') else None
+
+
+def to_float(value):
+    return float(value) if value not in (None, '') else None
+
+
+def to_money(value):
+    if value in (None, ''):
+        return None
+    return Coercion.to_decimal(value).quantize(Decimal(10) ** -MONEY[1], rounding=ROUND_HALF_UP)
+
+
+def to_price(value):
+    # not rounded: a price with more decimals than the column holds fails the export instead
+    return Coercion.to_decimal(value) if value not in (None, '') else None
+
+
+def to_bool(value):
+    if value in (None, ''):
+        return None
+    return value if isinstance(value, bool) else str(value).lower() == 'true'
+
+
+def to_string(value):
+    return str(value) if value not in (None, '') else None
+
+
+COERCIONS = {
+    'string': to_string,
+    'int64': to_int,
+    'float64': to_float,
+    'money': to_money,
+    'price': to_price,
+    'bool': to_bool,
+    'date32': to_string,
+}
+
+
+def schema(columns):
+    """
+    :param tuple columns: ``(column, json key, type)`` of the fields.
+    :rtype: pyarrow.Schema
+    """
+    return pyarrow.schema([(column, arrow_type(type_name)) for column, _, type_name in columns])
+
+
+def record_batch(columns, items, target_schema):
+    """
+    Build a record batch from records in their dictionary form.
+
+    :param tuple columns: ``(column, json key, type)`` of the fields.
+    :param list items: Records.
+    :param pyarrow.Schema target_schema: Schema of the batch.
+    :rtype: pyarrow.RecordBatch
+    """
+    arrays = []
+    for column, key, type_name in columns:
+        coerce = COERCIONS[type_name]
+        values = pyarrow.array([coerce(item.get(key)) for item in items],
+                               type=pyarrow.string() if type_name == 'date32' else arrow_type(type_name))
+        arrays.append(values.cast(pyarrow.date32()) if type_name == 'date32' else values)
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=target_schema)
+
+
+class BatchWriter(object):
+    """
+    Writes record batches one at a time to a Parquet or Feather file.
+    """
+
+    FORMATS = ('parquet', 'feather')
+
+    def __init__(self, path, target_schema, format='parquet'):
+        """
+        :param str path: Destination file.
+        :param pyarrow.Schema target_schema: Schema of every batch.
+        :param str format: (optional) ``parquet`` or ``feather``. Default: ``parquet``.
+        """
+        if format == 'parquet':
+            self.writer = pyarrow.parquet.ParquetWriter(path, target_schema)
+        elif format == 'feather':
+            self.writer = pyarrow.ipc.new_file(path, target_schema)
+        else:
+            raise ConfigurationError('Provided export format is invalid '
+                                     'as it must be one of: {formats}.'.format(formats=', '.join(self.FORMATS)))
+
+    def write(self, batch):
+        if batch.num_rows:
+            self.writer.write_batch(batch)
+
+    def close(self):
+        self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class ArrowExporter(object):
+    """
+    Streams list endpoints into Arrow record batches and columnar files.
+
+    Every page becomes one record batch with the fixed schema of its resource and is written before
+    the next page is requested, so memory stays bounded by a page whatever the size of the dump.
+    Nested rows, which list responses do not include, go to a child table keyed by their parent;
+    they are retrieved concurrently on the http client's worker pool, one page of records at a time.
+
+    Usage::
+
+      >>> exporter = fortnox.ArrowExporter(client)
+      >>> exporter.export('vouchers', 'vouchers.parquet', rows_path='voucher_rows.parquet', financialyear=1)
+    """
+
+    RESOURCES = RESOURCES
+
+    def __init__(self, client, page_size=500):
+        """
+        :param :class:`fortnox.Client` client: Client the records are fetched with.
+        :param int page_size: (optional) Records requested per page. Default: **500**.
+        :raises ConfigurationError: if :module:`pyarrow` is not installed.
+        """
+        if pyarrow is None:
+            raise ConfigurationError('ArrowExporter requires pyarrow. '
+                                     'Install it using: "pip install pyfortnox[export]"')
+        self.client = client
+        self.page_size = page_size
+
+    def resource(self, name):
+        try:
+            return self.RESOURCES[name]
+        except KeyError:
+            raise ConfigurationError('Unknown export resource {name}, '
+                                     'known resources are: {known}.'.format(name=name,
+                                                                            known=', '.join(sorted(self.RESOURCES))))
+
+    def schemas(self, name):
+        """
+        :param str name: Name of the resource.
+        :return: Schema of the records and schema of the child table.
+        :rtype: tuple
+        """
+        resource = self.resource(name)
+        return schema(resource.columns), schema(self.row_columns(resource))
+
+    @staticmethod
+    def parent_columns(resource):
+        return tuple((column, key, type_name) for column, key, type_name in resource.columns
+                     if key in ('DocumentNumber', 'GivenNumber', 'VoucherSeries', 'VoucherNumber', 'Year'))
+
+    def row_columns(self, resource):
+        return self.parent_columns(resource) + (('row_index', 'row_index', 'int64'),) + resource.row_columns
+
+    def retrieve_details(self, resource, items):
+        http_client = self.client.http_client
+
+        def fetch(item):
+            url, params = resource.detail_url(item)
+            return http_client.get(url, params=params)[2]
+
+        return map_bounded(http_client.executor, fetch, items, http_client.config.max_workers)
+
+    def iter_batches(self, name, with_rows=False, **params):
+        """
+        Iterate over the record batches of a resource, one per page.
+
+        :param str name: Name of the resource, e.g. ``vouchers``.
+        :param bool with_rows: (optional) Retrieve the nested rows as well. Default: ``False``.
+        :param dict params: (optional) Search options.
+        :return: Generator of (record batch, child record batch) tuples, the child batch being
+            ``None`` without ``with_rows``.
+        :rtype: generator
+        """
+        resource = self.resource(name)
+        record_schema, row_schema = self.schemas(name)
+        parent_columns = self.parent_columns(resource)
+        row_columns = self.row_columns(resource)
+
+        service = getattr(self.client, resource.service)
+        params = dict(params, limit=self.page_size)
+        for _, items in iterate_pages_from_paginators(service, params, resource.path):
+            rows = None
+            if with_rows:
+                details = list(self.retrieve_details(resource, items))
+                children = []
+                for item in details:
+                    parent = dict((key, item.get(key)) for _, key, _ in parent_columns)
+                    for index, row in enumerate(item.get(resource.rows) or []):
+                        children.append(dict(row, row_index=index, **parent))
+                rows = record_batch(row_columns, children, row_schema)
+            yield record_batch(resource.columns, items, record_schema), rows
+
+    def export(self, name, path, format='parquet', rows_path=None, **params):
+        """
+        Export every record of a resource to a columnar file.
+
+        :param str name: Name of the resource, e.g. ``invoices``.
+        :param str path: Destination of the records.
+        :param str format: (optional) ``parquet`` or ``feather``. Default: ``parquet``.
+        :param str rows_path: (optional) Destination of the child table of nested rows,
+            rows are not exported without it.
+        :param dict params: (optional) Search options.
+        :rtype: ExportResult
+        """
+        record_schema, row_schema = self.schemas(name)
+        count = child_count = 0
+        with BatchWriter(path, record_schema, format) as writer:
+            row_writer = BatchWriter(rows_path, row_schema, format) if rows_path else None
+            try:
+                for batch, rows in self.iter_batches(name, with_rows=row_writer is not None, **params):
+                    writer.write(batch)
+                    count += batch.num_rows
+                    if rows is not None:
+                        row_writer.write(rows)
+                        child_count += rows.num_rows
+            finally:
+                if row_writer is not None:
+                    row_writer.close()
+        return ExportResult(name, count, child_count)
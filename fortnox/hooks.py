@@ -0,0 +1,143 @@
+import collections
+import functools
+
+from fortnox.errors import ConfigurationError
+
+"""
+Details of an attempt passed to the ``before_request`` hook.
+
+:attribute str method: Http method of the request.
+:attribute str url: Full url of the request.
+:attribute str endpoint: Sub url with identifiers replaced by ``{id}``, e.g. ``/invoices/{id}``.
+:attribute int attempt: Number of the attempt, starting at **1**.
+:attribute dict headers: Headers sent, may be changed by the hook.
+"""
+RequestEvent = collections.namedtuple('RequestEvent', ['method', 'url', 'endpoint', 'attempt', 'headers'])
+
+"""
+Details of a successful request passed to the ``after_response`` hook.
+
+:attribute str method: Http method of the request.
+:attribute str url: Full url of the request.
+:attribute str endpoint: Sub url with identifiers replaced by ``{id}``.
+:attribute int status: Http status of the response.
+:attribute int attempts: Attempts made, retries included.
+:attribute float elapsed: Seconds from the first attempt to the decoded response.
+:attribute float network_time: Seconds spent sending requests and receiving responses.
+:attribute float decode_time: Seconds spent decoding the response body.
+:attribute float rate_limit_wait: Seconds spent waiting for the rate limiter.
+:attribute int bytes_sent: Size of the request body.
+:attribute int bytes_received: Size of the response body.
+:attribute bool cached: Whether the response was served from the response cache.
+"""
+ResponseEvent = collections.namedtuple('ResponseEvent', ['method', 'url', 'endpoint', 'status', 'attempts', 'elapsed',
+                                                         'network_time', 'decode_time', 'rate_limit_wait',
+                                                         'bytes_sent', 'bytes_received', 'cached'])
+
+"""
+Details of a failed request passed to the ``on_error`` hook, once retries gave up.
+
+:attribute str method: Http method of the request.
+:attribute str url: Full url of the request.
+:attribute str endpoint: Sub url with identifiers replaced by ``{id}``.
+:attribute int status: Http status of the last response, ``None`` for connection errors.
+:attribute int attempts: Attempts made, retries included.
+:attribute float elapsed: Seconds from the first attempt to the error.
+:attribute Exception error: Error raised to the caller.
+"""
+ErrorEvent = collections.namedtuple('ErrorEvent', ['method', 'url', 'endpoint', 'status', 'attempts', 'elapsed',
+                                                   'error'])
+
+"""
+Segments following the resource of a sub url which are actions, sub resources or fixed folders
+of the api rather than identifiers, e.g. ``bookkeep`` in ``/invoices/{id}/bookkeep``.
+"""
+LITERAL_SEGMENTS = frozenset([
+    # actions
+    'bookkeep', 'cancel', 'credit', 'createinvoice', 'createorder', 'depreciate', 'einvoice', 'email', 'eprint',
+    'externalprint', 'finish', 'increaseinvoicecount', 'preview', 'print', 'printreminder', 'resetday', 'scrap',
+    'sell', 'warehouseready', 'writedown', 'writeup',
+    # sub resources
+    'company', 'depreciations', 'lockedperiod', 'sublist', 'trusted', 'types',
+    # inbox folders
+    'inbox_a', 'inbox_b', 'inbox_d', 'inbox_kf', 'inbox_l', 'inbox_o', 'inbox_of', 'inbox_s', 'inbox_v',
+])
+
+
+def endpoint_template(path):
+    """
+    Replace the identifiers of a sub url by ``{id}`` so that requests to the same endpoint share metrics.
+
+    The first segment names the resource, later segments listed in ``LITERAL_SEGMENTS`` are kept and
+    anything else, e.g. ``123``, the ``A`` of a voucher series or the name of an archive folder, is an
+    identifier. Metrics labelled by template therefore have a bounded number of series.
+
+    :param str path: Sub url, with or without query string.
+    :rtype: str
+    """
+    segments = path.split('?', 1)[0].strip('/').split('/')
+    return '/' + '/'.join(segment if index == 0 or segment in LITERAL_SEGMENTS else '{id}'
+                          for index, segment in enumerate(segments))
+
+
+class Hooks(object):
+    """
+    Callbacks run by the http clients around every request.
+
+    ``before_request`` gets a :class:`RequestEvent` before every attempt, ``after_response`` a
+    :class:`ResponseEvent` once a request succeeded, ``on_error`` an :class:`ErrorEvent` once it
+    failed for good and ``on_retry`` a :class:`RetryEvent <fortnox.RetryEvent>` before every retry.
+    Hooks run on the thread sending the request and must not raise.
+
+    Usage::
+
+      >>> hooks = fortnox.Hooks()
+      >>> hooks.register('after_response', lambda event: print(event.endpoint, event.elapsed))
+      >>> client = fortnox.Client(access_token='...', client_secret='...', hooks=hooks)
+    """
+
+    EVENTS = ('before_request', 'after_response', 'on_error', 'on_retry')
+
+    def __init__(self, *listeners):
+        """
+        :param tuple *listeners: (optional) Objects whose ``before_request``, ``after_response``,
+            ``on_error`` and ``on_retry`` methods, where defined, are registered.
+        """
+        self.callbacks = dict((event, []) for event in self.EVENTS)
+        for listener in listeners:
+            self.add(listener)
+
+    def register(self, event, callback):
+        """
+        :param str event: Name of the event.
+        :param callable callback: Called with the details of the event.
+        :raises ConfigurationError: if the event is unknown.
+        """
+        if event not in self.callbacks:
+            raise ConfigurationError('Unknown hook {event}, '
+                                     'known hooks are: {known}.'.format(event=event, known=', '.join(self.EVENTS)))
+        self.callbacks[event].append(callback)
+
+    def unregister(self, event, callback):
+        self.callbacks[event].remove(callback)
+
+    def add(self, listener):
+        """
+        Register the methods of a listener named after the events, e.g. a :class:`MetricsCollector
+        <fortnox.MetricsCollector>`. Events are forwarded to another :class:`Hooks`, including to
+        callbacks it registers later.
+        """
+        for event in self.EVENTS:
+            if isinstance(listener, Hooks):
+                self.register(event, functools.partial(listener.emit, event))
+                continue
+            callback = getattr(listener, event, None)
+            if callback is not None:
+                self.register(event, callback)
+
+    def emit(self, event, details):
+        for callback in self.callbacks[event]:
+            callback(details)
+
+    def __bool__(self):
+        return any(self.callbacks.values())
@@ -1,11 +1,28 @@
+import collections
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 import requests
 from munch import munchify
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from requests_toolbelt import MultipartEncoder
 
+from fortnox.coalescing import SingleFlight
+from fortnox.decoders import Decoder
+from fortnox.downloads import DownloadTarget, parse_content_range
 from fortnox.errors import ResourceError, RateLimitError, RequestError, ServerError
+from fortnox.hooks import ErrorEvent, Hooks, RequestEvent, ResponseEvent, endpoint_template
+from fortnox.rate_limiter import RateLimiter
+from fortnox.retry import RetryEvent, parse_retry_after
+from fortnox.tracing import (
+    ENDPOINT_ATTRIBUTE, ITEM_COUNT_ATTRIBUTE, METHOD_ATTRIBUTE, PAGE_ATTRIBUTE, STATUS_ATTRIBUTE, URL_ATTRIBUTE,
+    item_count
+)
+from fortnox.uploads import DEFAULT_CHUNK_SIZE, UploadBody
 
 
 class DecimalEncoder(json.JSONEncoder):
@@ -15,9 +32,10 @@ class DecimalEncoder(json.JSONEncoder):
         super(DecimalEncoder, self).default(o)
 
 
-class HttpClient(object):
+class BaseHttpClient(object):
     """
-    Wrapper over :module:`requests` that understands Base CRM envelope, encoding and decoding schema.
+    Transport independent part of the http clients: url and header building,
+    envelope encoding and decoding, and error handling.
     """
 
     """
@@ -32,16 +50,452 @@ class HttpClient(object):
 
         self.config = config
 
+        self.rate_limiter = config.rate_limiter
+        if self.rate_limiter is None and config.rate_limit:
+            self.rate_limiter = RateLimiter(config.rate_limit, config.rate_limit_burst)
+
+        self.retry_policy = config.retry_policy
+
+        self.decoder = config.decoder
+        if self.decoder is None:
+            self.decoder = Decoder(config.decode_mode, config.json_backend)
+
+        self.cache = config.cache
+        self.http_cache = config.http_cache
+        self.decoded_responses = collections.OrderedDict()
+        self.decoded_lock = threading.Lock()
+
+        self.hooks = Hooks(*[listener for listener in (config.hooks, config.metrics) if listener is not None])
+        self.tracer = config.tracer
+
+    @property
+    def rate_limit_key(self):
+        """
+        Key of the quota requests are counted against, the access token or the authorization code.
+        """
+        return self.config.access_token or getattr(self.config, 'authorization_code', None)
+
+    def build_url(self, url):
+        """
+        Prefix a sub URL with the base url and the api version.
+
+        :param str url: Sub URL for the request.
+        :rtype: str
+        """
+        return "{base_url}{version}{resource}".format(base_url=self.config.base_url,
+                                                      version=self.API_VERSION,
+                                                      resource=url)
+
+    def build_headers(self, params=None, user_headers=None):
+        """
+        Build the authentication headers for a request.
+
+        A ``service`` query parameter set to ``AccessToken`` is consumed and switches
+        the request to the authorization code flow.
+
+        :param dict params: (optional) Dictionary of query parameters.
+        :param dict user_headers: (optional) Headers that override the defaults.
+        :rtype: dict
+        """
+        need_to_obtain_access_token = False
+        try:
+            if 'service' in params.keys():
+                key = params.get('service')
+                if key == "AccessToken":
+                    need_to_obtain_access_token = True
+                    params.pop('service')
+        except:
+            pass
+
+        if not need_to_obtain_access_token:
+            headers = {
+                'Accept': 'application/json',
+                'Content-Type': 'application/json',
+                'Access-Token': "{access_token}".format(access_token=self.config.access_token),
+                'Client-Secret': "{client_secret}".format(client_secret=self.config.client_secret)
+            }
+        else:
+            headers = {
+                'Authorization-Code': "{authorization_code}".format(authorization_code=self.config.authorization_code),
+                'Client-Secret': "{client_secret}".format(client_secret=self.config.client_secret)
+            }
+
+        if not self.config.keep_alive:
+            headers['Connection'] = 'close'
+
+        if isinstance(user_headers, dict):
+            headers.update(user_headers)
+        return headers
+
+    def encode_body(self, body, headers):
+        """
+        Encode a request body, either as a streamed multipart file upload or as a json envelope.
+
+        A ``file`` may be a path, an open binary file, bytes or an iterator of bytes chunks, along
+        with an optional ``file_name``, ``chunk_size`` and ``progress`` callback.
+
+        :param dict body: Dictionary of body attributes, may be ``None``.
+        :param dict headers: Request headers, updated in place for file uploads.
+        :return: Encoded body.
+        """
+        if body:
+            # payload = body if raw else self.wrap_envelope(body)
+            if 'file' in body:
+                # if endpoint contains file, stream it from a path, file object, bytes or iterator
+                file = UploadBody(body.get('file'),
+                                  file_name=body.pop('file_name', None),
+                                  chunk_size=body.pop('chunk_size', None) or DEFAULT_CHUNK_SIZE,
+                                  progress=body.pop('progress', None))
+                headers['Content-Type'] = file.content_type
+                headers['Accept'] = '*/*'
+                body = file
+            else:
+                body = json.dumps(self.wrap_envelope(body), cls=DecimalEncoder)
+        return body
+
+    def decode_body(self, headers, content, raw=False, data=None):
+        """
+        Decode a response body.
+
+        Json bodies are unwrapped from their envelope (unless ``raw``) and converted by the
+        configured :class:`Decoder <fortnox.decoders.Decoder>`, anything else is returned as bytes.
+
+        :param dict headers: Response headers.
+        :param bytes content: Response body.
+        :param bool raw: Whether to keep the envelope.
+        :param data: (optional) Json document parsed from ``content`` before, it is not parsed again.
+        """
+        content_type = headers.get('Content-Type', None)
+        if content_type and 'json' in content_type:
+            if data is None:
+                data = self.decoder.loads(content) if content else None
+            return self.decoder.convert(data) if raw else self.unwrap_envelope(data, self.decoder.convert)
+        return bytes(content) if isinstance(content, memoryview) else content
+
+    def decode_response(self, headers, content, raw=False, data=None):
+        """
+        Decode a response body within a ``decode`` span when a tracer is configured.
+        """
+        if self.tracer is None:
+            return self.decode_body(headers, content, raw, data)
+        with self.tracer.start_as_current_span('decode', attributes={'fortnox.bytes': len(content)}):
+            return self.decode_body(headers, content, raw, data)
+
+    def http_span(self, method, url, params=None):
+        """
+        :param str method: Http method.
+        :param str url: Sub URL of the request.
+        :param dict params: (optional) Dictionary of query parameters.
+        :return: Name and attributes of the span of a request, e.g. ``GET /invoices/{id}``.
+        :rtype: tuple
+        """
+        endpoint = endpoint_template(url)
+        attributes = {
+            METHOD_ATTRIBUTE: method.upper(),
+            URL_ATTRIBUTE: self.build_url(url),
+            ENDPOINT_ATTRIBUTE: endpoint,
+        }
+        if params and params.get('page') is not None:
+            attributes[PAGE_ATTRIBUTE] = params['page']
+        return '{method} {endpoint}'.format(method=method.upper(), endpoint=endpoint), attributes
+
+    @staticmethod
+    def end_http_span(span, response=None, error=None):
+        """
+        Set the status and the item count of a response, or the status of an error, on its span.
+        """
+        if error is not None:
+            if getattr(error, 'http_status', None) is not None:
+                span.set_attribute(STATUS_ATTRIBUTE, error.http_status)
+            return
+        span.set_attribute(STATUS_ATTRIBUTE, response[0])
+        count = item_count(response[2])
+        if count is not None:
+            span.set_attribute(ITEM_COUNT_ATTRIBUTE, count)
+
+    def cached_response(self, method, url, params=None, raw=False):
+        """
+        Serve a GET request from the response cache.
+
+        :param str method: Http method.
+        :param str url: Sub URL of the request.
+        :param dict params: (optional) Dictionary of query parameters.
+        :param bool raw: (optional) Whether to keep the envelope.
+        :return: Tuple of (http status code, headers, decoded body), ``None`` on a cache miss.
+        :rtype: tuple
+        """
+        if self.cache is None or method.lower() != 'get':
+            return None
+        entry = self.cache.get(self.rate_limit_key, url, params)
+        if entry is None:
+            return None
+        headers = CaseInsensitiveDict(entry.headers)
+        return (entry.status, headers, self.decode_response(headers, entry.content, raw))
+
+    def cache_response(self, method, url, params, status, headers, content, revalidated=False):
+        """
+        Store the response of a successful GET request, or invalidate the resource after a write.
+
+        A response revalidated by the http cache is already stored there.
+        """
+        if method.lower() != 'get':
+            for cache in (self.cache, self.http_cache):
+                if cache is not None:
+                    cache.invalidate(self.rate_limit_key, url)
+            return
+        if self.cache is not None:
+            self.cache.set(self.rate_limit_key, url, params, status, headers, content)
+        if self.http_cache is not None and not revalidated:
+            self.http_cache.set(self.rate_limit_key, url, params, status, headers, content)
+
+    def validated_response(self, method, url, params=None):
+        """
+        :return: Response of the http cache a GET request is revalidated against, ``None`` if there is none.
+        :rtype: CacheEntry
+        """
+        if self.http_cache is None or method.lower() != 'get':
+            return None
+        return self.http_cache.get(self.rate_limit_key, url, params)
+
+    def decode_cached(self, url, params, headers, content, raw=False):
+        """
+        Decode a response of a resource of the http cache, reusing the json document parsed last
+        time for the same request when the body did not change.
+
+        Only the parsed document is kept, never the objects made from it: it is converted again on
+        every call, so each caller gets objects of its own. In ``dict`` mode the converted objects
+        would be the kept document itself, the body is therefore always parsed again.
+        """
+        content_type = headers.get('Content-Type', None)
+        if self.decoder.mode == 'dict' or not content or not (content_type and 'json' in content_type):
+            return self.decode_response(headers, content, raw)
+
+        key = self.http_cache.key(self.rate_limit_key, url, params)
+        digest = self.http_cache.digest(content)
+        data = None
+        with self.decoded_lock:
+            parsed = self.decoded_responses.get(key)
+            if parsed is not None and parsed[0] == digest:
+                self.decoded_responses.move_to_end(key)
+                data = parsed[1]
+
+        if data is None:
+            data = self.decoder.loads(content)
+            with self.decoded_lock:
+                self.decoded_responses[key] = (digest, data)
+                self.decoded_responses.move_to_end(key)
+                while len(self.decoded_responses) > self.http_cache.max_decoded:
+                    self.decoded_responses.popitem(last=False)
+        return self.decode_response(headers, content, raw, data)
+
+    def is_retryable_body(self, body):
+        """
+        Whether an encoded body can be sent again, streamed file uploads only when they can be
+        read again from the start.
+        """
+        if isinstance(body, UploadBody):
+            return body.is_rewindable
+        return not isinstance(body, MultipartEncoder)
+
+    @staticmethod
+    def body_size(body):
+        """
+        Size in bytes of an encoded request body.
+        """
+        if body is None:
+            return 0
+        if isinstance(body, str):
+            return len(body.encode('utf-8'))
+        return len(body)
+
+    def retry_delay(self, method, url, attempt, status=None, error=None, sent=True, retry_after=None):
+        """
+        Ask the retry policy whether a failed attempt is retried and report the retry.
+
+        :return: Seconds to wait before the next attempt, or ``None`` if the error must be raised.
+        :rtype: float
+        """
+        if self.retry_policy is None:
+            return None
+        delay = self.retry_policy.get_delay(method, attempt, status=status, error=error,
+                                            sent=sent, retry_after=retry_after)
+        if delay is not None:
+            event = RetryEvent(method, url, attempt, delay, status, error)
+            self.retry_policy.notify(event)
+            if self.hooks:
+                self.hooks.emit('on_retry', event)
+        return delay
+
+    def handle_error_response(self, resp):
+        try:
+            errors = resp.json()
+        except ValueError:
+            errors = None
+        if not isinstance(errors, dict):
+            errors = {'ErrorInformation': {'code': None, 'message': resp.text}}
+
+        resp_code = resp.status_code
+        if resp_code == 422:
+            raise ResourceError(resp_code, errors)
+        elif resp_code == 429:
+            raise RateLimitError(retry_after=parse_retry_after(resp.headers.get('Retry-After')))
+        elif 400 <= resp_code < 500:
+            raise RequestError(resp_code, errors)
+        elif 500 <= resp_code < 600:
+            raise ServerError(resp_code, errors)
+        else:
+            raise Exception('Unknown HTTP error response')
+
+    @staticmethod
+    def wrap_envelope(body):
+        key = 'data'
+        if 'service' in body.keys():
+            key = body.get('service')
+            body.pop('service')
+        return {key: body}
+
+    @staticmethod
+    def unwrap_envelope(body, convert=munchify):
+        if not body or body == '':
+            # Sometimes response body returns nothing from Fortnox API
+            return True
+        keys = [key for key in body.keys()]
+        return [convert(item) for item in body.get(keys[1])] if len(keys) > 1 else convert(body.get(keys[0]))
+
+
+class HttpClient(BaseHttpClient):
+    """
+    Wrapper over :module:`requests` that understands Base CRM envelope, encoding and decoding schema.
+    """
+
+    def __init__(self, config):
+        """
+        :param :class:`fortnox.Configuration` config: Base CRM client configuration.
+        """
+
+        super(HttpClient, self).__init__(config)
+
+        # a session or worker pool given by the configuration is shared with other clients, never closed here
+        self.__session = config.session
+        self.__owns_session = config.session is None
+        self.__session_lock = threading.Lock()
+        self.__last_used = None
+        self.__executor = config.executor
+        self.__owns_executor = config.executor is None
+
+        self.single_flight = SingleFlight() if config.coalesce_requests else None
+
         # if self.config.verbose:
         #     self.enable_logging()
 
+    @property
+    def session(self):
+        """
+        Long-lived :class:`requests.Session` whose connection pool is shared by every service.
+
+        The session is created on first use and recreated if the client was closed, unless
+        a shared ``session`` was configured.
+        """
+        if self.__session is None:
+            with self.__session_lock:
+                if self.__session is None:
+                    self.__session = self.build_session()
+        return self.__session
+
+    @property
+    def executor(self):
+        """
+        Worker pool of ``max_workers`` threads shared by the services for concurrent requests.
+
+        The pool is created on first use and shut down by :meth:`close`, unless a shared
+        ``executor`` was configured.
+        """
+        if self.__executor is None:
+            with self.__session_lock:
+                if self.__executor is None:
+                    self.__executor = ThreadPoolExecutor(max_workers=self.config.max_workers,
+                                                         thread_name_prefix='fortnox')
+        return self.__executor
+
+    def build_session(self):
+        """
+        Build a :class:`requests.Session` with a connection pool sized from the configuration.
+
+        :return: Session with pooled adapters mounted for both http and https.
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.config.pool_connections,
+                              pool_maxsize=self.config.pool_maxsize,
+                              pool_block=self.config.pool_block)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def send(self, method, url, **kwargs):
+        """
+        Send a single attempt of a request through the pooled session.
+
+        :param str method: Http method.
+        :param str url: Full url.
+        :param dict **kwargs: Parameters passed to :meth:`requests.Session.request`.
+        :rtype: requests.Response
+        """
+        self.evict_idle_connections()
+        self.__last_used = time.monotonic()
+        try:
+            return self.session.request(method, url, timeout=float(self.config.timeout), **kwargs)
+        finally:
+            self.__last_used = time.monotonic()
+
+    def evict_idle_connections(self):
+        """
+        Close pooled connections if the client has not been used for ``pool_idle_timeout`` seconds.
+
+        The session itself stays usable, new connections are opened on demand.
+
+        :return: True if connections were evicted.
+        :rtype: bool
+        """
+        idle_timeout = self.config.pool_idle_timeout
+        if idle_timeout is None or not self.__owns_session or self.__session is None or self.__last_used is None:
+            return False
+        if time.monotonic() - self.__last_used < idle_timeout:
+            return False
+        for adapter in self.__session.adapters.values():
+            adapter.close()
+        return True
+
+    def close(self):
+        """
+        Close the underlying session and release every pooled connection and worker thread.
+
+        A shared session or worker pool is left open for the other clients using it.
+        """
+        session = executor = None
+        with self.__session_lock:
+            if self.__owns_session:
+                session, self.__session = self.__session, None
+            if self.__owns_executor:
+                executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if session is not None:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def get(self, url, params=None, **kwargs):
         """
         Send a GET request.
 
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict params: (optional) Dictionary of query parameters.
-        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`requests.request`.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :meth:`requests.Session.request`.
         :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
         :rtype: tuple
         """
@@ -54,7 +508,7 @@ class HttpClient(object):
 
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
-        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`requests.request`.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :meth:`requests.Session.request`.
         :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
         :rtype: tuple
         """
@@ -67,7 +521,7 @@ class HttpClient(object):
 
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
-        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`requests.request`.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :meth:`requests.Session.request`.
         :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
         :rtype: tuple
         """
@@ -80,7 +534,7 @@ class HttpClient(object):
 
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict params: (optional) Dictionary of query parameters.
-        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`requests.request`.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :meth:`requests.Session.request`.
         :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
         :rtype: tuple
         """
@@ -95,17 +549,20 @@ class HttpClient(object):
         will be wrapped with envelope the API expects and json encoded.
 
         When you get a response the method will try to json decode the response,
-        if the media type represents json, unwrap the envelope and munchify what has left,
-        for JavaScript like access.
+        if the media type represents json, unwrap the envelope and convert what has left
+        with the configured decoder, by default munchified for JavaScript like access.
+        A ``304 Not Modified`` answering validators passed in the headers, e.g. ``If-None-Match``,
+        is returned with a ``None`` response.
 
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict params: (optional) Dictionary of query parameters.
         :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
-        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`requests.request`.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :meth:`requests.Session.request`.
         :raises RequestError: if authentication failed, invalid query parameter etc.
-        :raises RateLimitError: if rate limit exceeded.
+        :raises RateLimitError: if rate limit exceeded and the retry policy gave up.
         :raises ResourceError: if requests payload included invalid attributes or were missing.
-        :raises ServerError: if Base CRM backend servers encounterered an unexpected condition.
+        :raises ServerError: if Base CRM backend servers encounterered an unexpected condition
+            and the retry policy gave up.
         :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
         :rtype: tuple
 
@@ -114,107 +571,234 @@ class HttpClient(object):
             * :param bool raw: (optional) Whether to wrap and uwrap the envelope. Default: ``False``.
         """
 
-        url = "{base_url}{version}{resource}".format(base_url=self.config.base_url,
-                                                     version=self.API_VERSION,
-                                                     resource=url)
+        if self.single_flight is not None and method.lower() == 'get' and 'headers' not in kwargs:
+            # identical GETs in flight share one request, and the very same decoded response
+            key = self.single_flight.key(method, url, params, self.rate_limit_key, bool(kwargs.get('raw')))
+            response, _ = self.single_flight.do(key, lambda: self.trace_request(method, url, params, body, **kwargs))
+            return response
+        return self.trace_request(method, url, params, body, **kwargs)
 
-        need_to_obtain_access_token = False
-        try:
-            if 'service' in params.keys():
-                key = params.get('service')
-                if key == "AccessToken":
-                    need_to_obtain_access_token = True
-                    params.pop('service')
-        except:
-            pass
+    def trace_request(self, method, url, params=None, body=None, **kwargs):
+        """
+        Send an HTTP request within an http span when a tracer is configured, see :meth:`request`.
+        """
 
-        if not need_to_obtain_access_token:
-            headers = {
-                'Accept': 'application/json',
-                'Content-Type': 'application/json',
-                'Access-Token': "{access_token}".format(access_token=self.config.access_token),
-                'Client-Secret': "{client_secret}".format(client_secret=self.config.client_secret)
-            }
-        else:
-            headers = {
-                'Authorization-Code': "{authorization_code}".format(authorization_code=self.config.authorization_code),
-                'Client-Secret': "{client_secret}".format(client_secret=self.config.client_secret)
-            }
+        if self.tracer is None:
+            return self.send_request(method, url, params, body, **kwargs)
 
-        user_headers = {}
-        if 'headers' in kwargs and isinstance(kwargs['headers'], dict):
-            user_headers = kwargs['headers']
+        name, attributes = self.http_span(method, url, params)
+        with self.tracer.start_as_current_span(name, attributes=attributes) as span:
+            try:
+                response = self.send_request(method, url, params, body, **kwargs)
+            except Exception as e:
+                self.end_http_span(span, error=e)
+                raise
+            self.end_http_span(span, response)
+            return response
 
-        headers.update(user_headers)
+    def send_request(self, method, url, params=None, body=None, **kwargs):
+        """
+        Send an HTTP request, retries included, see :meth:`request`.
+        """
 
+        started = time.perf_counter()
+        path = url
+        url = self.build_url(url)
+        headers = self.build_headers(params, kwargs.get('headers'))
         raw = bool(kwargs['raw']) if 'raw' in kwargs else False
+        endpoint = endpoint_template(path) if self.hooks else None
 
-        if body:
-            # payload = body if raw else self.wrap_envelope(body)
-            if 'file' in body:
-                # if endpoint contains file
-                sent_file = body.get('file')
-                file_name = body.pop('file_name')
-                file = MultipartEncoder(
-                    fields={
-                        'file': (file_name, sent_file, 'application/octet-stream')
-                    }
-                )
-                headers['Content-Type'] = file.content_type
-                headers['Accept'] = '*/*'
-                body = file
-            else:
-                body = json.dumps(self.wrap_envelope(body), cls=DecimalEncoder)
-        resp = requests.request(method, url,
-                                params=params,
-                                data=body,
-                                headers=headers,
-                                timeout=float(self.config.timeout),
-                                )
-        if not (200 <= resp.status_code < 300):
-            self.handle_error_response(resp)
-
-        response_headers = resp.headers
-        if response_headers.get('Content-Type', None) and 'json' in response_headers.get('Content-Type', None):
-            resp_body = munchify(resp.json()) if raw else self.unwrap_envelope(resp.json())
-        else:
-            resp_body = resp.content
+        cached = self.cached_response(method, path, params, raw)
+        if cached is not None:
+            if self.hooks:
+                elapsed = time.perf_counter() - started
+                self.hooks.emit('after_response', ResponseEvent(method, url, endpoint, cached[0], 0, elapsed,
+                                                                0.0, elapsed, 0.0, 0, 0, True))
+            return cached
 
-        return (resp.status_code, resp.headers, resp_body)
+        validated = self.validated_response(method, path, params)
+        if validated is not None:
+            headers.update(self.http_cache.conditional_headers(validated))
 
-    def handle_error_response(self, resp):
-        try:
-            errors = resp.json()
-        except ValueError:
-            errors = {'errors': [], 'meta': {'logref': ''}}
+        body = self.encode_body(body, headers)
 
-        resp_code = resp.status_code
-        if resp_code == 422:
-            raise ResourceError(resp_code, errors)
-        elif resp_code == 429:
-            raise RateLimitError()
-        elif 400 <= resp_code < 500:
-            raise RequestError(resp_code, errors)
-        elif 500 <= resp_code < 600:
-            raise ServerError(resp_code, errors)
+        retryable = self.is_retryable_body(body)
+        network_time = rate_limit_wait = 0.0
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                if self.rate_limiter is not None:
+                    rate_limit_wait += self.rate_limiter.acquire(self.rate_limit_key)
+                if self.hooks:
+                    self.hooks.emit('before_request', RequestEvent(method, url, endpoint, attempt, headers))
+                if attempt > 1 and isinstance(body, UploadBody):
+                    body.rewind()
+
+                sent_at = time.perf_counter()
+                try:
+                    resp = self.send(method, url, params=params, data=body, headers=headers)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    sent = not isinstance(e, requests.ConnectTimeout)
+                    delay = self.retry_delay(method, url, attempt, error=e, sent=sent) if retryable else None
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    continue
+                finally:
+                    network_time += time.perf_counter() - sent_at
+
+                if not (200 <= resp.status_code < 300) and resp.status_code != 304:
+                    try:
+                        self.handle_error_response(resp)
+                    except (RateLimitError, ServerError) as e:
+                        delay = None
+                        if retryable:
+                            delay = self.retry_delay(method, url, attempt, status=resp.status_code, error=e,
+                                                     retry_after=parse_retry_after(resp.headers.get('Retry-After')))
+                        if delay is None:
+                            raise
+                        time.sleep(delay)
+                        continue
+                break
+        except Exception as e:
+            if self.hooks:
+                self.hooks.emit('on_error', ErrorEvent(method, url, endpoint, getattr(e, 'http_status', None),
+                                                       attempt, time.perf_counter() - started, e))
+            raise
+
+        status, resp_headers, content = resp.status_code, resp.headers, resp.content
+        revalidated = status == 304 and validated is not None
+        if revalidated:
+            status, resp_headers, content = validated.status, CaseInsensitiveDict(validated.headers), validated.content
+        if status != 304:
+            self.cache_response(method, path, params, status, resp_headers, content, revalidated)
+
+        decode_started = time.perf_counter()
+        if status == 304:
+            # not modified since the validators sent by the caller itself, e.g. its own If-None-Match
+            resp_body = None
+        elif self.http_cache is not None and method.lower() == 'get' and self.http_cache.is_cached(path):
+            resp_body = self.decode_cached(path, params, resp_headers, content, raw)
         else:
-            raise Exception('Unknown HTTP error response')
+            resp_body = self.decode_response(resp_headers, content, raw)
+        if self.hooks:
+            finished = time.perf_counter()
+            self.hooks.emit('after_response', ResponseEvent(method, url, endpoint, resp.status_code, attempt,
+                                                            finished - started, network_time,
+                                                            finished - decode_started, rate_limit_wait,
+                                                            self.body_size(body), len(resp.content), revalidated))
+        return (status, resp_headers, resp_body)
+
+    def download(self, url, destination, params=None, chunk_size=DEFAULT_CHUNK_SIZE, checksum='sha256',
+                 resume=True, progress=None, **kwargs):
+        """
+        Stream a file to disk or to a file object without buffering it in memory.
 
-    @staticmethod
-    def wrap_envelope(body):
-        key = 'data'
-        if 'service' in body.keys():
-            key = body.get('service')
-            body.pop('service')
-        return {key: body}
+        The body is written in chunks of ``chunk_size`` bytes and checksummed as it goes. Downloads
+        to a path are written to ``<path>.part`` first: a partial file left by an interrupted download
+        is continued with a ``Range`` request, and so is a download whose connection drops midway
+        when the retry policy allows another attempt. Servers that ignore the range resend the whole
+        file, which is then written from the start.
 
-    @staticmethod
-    def unwrap_envelope(body):
-        if not body or body == '':
-            # Sometimes response body returns nothing from Fortnox API
-            return True
-        keys = [key for key in body.keys()]
-        return [munchify(item) for item in body.get(keys[1])] if len(keys) > 1 else munchify(body.get(keys[0]))
+        :param str url: Sub URL of the file. You MUST not specify neither base url nor api version prefix.
+        :param destination: File path or writable binary file object.
+        :param dict params: (optional) Dictionary of query parameters.
+        :param int chunk_size: (optional) Bytes read and written at once. Default: **64 KB**.
+        :param str checksum: (optional) :module:`hashlib` algorithm, ``None`` to skip it. Default: ``sha256``.
+        :param bool resume: (optional) Continue a partial file of an earlier download. Default: ``True``.
+        :param callable progress: (optional) Called with the bytes written so far and the total, ``None``
+            if unknown, after every chunk.
+        :raises RequestError: if the file does not exist, authentication failed etc.
+        :raises RateLimitError: if rate limit exceeded and the retry policy gave up.
+        :raises ServerError: if Fortnox backend servers encounterered an unexpected condition
+            and the retry policy gave up.
+        :rtype: DownloadResult
+
+        :Keyword Arguments:
+            * :param dict headers: (optional) Dictionary of headers. Default: ``{}``.
+        """
+
+        started = time.perf_counter()
+        endpoint = endpoint_template(url) if self.hooks else None
+        url = self.build_url(url)
+        headers = self.build_headers(params, kwargs.get('headers'))
+        headers['Accept'] = '*/*'
+
+        target = DownloadTarget(destination, checksum=checksum, resume=resume, chunk_size=chunk_size)
+        rate_limit_wait = 0.0
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                if self.rate_limiter is not None:
+                    rate_limit_wait += self.rate_limiter.acquire(self.rate_limit_key)
+
+                request_headers = dict(headers)
+                if target.offset:
+                    request_headers['Range'] = 'bytes={offset}-'.format(offset=target.offset)
+                if self.hooks:
+                    self.hooks.emit('before_request', RequestEvent('get', url, endpoint, attempt, request_headers))
+
+                try:
+                    resp = self.send('get', url, params=params, headers=request_headers, stream=True)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    delay = self.retry_delay('get', url, attempt, error=e)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    continue
+
+                with resp:
+                    if resp.status_code == 416 and target.offset:
+                        # the partial file does not match the remote one any more
+                        target.rewind()
+                        continue
+                    if not (200 <= resp.status_code < 300):
+                        try:
+                            self.handle_error_response(resp)
+                        except (RateLimitError, ServerError) as e:
+                            delay = self.retry_delay('get', url, attempt, status=resp.status_code, error=e,
+                                                     retry_after=parse_retry_after(resp.headers.get('Retry-After')))
+                            if delay is None:
+                                raise
+                            time.sleep(delay)
+                            continue
+
+                    if resp.status_code == 206:
+                        total = parse_content_range(resp.headers.get('Content-Range'))
+                    else:
+                        target.rewind()
+                        length = resp.headers.get('Content-Length')
+                        total = int(length) if length and length.isdigit() else None
+
+                    try:
+                        for chunk in resp.iter_content(chunk_size):
+                            target.write(chunk)
+                            if progress is not None:
+                                progress(target.offset, total)
+                    except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                        # continue from the bytes already written
+                        delay = self.retry_delay('get', url, attempt, error=e)
+                        if delay is None:
+                            raise
+                        time.sleep(delay)
+                        continue
+                break
+        except BaseException as e:
+            target.close()
+            if self.hooks and isinstance(e, Exception):
+                self.hooks.emit('on_error', ErrorEvent('get', url, endpoint, getattr(e, 'http_status', None),
+                                                       attempt, time.perf_counter() - started, e))
+            raise
+
+        result = target.finish()
+        if self.hooks:
+            elapsed = time.perf_counter() - started
+            self.hooks.emit('after_response', ResponseEvent('get', url, endpoint, resp.status_code, attempt, elapsed,
+                                                            elapsed - rate_limit_wait, 0.0, rate_limit_wait, 0,
+                                                            result.size, False))
+        return result
 
     def enable_logging(self):
         import logging
@@ -0,0 +1,174 @@
+import bisect
+import collections
+import threading
+
+"""
+Upper bounds of the latency histogram buckets, in seconds.
+"""
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram(object):
+    """
+    Cumulative histogram of observed values.
+    """
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self):
+        total = 0
+        for count in self.counts:
+            total += count
+            yield total
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join('{0}="{1}"'.format(name, str(value).replace('\\', r'\\').replace('"', r'\"')
+                                             .replace('\n', r'\n'))
+                          for name, value in labels) + '}'
+
+
+def format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsCollector(object):
+    """
+    Records request metrics from the http client hooks and exports them in the Prometheus text format.
+
+    Requests are labelled by method and endpoint template (``/invoices/{id}``, never the raw url), so
+    the number of series stays bounded. Per endpoint it keeps a latency histogram, counts of responses
+    by status and of errors by type, bytes sent and received, and the seconds spent on the network and
+    decoding; the seconds spent waiting for the rate limiter and the retries are kept per client.
+
+    Usage::
+
+      >>> metrics = fortnox.MetricsCollector()
+      >>> client = fortnox.Client(access_token='...', client_secret='...', metrics=metrics)
+      >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, namespace='fortnox'):
+        """
+        :param tuple buckets: (optional) Upper bounds of the latency buckets, in seconds.
+        :param str namespace: (optional) Prefix of the metric names. Default: ``fortnox``.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.latency = collections.defaultdict(lambda: Histogram(self.buckets))
+            self.responses = collections.Counter()
+            self.errors = collections.Counter()
+            self.bytes_sent = collections.Counter()
+            self.bytes_received = collections.Counter()
+            self.network_seconds = collections.Counter()
+            self.decode_seconds = collections.Counter()
+            self.cache_hits = collections.Counter()
+            self.retries = collections.Counter()
+            self.rate_limit_wait_seconds = 0.0
+            self.rate_limit_waits = 0
+
+    def after_response(self, event):
+        key = (event.method.upper(), event.endpoint)
+        with self.lock:
+            self.latency[key].observe(event.elapsed)
+            self.responses[key + (event.status,)] += 1
+            self.bytes_sent[key] += event.bytes_sent
+            self.bytes_received[key] += event.bytes_received
+            self.network_seconds[key] += event.network_time
+            self.decode_seconds[key] += event.decode_time
+            if event.cached:
+                self.cache_hits[key] += 1
+            self.record_rate_limit_wait(event.rate_limit_wait)
+
+    def on_error(self, event):
+        key = (event.method.upper(), event.endpoint)
+        with self.lock:
+            self.latency[key].observe(event.elapsed)
+            self.errors[key + (type(event.error).__name__,)] += 1
+            if event.status is not None:
+                self.responses[key + (event.status,)] += 1
+
+    def on_retry(self, event):
+        with self.lock:
+            self.retries[(event.method.upper(), event.status if event.status is not None else 'error')] += 1
+
+    def record_rate_limit_wait(self, seconds):
+        if seconds:
+            self.rate_limit_wait_seconds += seconds
+            self.rate_limit_waits += 1
+
+    def to_prometheus(self):
+        """
+        :return: Every metric in the Prometheus text exposition format.
+        :rtype: str
+        """
+        lines = []
+
+        def family(name, kind, description, samples):
+            name = '{namespace}_{name}'.format(namespace=self.namespace, name=name)
+            lines.append('# HELP {name} {description}'.format(name=name, description=description))
+            lines.append('# TYPE {name} {kind}'.format(name=name, kind=kind))
+            for suffix, labels, value in samples:
+                lines.append('{name}{suffix}{labels} {value}'.format(name=name, suffix=suffix,
+                                                                     labels=format_labels(labels),
+                                                                     value=format_value(value)))
+
+        def endpoint_samples(counter, *extra_labels):
+            for key in sorted(counter, key=str):
+                labels = list(zip(('method', 'endpoint') + extra_labels, key))
+                yield '', labels, counter[key]
+
+        def histogram_samples():
+            for (method, endpoint), histogram in sorted(self.latency.items()):
+                labels = [('method', method), ('endpoint', endpoint)]
+                for bound, count in zip(self.buckets, histogram.cumulative_counts()):
+                    yield '_bucket', labels + [('le', format_value(float(bound)))], count
+                yield '_bucket', labels + [('le', '+Inf')], histogram.count
+                yield '_sum', labels, histogram.sum
+                yield '_count', labels, histogram.count
+
+        with self.lock:
+            family('request_duration_seconds', 'histogram',
+                   'Time from the first attempt to the decoded response.', histogram_samples())
+            family('responses_total', 'counter', 'Responses received by http status.',
+                   endpoint_samples(self.responses, 'status'))
+            family('errors_total', 'counter', 'Requests that failed once retries gave up, by error type.',
+                   endpoint_samples(self.errors, 'error'))
+            family('request_bytes_total', 'counter', 'Bytes of request bodies sent.',
+                   endpoint_samples(self.bytes_sent))
+            family('response_bytes_total', 'counter', 'Bytes of response bodies received.',
+                   endpoint_samples(self.bytes_received))
+            family('network_seconds_total', 'counter', 'Time spent sending requests and receiving responses.',
+                   endpoint_samples(self.network_seconds))
+            family('decode_seconds_total', 'counter', 'Time spent decoding response bodies.',
+                   endpoint_samples(self.decode_seconds))
+            family('cache_hits_total', 'counter', 'Responses served from the response cache.',
+                   endpoint_samples(self.cache_hits))
+            family('retries_total', 'counter', 'Attempts sent again, by http status or error.',
+                   (('', [('method', method), ('status', status)], count)
+                    for (method, status), count in sorted(self.retries.items(), key=str)))
+            family('rate_limit_wait_seconds_total', 'counter', 'Time spent waiting for the client side rate limiter.',
+                   [('', [], self.rate_limit_wait_seconds)])
+            family('rate_limit_waits_total', 'counter', 'Requests held back by the client side rate limiter.',
+                   [('', [], self.rate_limit_waits)])
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,387 @@
+import collections
+import json
+import sqlite3
+
+from munch import munchify
+
+from fortnox.coercion import Coercion
+from fortnox.http_client import DecimalEncoder
+from fortnox.services.helpers import iterate_pages_from_paginators, map_bounded
+from fortnox.sync import SyncEngine
+
+"""
+Table of the mirror.
+
+:attribute str name: Table name.
+:attribute tuple columns: ``(column, json key, sql type)`` of the indexed or queried fields,
+    the whole record is kept in a ``data`` column as well.
+:attribute tuple primary_key: Columns identifying a record.
+:attribute tuple indexes: Column tuples to index.
+"""
+Table = collections.namedtuple('Table', ['name', 'columns', 'primary_key', 'indexes'])
+
+TABLES = (
+    Table('accounts', (
+        ('number', 'Number', 'INTEGER'),
+        ('year', 'Year', 'INTEGER'),
+        ('description', 'Description', 'TEXT'),
+        ('active', 'Active', 'INTEGER'),
+        ('sru', 'SRU', 'INTEGER'),
+        ('vat_code', 'VATCode', 'TEXT'),
+    ), ('number', 'year'), (('year',),)),
+    Table('customers', (
+        ('customer_number', 'CustomerNumber', 'TEXT'),
+        ('name', 'Name', 'TEXT'),
+        ('organisation_number', 'OrganisationNumber', 'TEXT'),
+        ('email', 'Email', 'TEXT'),
+        ('active', 'Active', 'INTEGER'),
+    ), ('customer_number',), (('name',), ('organisation_number',))),
+    Table('suppliers', (
+        ('supplier_number', 'SupplierNumber', 'TEXT'),
+        ('name', 'Name', 'TEXT'),
+        ('organisation_number', 'OrganisationNumber', 'TEXT'),
+        ('active', 'Active', 'INTEGER'),
+    ), ('supplier_number',), (('name',), ('organisation_number',))),
+    Table('articles', (
+        ('article_number', 'ArticleNumber', 'TEXT'),
+        ('description', 'Description', 'TEXT'),
+        ('active', 'Active', 'INTEGER'),
+        ('sales_price', 'SalesPrice', 'REAL'),
+    ), ('article_number',), (('description',),)),
+    Table('invoices', (
+        ('document_number', 'DocumentNumber', 'TEXT'),
+        ('customer_number', 'CustomerNumber', 'TEXT'),
+        ('invoice_date', 'InvoiceDate', 'TEXT'),
+        ('due_date', 'DueDate', 'TEXT'),
+        ('currency', 'Currency', 'TEXT'),
+        ('total', 'Total', 'REAL'),
+        ('balance', 'Balance', 'REAL'),
+        ('booked', 'Booked', 'INTEGER'),
+        ('cancelled', 'Cancelled', 'INTEGER'),
+    ), ('document_number',), (('customer_number', 'balance'), ('due_date',), ('invoice_date',))),
+    Table('invoice_rows', (
+        ('document_number', None, 'TEXT'),
+        ('row_index', None, 'INTEGER'),
+        ('article_number', 'ArticleNumber', 'TEXT'),
+        ('account_number', 'AccountNumber', 'INTEGER'),
+        ('description', 'Description', 'TEXT'),
+        ('delivered_quantity', 'DeliveredQuantity', 'REAL'),
+        ('price', 'Price', 'REAL'),
+        ('total', 'Total', 'REAL'),
+    ), ('document_number', 'row_index'), (('article_number',), ('account_number',))),
+    Table('vouchers', (
+        ('voucher_series', 'VoucherSeries', 'TEXT'),
+        ('voucher_number', 'VoucherNumber', 'INTEGER'),
+        ('year', 'Year', 'INTEGER'),
+        ('transaction_date', 'TransactionDate', 'TEXT'),
+        ('description', 'Description', 'TEXT'),
+        ('reference_number', 'ReferenceNumber', 'TEXT'),
+    ), ('voucher_series', 'voucher_number', 'year'), (('transaction_date',), ('reference_number',))),
+    Table('voucher_rows', (
+        ('voucher_series', None, 'TEXT'),
+        ('voucher_number', None, 'INTEGER'),
+        ('year', None, 'INTEGER'),
+        ('row_index', None, 'INTEGER'),
+        ('account', 'Account', 'INTEGER'),
+        ('debit', 'Debit', 'REAL'),
+        ('credit', 'Credit', 'REAL'),
+        ('description', 'Description', 'TEXT'),
+    ), ('voucher_series', 'voucher_number', 'year', 'row_index'), (('account',),)),
+)
+
+
+class SQLiteCheckpointStore(object):
+    """
+    Sync checkpoints kept in the mirror database.
+
+    Saving a checkpoint commits the connection, so the records of a page and the checkpoint
+    that moves past it are written in the same transaction.
+    """
+
+    def __init__(self, connection):
+        """
+        :param sqlite3.Connection connection: Connection to the mirror database.
+        """
+        self.connection = connection
+        self.connection.execute('CREATE TABLE IF NOT EXISTS checkpoints (resource TEXT PRIMARY KEY, data TEXT)')
+
+    def load(self, resource):
+        row = self.connection.execute('SELECT data FROM checkpoints WHERE resource = ?', (resource,)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def save(self, resource, checkpoint):
+        self.connection.execute('INSERT OR REPLACE INTO checkpoints VALUES (?, ?)', (resource, json.dumps(checkpoint)))
+        self.connection.commit()
+
+
+class Mirror(object):
+    """
+    Local SQLite copy of a Fortnox company, answering read queries without calling the api.
+
+    Accounts are reloaded on every refresh, the other resources are refreshed incrementally
+    through a :class:`SyncEngine <fortnox.SyncEngine>` whose checkpoints live in the same database.
+    Invoice and voucher rows are not part of list responses, so every changed invoice and
+    voucher is retrieved once, concurrently on the http client's worker pool.
+
+    Usage::
+
+      >>> mirror = fortnox.Mirror(client, 'company.db')
+      >>> mirror.refresh()
+      >>> mirror.unpaid_invoices(customer_number='1001')
+    """
+
+    TABLES = TABLES
+    RESOURCES = ('accounts', 'customers', 'suppliers', 'articles', 'invoices', 'vouchers')
+
+    def __init__(self, client, path, page_size=500, with_rows=True):
+        """
+        :param :class:`fortnox.Client` client: Client the resources are fetched with.
+        :param str path: SQLite database file, created if missing. ``:memory:`` keeps it in memory.
+        :param int page_size: (optional) Records requested per page. Default: **500**.
+        :param bool with_rows: (optional) Retrieve invoice and voucher rows. Default: ``True``.
+        """
+        self.client = client
+        self.with_rows = with_rows
+        self.connection = sqlite3.connect(path)
+        self.tables = dict((table.name, table) for table in self.TABLES)
+        self.create_schema()
+        self.engine = SyncEngine(client, SQLiteCheckpointStore(self.connection), page_size=page_size)
+
+    def create_schema(self):
+        with self.connection:
+            for table in self.TABLES:
+                columns = ', '.join('{0} {1}'.format(column, sql_type) for column, _, sql_type in table.columns)
+                self.connection.execute('CREATE TABLE IF NOT EXISTS {name} ({columns}, data TEXT, '
+                                        'PRIMARY KEY ({key}))'.format(name=table.name, columns=columns,
+                                                                      key=', '.join(table.primary_key)))
+                for index in table.indexes:
+                    self.connection.execute('CREATE INDEX IF NOT EXISTS {name}_{suffix} ON {name} ({columns})'.format(
+                        name=table.name, suffix='_'.join(index), columns=', '.join(index)))
+
+    def upsert(self, name, items, **values):
+        """
+        Insert or replace records, without committing.
+
+        :param str name: Table name.
+        :param list items: Records in their dictionary form.
+        :param dict values: (optional) Values of the columns without json key, e.g. the parent of a row.
+        """
+        table = self.tables[name]
+        statement = 'INSERT OR REPLACE INTO {name} VALUES ({placeholders})'.format(
+            name=table.name, placeholders=', '.join('?' * (len(table.columns) + 1)))
+        rows = []
+        for index, item in enumerate(items):
+            row = []
+            for column, key, _ in table.columns:
+                if key is None:
+                    value = index if column == 'row_index' else values[column]
+                else:
+                    value = item.get(key)
+                    if value == '':
+                        value = None
+                row.append(value)
+            row.append(json.dumps(item, cls=DecimalEncoder))
+            rows.append(row)
+        self.connection.executemany(statement, rows)
+
+    def refresh(self, resources=None):
+        """
+        Bring the mirror up to date.
+
+        :param list resources: (optional) Names of the resources to refresh. Default: all of them.
+        :return: Number of records written by resource name.
+        :rtype: dict
+        """
+        counts = {}
+        for name in resources or self.RESOURCES:
+            if name == 'accounts':
+                counts[name] = self.refresh_accounts()
+            else:
+                counts[name] = self.refresh_resource(name)
+        return counts
+
+    def refresh_accounts(self, **params):
+        """
+        Reload the chart of accounts.
+
+        :param dict params: (optional) Search options, e.g. ``financialyear``.
+        :return: Number of accounts written.
+        :rtype: int
+        """
+        count = 0
+        with self.connection:
+            for _, accounts in iterate_pages_from_paginators(self.client.accounts, params, '/accounts'):
+                self.upsert('accounts', accounts)
+                count += len(accounts)
+        return count
+
+    def refresh_resource(self, name):
+        """
+        Write the records of a resource changed since the previous refresh.
+
+        :param str name: Name of the resource.
+        :return: Number of records written.
+        :rtype: int
+        """
+        count = 0
+        try:
+            for changes in self.engine.iter_change_pages(name):
+                if self.with_rows and name in ('invoices', 'vouchers'):
+                    changes = list(self.retrieve_details(name, changes))
+                self.upsert(name, changes)
+                for item in changes:
+                    self.write_rows(name, item)
+                count += len(changes)
+        except BaseException:
+            self.connection.rollback()
+            raise
+        return count
+
+    def retrieve_details(self, name, items):
+        """
+        Retrieve the complete invoices or vouchers, rows included, of a page of list results.
+        """
+        http_client = self.client.http_client
+        if name == 'invoices':
+            def fetch(item):
+                return http_client.get('/invoices/{id}'.format(id=item.get('DocumentNumber')))[2]
+        else:
+            def fetch(item):
+                return http_client.get('/vouchers/{series}/{number}'.format(series=item.get('VoucherSeries'),
+                                                                          number=item.get('VoucherNumber')),
+                                       params={'financialyear': item.get('Year')})[2]
+        return map_bounded(http_client.executor, fetch, items, http_client.config.max_workers)
+
+    def write_rows(self, name, item):
+        if name == 'invoices' and 'InvoiceRows' in item:
+            document_number = item.get('DocumentNumber')
+            self.connection.execute('DELETE FROM invoice_rows WHERE document_number = ?', (document_number,))
+            self.upsert('invoice_rows', item.get('InvoiceRows') or [], document_number=document_number)
+        elif name == 'vouchers' and 'VoucherRows' in item:
+            key = dict(voucher_series=item.get('VoucherSeries'), voucher_number=item.get('VoucherNumber'),
+                       year=item.get('Year'))
+            self.connection.execute('DELETE FROM voucher_rows WHERE voucher_series = :voucher_series '
+                                    'AND voucher_number = :voucher_number AND year = :year', key)
+            self.upsert('voucher_rows', item.get('VoucherRows') or [], **key)
+
+    def select(self, sql, params=()):
+        """
+        Run a query selecting the ``data`` column and decode the records.
+
+        :param str sql: Query whose first column is ``data``.
+        :param tuple params: (optional) Query parameters.
+        :return: List of dictionaries that support attriubte-style access.
+        :rtype: list
+        """
+        return [munchify(json.loads(row[0])) for row in self.connection.execute(sql, params)]
+
+    def first(self, sql, params=()):
+        records = self.select(sql, params)
+        return records[0] if records else None
+
+    def account(self, number, year=None):
+        """
+        :param int number: Account number.
+        :param int year: (optional) Financial year id. Default: the latest one mirrored.
+        :return: Account, ``None`` if it is not mirrored.
+        """
+        if year is None:
+            return self.first('SELECT data FROM accounts WHERE number = ? ORDER BY year DESC LIMIT 1', (number,))
+        return self.first('SELECT data FROM accounts WHERE number = ? AND year = ?', (number, year))
+
+    def customer(self, customer_number):
+        return self.first('SELECT data FROM customers WHERE customer_number = ?', (customer_number,))
+
+    def find_customers(self, name):
+        """
+        :param str name: Part of the customer name, case insensitive.
+        :rtype: list
+        """
+        return self.select('SELECT data FROM customers WHERE name LIKE ? ORDER BY name', ('%' + name + '%',))
+
+    def supplier(self, supplier_number):
+        return self.first('SELECT data FROM suppliers WHERE supplier_number = ?', (supplier_number,))
+
+    def article(self, article_number):
+        return self.first('SELECT data FROM articles WHERE article_number = ?', (article_number,))
+
+    def invoice(self, document_number):
+        return self.first('SELECT data FROM invoices WHERE document_number = ?', (document_number,))
+
+    def invoices(self, customer_number):
+        """
+        :param str customer_number: Customer number.
+        :return: Invoices of the customer, latest first.
+        :rtype: list
+        """
+        return self.select('SELECT data FROM invoices WHERE customer_number = ? '
+                           'ORDER BY invoice_date DESC', (customer_number,))
+
+    def unpaid_invoices(self, customer_number=None, due_before=None):
+        """
+        Invoices with an open balance that are not cancelled.
+
+        :param str customer_number: (optional) Only the invoices of this customer.
+        :param str due_before: (optional) Only the invoices due before this date, e.g. ``2020-01-31``.
+        :return: Invoices ordered by due date.
+        :rtype: list
+        """
+        sql = 'SELECT data FROM invoices WHERE balance != 0 AND NOT coalesce(cancelled, 0)'
+        params = []
+        if customer_number is not None:
+            sql += ' AND customer_number = ?'
+            params.append(customer_number)
+        if due_before is not None:
+            sql += ' AND due_date < ?'
+            params.append(due_before)
+        return self.select(sql + ' ORDER BY due_date', params)
+
+    def invoice_rows(self, document_number):
+        return self.select('SELECT data FROM invoice_rows WHERE document_number = ? '
+                           'ORDER BY row_index', (document_number,))
+
+    def voucher(self, voucher_series, voucher_number, year):
+        return self.first('SELECT data FROM vouchers WHERE voucher_series = ? AND voucher_number = ? AND year = ?',
+                          (voucher_series, voucher_number, year))
+
+    def voucher_rows(self, account, from_date=None, to_date=None):
+        """
+        Voucher rows booked on an account.
+
+        :param int account: Account number.
+        :param str from_date: (optional) First transaction date included.
+        :param str to_date: (optional) Last transaction date included.
+        :return: Rows ordered by transaction date.
+        :rtype: list
+        """
+        sql = ('SELECT voucher_rows.data FROM voucher_rows JOIN vouchers USING (voucher_series, voucher_number, year) '
+               'WHERE voucher_rows.account = ?')
+        params = [account]
+        if from_date is not None:
+            sql += ' AND vouchers.transaction_date >= ?'
+            params.append(from_date)
+        if to_date is not None:
+            sql += ' AND vouchers.transaction_date <= ?'
+            params.append(to_date)
+        return self.select(sql + ' ORDER BY vouchers.transaction_date, voucher_rows.row_index', params)
+
+    def account_turnover(self, account, from_date=None, to_date=None):
+        """
+        Debit minus credit of the voucher rows booked on an account.
+
+        Amounts are summed as decimals from the stored records, the ``REAL`` columns only serve filtering.
+
+        :rtype: Decimal
+        """
+        return sum((Coercion.to_decimal(row.get('Debit') or 0) - Coercion.to_decimal(row.get('Credit') or 0)
+                    for row in self.voucher_rows(account, from_date, to_date) if not row.get('Removed')),
+                   Coercion.to_decimal(0))
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
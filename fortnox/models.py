@@ -0,0 +1,307 @@
+import collections
+import functools
+
+from fortnox.coercion import Coercion
+
+"""
+Field of a model.
+
+:attribute str name: Attribute name, the json key unless the key is not a valid identifier.
+:attribute str key: Key of the field in the json representation.
+:attribute callable coerce: Converts a json value into the field type, ``None`` keeps it as is.
+"""
+Field = collections.namedtuple('Field', ['name', 'key', 'coerce'])
+
+
+def field(key, coerce=None, name=None):
+    return Field(name or key, key, coerce)
+
+
+"""
+Decimal coercion shared by all models. Decimals are immutable, so equal amounts, above all the
+zeros of every debit or credit column, share one object instead of costing 104 bytes each.
+"""
+to_decimal = functools.lru_cache(maxsize=4096, typed=True)(Coercion.to_decimal)
+
+
+def to_int(value):
+    return int(value)
+
+
+def to_bool(value):
+    return value if isinstance(value, bool) else str(value).lower() == 'true'
+
+
+def rows(model):
+    """
+    Coercion of a list of nested resources, e.g. the ``InvoiceRows`` of an invoice.
+
+    :param type model: Model of the nested resources.
+    """
+    def coerce(value):
+        return [model.from_dict(item) for item in value]
+    return coerce
+
+
+class ModelMeta(type):
+    """
+    Builds ``__slots__`` of a model from its ``FIELDS``, so that instances carry no ``__dict__``.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        fields = namespace.get('FIELDS', ())
+        namespace.setdefault('__slots__', tuple(f.name for f in fields))
+        namespace['FIELDS_BY_KEY'] = dict((f.key, f) for f in fields)
+        return super(ModelMeta, mcs).__new__(mcs, name, bases, namespace)
+
+
+class Model(object, metaclass=ModelMeta):
+    """
+    Compact, typed representation of a resource.
+
+    Models are an opt-in alternative to the :class:`Munch <munch.Munch>` objects returned by the
+    services. Every known field is stored in a slot and coerced to its type, amounts become
+    :class:`decimal.Decimal` through :class:`Coercion <fortnox.coercion.Coercion>`. Fields keep
+    their json names, so ``invoice.Total`` reads the same on a model and on a Munch. Keys
+    the model does not know about are kept aside and survive a round trip.
+
+    Usage::
+
+      >>> invoices = [fortnox.models.Invoice.from_dict(item) for item in client.invoices.list()]
+      >>> invoices[0].Total
+      Decimal('1250.5')
+    """
+
+    __slots__ = ('_extra',)
+    FIELDS = ()
+
+    def __init__(self, **values):
+        """
+        :param dict **values: Field values by attribute name, missing fields are ``None``.
+        """
+        for f in self.FIELDS:
+            setattr(self, f.name, values.pop(f.name, None))
+        self._extra = values or None
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a model from the dictionary form of a resource.
+
+        :param dict data: Resource as returned by the services, either a dict or a Munch.
+        :rtype: Model
+        """
+        instance = cls.__new__(cls)
+        extra = None
+        fields = cls.FIELDS_BY_KEY
+        for f in cls.FIELDS:
+            setattr(instance, f.name, None)
+        for key, value in data.items():
+            f = fields.get(key)
+            if f is None:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+                continue
+            if f.coerce is not None and value is not None and value != '':
+                value = f.coerce(value)
+            setattr(instance, f.name, value)
+        instance._extra = extra
+        return instance
+
+    @classmethod
+    def from_list(cls, items):
+        """
+        Build models from a list of resources, e.g. the result of ``list``.
+
+        :param list items: Resources in their dictionary form.
+        :rtype: list
+        """
+        return [cls.from_dict(item) for item in items]
+
+    def to_dict(self, exclude_none=False):
+        """
+        Convert the model back to the dictionary form of the resource.
+
+        Amounts stay :class:`decimal.Decimal`, which the http client encodes when the result is sent.
+
+        :param bool exclude_none: (optional) Leave out fields without value. Default: ``False``.
+        :rtype: dict
+        """
+        data = {}
+        for f in self.FIELDS:
+            value = getattr(self, f.name)
+            if value is None and exclude_none:
+                continue
+            if isinstance(value, list):
+                value = [item.to_dict(exclude_none) if isinstance(item, Model) else item for item in value]
+            data[f.key] = value
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __getattr__(self, name):
+        extra = object.__getattribute__(self, '_extra')
+        if extra and name in extra:
+            return extra[name]
+        raise AttributeError(name)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        values = ', '.join('{0}={1!r}'.format(f.name, getattr(self, f.name))
+                           for f in self.FIELDS if getattr(self, f.name) is not None)
+        return '{0}({1})'.format(type(self).__name__, values)
+
+
+class InvoiceRow(Model):
+    FIELDS = (
+        field('RowId', to_int),
+        field('ArticleNumber'),
+        field('AccountNumber', to_int),
+        field('Description'),
+        field('DeliveredQuantity', to_decimal),
+        field('Unit'),
+        field('Price', to_decimal),
+        field('Discount', to_decimal),
+        field('DiscountType'),
+        field('VAT', to_decimal),
+        field('Total', to_decimal),
+        field('CostCenter'),
+        field('Project'),
+    )
+
+
+class Invoice(Model):
+    FIELDS = (
+        field('@url', name='url'),
+        field('DocumentNumber'),
+        field('CustomerNumber'),
+        field('CustomerName'),
+        field('InvoiceDate'),
+        field('DueDate'),
+        field('FinalPayDate'),
+        field('InvoiceType'),
+        field('OCR'),
+        field('Currency'),
+        field('CurrencyRate', to_decimal),
+        field('Net', to_decimal),
+        field('TotalVAT', to_decimal),
+        field('Total', to_decimal),
+        field('Balance', to_decimal),
+        field('VATIncluded', to_bool),
+        field('Booked', to_bool),
+        field('Cancelled', to_bool),
+        field('Sent', to_bool),
+        field('TermsOfPayment'),
+        field('OurReference'),
+        field('YourReference'),
+        field('Comments'),
+        field('InvoiceRows', rows(InvoiceRow)),
+    )
+
+
+class VoucherRow(Model):
+    FIELDS = (
+        field('Account', to_int),
+        field('Debit', to_decimal),
+        field('Credit', to_decimal),
+        field('Quantity', to_decimal),
+        field('Description'),
+        field('TransactionInformation'),
+        field('CostCenter'),
+        field('Project'),
+        field('Removed', to_bool),
+    )
+
+
+class Voucher(Model):
+    FIELDS = (
+        field('@url', name='url'),
+        field('VoucherSeries'),
+        field('VoucherNumber', to_int),
+        field('Year', to_int),
+        field('TransactionDate'),
+        field('Description'),
+        field('Comments'),
+        field('ReferenceNumber'),
+        field('ReferenceType'),
+        field('ApprovalState', to_int),
+        field('CostCenter'),
+        field('Project'),
+        field('VoucherRows', rows(VoucherRow)),
+    )
+
+
+class Account(Model):
+    FIELDS = (
+        field('@url', name='url'),
+        field('Number', to_int),
+        field('Description'),
+        field('Active', to_bool),
+        field('Year', to_int),
+        field('BalanceBroughtForward', to_decimal),
+        field('BalanceCarriedForward', to_decimal),
+        field('SRU', to_int),
+        field('VATCode'),
+        field('CostCenter'),
+        field('CostCenterSettings'),
+        field('Project'),
+        field('ProjectSettings'),
+        field('TransactionInformation'),
+        field('TransactionInformationSettings'),
+    )
+
+
+class Customer(Model):
+    FIELDS = (
+        field('@url', name='url'),
+        field('CustomerNumber'),
+        field('Name'),
+        field('OrganisationNumber'),
+        field('Type'),
+        field('Active', to_bool),
+        field('Address1'),
+        field('Address2'),
+        field('ZipCode'),
+        field('City'),
+        field('Country'),
+        field('CountryCode'),
+        field('Email'),
+        field('Phone1'),
+        field('Phone'),
+        field('Currency'),
+        field('PriceList'),
+        field('TermsOfPayment'),
+        field('VATNumber'),
+        field('VATType'),
+        field('OurReference'),
+        field('YourReference'),
+    )
+
+
+class Article(Model):
+    FIELDS = (
+        field('@url', name='url'),
+        field('ArticleNumber'),
+        field('Description'),
+        field('Type'),
+        field('Unit'),
+        field('Active', to_bool),
+        field('Expired', to_bool),
+        field('WebshopArticle', to_bool),
+        field('Housework', to_bool),
+        field('SalesPrice', to_decimal),
+        field('PurchasePrice', to_decimal),
+        field('VAT', to_decimal),
+        field('QuantityInStock', to_decimal),
+        field('ReservedQuantity', to_decimal),
+        field('DisposableQuantity', to_decimal),
+        field('SalesAccount', to_int),
+        field('PurchaseAccount', to_int),
+        field('StockPlace'),
+        field('EAN'),
+        field('Manufacturer'),
+        field('Weight', to_int),
+    )
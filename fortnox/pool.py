@@ -0,0 +1,199 @@
+import collections
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from fortnox.client import Client
+from fortnox.configuration import Configuration
+from fortnox.errors import ConfigurationError
+from fortnox.rate_limiter import RateLimiter
+
+"""
+Client of a tenant along with the access token it was built with and the time it was last used.
+"""
+Tenant = collections.namedtuple('Tenant', ['client', 'access_token', 'last_used'])
+
+
+class ClientPool(object):
+    """
+    Serves one :class:`Client <fortnox.Client>` per tenant, i.e. per Fortnox company, from shared resources.
+
+    Every client uses the same session, hence the same connection pool, and the same worker pool,
+    so sockets and threads do not grow with the number of tenants. Each tenant keeps its own access
+    token, its own bucket of the shared rate limiter and its own namespace of the shared response
+    cache. Clients unused for ``idle_timeout`` seconds, and the least recently used ones beyond
+    ``max_clients``, are evicted: their rate limiter bucket and cached responses are dropped and
+    the client is built again on the tenant's next request.
+
+    Usage::
+
+      >>> pool = fortnox.ClientPool(client_secret=os.environ.get('CLIENT_SECRET'), idle_timeout=600)
+      >>> pool.client('company-1', access_token=token).invoices.list()
+      >>> pool.close()
+    """
+
+    def __init__(self, idle_timeout=900, max_clients=None, clock=time.monotonic, **options):
+        """
+        :param float idle_timeout: (optional) Seconds after which an unused client is evicted, ``None``
+            keeps clients until ``max_clients`` is reached. Default: **900** seconds.
+        :param int max_clients: (optional) Maximum number of clients kept, ``None`` for no limit.
+        :param callable clock: (optional) Monotonic clock returning seconds.
+        :param dict **options: (optional) :class:`Configuration <fortnox.Configuration>` options shared by
+            every tenant, e.g. ``client_secret``, ``rate_limit``, ``cache`` or ``metrics``. The pool sizes
+            apply to the shared connection pool and ``max_workers`` to the shared worker pool.
+        :raises ConfigurationError: if ``max_clients`` is not a positive integer.
+        """
+        if max_clients is not None and (not isinstance(max_clients, int) or max_clients < 1):
+            raise ConfigurationError('Provided max_clients is invalid '
+                                     'as it must be a positive integer or None.')
+
+        self.idle_timeout = idle_timeout
+        self.max_clients = max_clients
+        self.clock = clock
+
+        config = Configuration(**options)
+        self.options = dict(options)
+        self.session = self.options.get('session') or self.build_session(config)
+        self.executor = self.options.get('executor') or ThreadPoolExecutor(max_workers=config.max_workers,
+                                                                         thread_name_prefix='fortnox')
+        self.rate_limiter = config.rate_limiter
+        if self.rate_limiter is None and config.rate_limit:
+            self.rate_limiter = RateLimiter(config.rate_limit, config.rate_limit_burst)
+        self.options.update(session=self.session, executor=self.executor, rate_limiter=self.rate_limiter)
+
+        self.__owns_session = 'session' not in options or options['session'] is None
+        self.__owns_executor = 'executor' not in options or options['executor'] is None
+        self.__tenants = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def build_session(config):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=config.pool_connections,
+                              pool_maxsize=config.pool_maxsize,
+                              pool_block=config.pool_block)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def client(self, tenant, access_token=None, **options):
+        """
+        Return the client of a tenant, building it on first use or when its access token changed.
+
+        :param str tenant: Identifier of the tenant, e.g. its Fortnox company id.
+        :param str access_token: (optional) Access token of the tenant, required the first time.
+        :param dict **options: (optional) Configuration options of this tenant only, used when its client is built.
+        :raises ConfigurationError: if the tenant is unknown and no ``access_token`` is given.
+        :rtype: Client
+        """
+        evicted = []
+        with self.__lock:
+            now = self.clock()
+            entry = self.__tenants.pop(tenant, None)
+            if entry is not None and access_token is not None and access_token != entry.access_token:
+                evicted.append(entry)
+                entry = None
+            if entry is None:
+                if access_token is None:
+                    raise ConfigurationError('No access token provided for tenant {tenant}.'.format(tenant=tenant))
+                client = Client(**dict(self.options, access_token=access_token, **options))
+                entry = Tenant(client, access_token, now)
+            self.__tenants[tenant] = entry._replace(last_used=now)
+            evicted.extend(self.expired(now))
+
+        for stale in evicted:
+            self.release(stale)
+        return entry.client
+
+    def __getitem__(self, tenant):
+        return self.client(tenant)
+
+    def __contains__(self, tenant):
+        return tenant in self.__tenants
+
+    def __len__(self):
+        return len(self.__tenants)
+
+    @property
+    def tenants(self):
+        return list(self.__tenants)
+
+    def expired(self, now):
+        """
+        Remove the entries of idle tenants, and of the least recently used ones beyond ``max_clients``.
+
+        Must be called with the lock held.
+        """
+        expired = []
+        while self.__tenants:
+            tenant, entry = next(iter(self.__tenants.items()))
+            idle = self.idle_timeout is not None and now - entry.last_used >= self.idle_timeout
+            full = self.max_clients is not None and len(self.__tenants) > self.max_clients
+            if not (idle or full):
+                break
+            expired.append(self.__tenants.pop(tenant))
+        return expired
+
+    def release(self, entry):
+        """
+        Close the client of an evicted tenant and drop its rate limiter bucket and cached responses.
+        """
+        entry.client.close()
+        if self.rate_limiter is not None:
+            self.rate_limiter.discard(entry.access_token)
+        for cache in (entry.client.config.cache, entry.client.config.http_cache):
+            if cache is not None:
+                cache.forget(entry.access_token)
+
+    def evict(self, tenant):
+        """
+        Evict the client of a tenant.
+
+        :return: True if the tenant had a client.
+        :rtype: bool
+        """
+        with self.__lock:
+            entry = self.__tenants.pop(tenant, None)
+        if entry is None:
+            return False
+        self.release(entry)
+        return True
+
+    def evict_idle(self):
+        """
+        Evict the clients that have not been used for ``idle_timeout`` seconds.
+
+        Evictions also happen whenever a client is requested, call this from a periodic task
+        to release idle tenants of a pool that is not used for a while.
+
+        :return: Number of clients evicted.
+        :rtype: int
+        """
+        with self.__lock:
+            evicted = self.expired(self.clock())
+        for entry in evicted:
+            self.release(entry)
+        return len(evicted)
+
+    def close(self):
+        """
+        Evict every client and close the shared session and worker pool.
+        """
+        with self.__lock:
+            evicted = list(self.__tenants.values())
+            self.__tenants.clear()
+        for entry in evicted:
+            self.release(entry)
+        if self.__owns_executor:
+            self.executor.shutdown(wait=True)
+        if self.__owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,129 @@
+import threading
+import time
+
+
+class TokenBucket(object):
+    """
+    Thread safe token bucket.
+
+    Tokens are reserved rather than polled: a caller takes its token right away, possibly
+    driving the bucket into debt, and is told how long to wait before using it. Callers are
+    therefore served in order and the same bucket can pace both threads and coroutines.
+    """
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        """
+        :param float rate: Tokens added per second.
+        :param int capacity: Maximum number of tokens, i.e. the allowed burst.
+        :param callable clock: (optional) Monotonic clock returning seconds.
+        """
+        self.rate = float(rate)
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Take tokens from the bucket.
+
+        :param int tokens: (optional) Number of tokens to take. Default: **1**.
+        :return: Seconds to wait before the tokens may be used, **0** if they are available now.
+        :rtype: float
+        """
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class RateLimiter(object):
+    """
+    Paces outgoing requests with one :class:`TokenBucket <TokenBucket>` per access token.
+
+    Fortnox allows 25 requests per 5 seconds for every access token. With the defaults of
+    **4** requests per second and a burst of **5** no 5 second window ever holds more than 25
+    requests, so the client stays just under the quota instead of running into 429 responses.
+
+    A limiter may be shared by several clients, see ``rate_limiter`` in :class:`Configuration <fortnox.Configuration>`.
+    """
+
+    def __init__(self, rate=4, burst=5, clock=time.monotonic):
+        """
+        :param float rate: (optional) Requests per second allowed for each access token. Default: **4**.
+        :param int burst: (optional) Requests that may be sent back to back. Default: **5**.
+        :param callable clock: (optional) Monotonic clock returning seconds.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.__buckets = {}
+        self.__lock = threading.Lock()
+
+    def bucket(self, key):
+        """
+        Return the bucket of an access token, creating it on first use.
+
+        :param str key: Access token, or any other key identifying a quota.
+        :rtype: TokenBucket
+        """
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            with self.__lock:
+                bucket = self.__buckets.get(key)
+                if bucket is None:
+                    bucket = self.__buckets[key] = TokenBucket(self.rate, self.burst, self.clock)
+        return bucket
+
+    def discard(self, key):
+        """
+        Forget the bucket of an access token.
+
+        :param str key: Access token.
+        """
+        with self.__lock:
+            self.__buckets.pop(key, None)
+
+    def reserve(self, key):
+        """
+        Reserve a request for an access token.
+
+        :param str key: Access token.
+        :return: Seconds to wait before sending the request.
+        :rtype: float
+        """
+        return self.bucket(key).reserve()
+
+    def acquire(self, key):
+        """
+        Block the calling thread until a request may be sent for an access token.
+
+        :param str key: Access token.
+        :return: Seconds spent waiting.
+        :rtype: float
+        """
+        delay = self.reserve(key)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, key):
+        """
+        Wait without blocking the event loop until a request may be sent for an access token.
+
+        :param str key: Access token.
+        :return: Seconds spent waiting.
+        :rtype: float
+        """
+        # imported here so that synchronous clients never load asyncio
+        import asyncio
+
+        delay = self.reserve(key)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
@@ -0,0 +1,139 @@
+import collections
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+"""
+Details of a retry passed to the ``on_retry`` hook.
+
+:attribute str method: Http method of the request.
+:attribute str url: Full url of the request.
+:attribute int attempt: Number of the attempt that failed, starting at **1**.
+:attribute float delay: Seconds waited before the next attempt.
+:attribute int status: Http status of the failed attempt, ``None`` for connection errors.
+:attribute Exception error: Error raised by the failed attempt.
+"""
+RetryEvent = collections.namedtuple('RetryEvent', ['method', 'url', 'attempt', 'delay', 'status', 'error'])
+
+
+class RetryPolicy(object):
+    """
+    Decides whether and when a failed request is sent again.
+
+    Waits grow exponentially from ``backoff_base`` up to ``backoff_cap`` seconds and are
+    randomised with full jitter, so that clients which failed together do not retry together.
+    A ``Retry-After`` hint sent by the server is always honoured.
+
+    Requests with an idempotent method are retried on every status of ``retry_statuses`` and
+    on connection errors. Other requests, e.g. ``POST``, are only retried when the server
+    cannot have processed them: statuses of ``safe_statuses`` (a 429 rejects the request
+    before it is handled) and errors raised before the request was sent.
+    """
+
+    IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+    def __init__(self, max_attempts=3, backoff_base=0.5, backoff_cap=30, jitter=True,
+                 retry_statuses=(429, 500, 502, 503, 504), safe_statuses=(429,),
+                 idempotent_methods=IDEMPOTENT_METHODS, retry_connection_errors=True,
+                 on_retry=None, random=random.random):
+        """
+        :param int max_attempts: (optional) Attempts made in total, including the first one. Default: **3**.
+        :param float backoff_base: (optional) Wait before the first retry, in seconds. Default: **0.5**.
+        :param float backoff_cap: (optional) Longest wait between two attempts, in seconds. Default: **30**.
+        :param bool jitter: (optional) Randomise waits between zero and the backoff. Default: ``True``.
+        :param tuple retry_statuses: (optional) Http statuses worth retrying. Default: 429 and 5xx gateway errors.
+        :param tuple safe_statuses: (optional) Statuses retried for non idempotent methods too. Default: 429.
+        :param set idempotent_methods: (optional) Methods that may be sent twice without side effects.
+        :param bool retry_connection_errors: (optional) Retry connection errors and timeouts. Default: ``True``.
+        :param callable on_retry: (optional) Called with a :class:`RetryEvent <RetryEvent>` before every retry.
+        :param callable random: (optional) Source of random numbers in ``[0, 1)``.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.safe_statuses = frozenset(safe_statuses)
+        self.idempotent_methods = frozenset(method.upper() for method in idempotent_methods)
+        self.retry_connection_errors = retry_connection_errors
+        self.on_retry = on_retry
+        self.random = random
+
+    def is_idempotent(self, method):
+        return method.upper() in self.idempotent_methods
+
+    def backoff(self, attempt, retry_after=None):
+        """
+        Seconds to wait after a failed attempt.
+
+        :param int attempt: Number of the attempt that failed, starting at **1**.
+        :param float retry_after: (optional) Wait requested by the server.
+        :rtype: float
+        """
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = self.random() * delay
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def get_delay(self, method, attempt, status=None, error=None, sent=True, retry_after=None):
+        """
+        Tell whether a failed attempt should be retried.
+
+        :param str method: Http method of the request.
+        :param int attempt: Number of the attempt that failed, starting at **1**.
+        :param int status: (optional) Http status of the response.
+        :param Exception error: (optional) Connection error raised instead of a response.
+        :param bool sent: (optional) Whether the request may have reached the server.
+        :param float retry_after: (optional) Wait requested by the server.
+        :return: Seconds to wait before the next attempt, or ``None`` if the request must not be retried.
+        :rtype: float
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        if status is not None:
+            if status not in self.retry_statuses:
+                return None
+            if not self.is_idempotent(method) and status not in self.safe_statuses:
+                return None
+        elif error is not None:
+            if not self.retry_connection_errors:
+                return None
+            if sent and not self.is_idempotent(method):
+                return None
+
+        return self.backoff(attempt, retry_after)
+
+    def notify(self, event):
+        """
+        Report a retry to the ``on_retry`` hook.
+
+        :param :class:`RetryEvent` event: Details of the retry.
+        """
+        if self.on_retry is not None:
+            self.on_retry(event)
+
+
+def parse_retry_after(value):
+    """
+    Parse a ``Retry-After`` header, given either in seconds or as an http date.
+
+    :param str value: Header value, may be ``None``.
+    :return: Seconds to wait, or ``None`` if the header is missing or invalid.
+    :rtype: float
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
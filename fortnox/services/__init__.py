@@ -1,58 +1,80 @@
-from .access_token_service import AccessTokenService
-from .absence_transaction_services import AbsenceTransactionsService
-from .account_chart_services import AccountChartsService
-from .account_services import AccountsService
-from .article_services import ArticleService
-from .asset_type_services import AssetTypeService
-from .asset_services import AssetService
-from .attendance_transaction_services import AttendanceTransactionsService
-from .company_information_services import CompanyInformationService
-from .company_settings_services import CompanySettingsService
-from .currency_services import CurrencyService
-from .customer_services import CustomerService
-from .employee_services import EmployeeService
-from .expense_services import ExpenseService
-from .financial_year_services import FinancialYearService
-from .invoice_services import InvoiceService
-from .predefined_account_services import PredefinedAccountService
-from .predefined_voucher_series_services import PredefinedVoucherSeriesService
-from .project_services import ProjectService
-from .archive_services import ArchiveService
-from .article_file_connection_services import ArticleFileConnectionsService
-from .asset_file_connection_services import AssetFileConnectionService
-from .attendance_transaction_services import AttendanceTransactionsService
-from .contract_accrual_services import ContractAccrualService
-from .contract_services import ContractService
-from .contract_template_services import ContractTemplateService
-from .cost_center_services import CostCenterService
-from .inbox_services import InboxService
-from .invoice_accrual_services import InvoiceAccrualService
-from .invoice_payment_services import InvoicePaymentService
-from .label_services import LabelService
-from .locked_period_services import LockedPeriodService
-from .modes_of_payment_services import ModesOfPaymentService
-from .nox_finans_invoice_services import NoxFinansInvoiceService
-from .offer_services import OfferService
-from .order_services import OrderService
-from .price_list_services import PriceListService
-from .price_services import PriceService
-from .print_template_services import PrintTemplateService
-from .salary_transaction_services import SalaryTransactionService
-from .schedule_time_services import ScheduleTimeService
-from .sie_services import SIEService
-from .supplier_invoice_accrual_services import SupplierInvoiceAccrualService
-from .supplier_invoice_external_url_connection_services import SupplierInvoiceExternalURLConnectionService
-from .supplier_invoice_file_connection_services import SupplierInvoiceFileConnectionService
-from .supplier_invoice_payment_services import SupplierInvoicePaymentService
-from .supplier_invoice_services import SupplierInvoiceService
-from .supplier_services import SupplierService
-from .tax_reduction_services import TaxReductionService
-from .terms_of_delivery_services import TermsOfDeliveryService
-from .terms_of_payment_services import TermsOfPaymentService
-from .trusted_email_domain_services import TrustedDomainService
-from .trusted_email_sender_services import TrustedSenderService
-from .unit_services import UnitService
-from .voucher_file_connection_services import VoucherFileConnectionService
-from .voucher_series_services import VoucherSeriesService
-from .voucher_services import VoucherService
-from .way_of_delivery_services import WayOfDeliveryService
+import importlib
+
+"""
+Module of every service class. Service modules are only imported when their class is first accessed,
+which keeps ``import fortnox`` cheap.
+"""
+SERVICE_MODULES = {
+    'AccessTokenService': 'access_token_service',
+    'AbsenceTransactionsService': 'absence_transaction_services',
+    'AccountChartsService': 'account_chart_services',
+    'AccountsService': 'account_services',
+    'ArticleService': 'article_services',
+    'AssetTypeService': 'asset_type_services',
+    'AssetService': 'asset_services',
+    'AttendanceTransactionsService': 'attendance_transaction_services',
+    'CompanyInformationService': 'company_information_services',
+    'CompanySettingsService': 'company_settings_services',
+    'CurrencyService': 'currency_services',
+    'CustomerService': 'customer_services',
+    'EmployeeService': 'employee_services',
+    'ExpenseService': 'expense_services',
+    'FinancialYearService': 'financial_year_services',
+    'InvoiceService': 'invoice_services',
+    'PredefinedAccountService': 'predefined_account_services',
+    'PredefinedVoucherSeriesService': 'predefined_voucher_series_services',
+    'ProjectService': 'project_services',
+    'ArchiveService': 'archive_services',
+    'ArticleFileConnectionsService': 'article_file_connection_services',
+    'AssetFileConnectionService': 'asset_file_connection_services',
+    'ContractAccrualService': 'contract_accrual_services',
+    'ContractService': 'contract_services',
+    'ContractTemplateService': 'contract_template_services',
+    'CostCenterService': 'cost_center_services',
+    'InboxService': 'inbox_services',
+    'InvoiceAccrualService': 'invoice_accrual_services',
+    'InvoicePaymentService': 'invoice_payment_services',
+    'LabelService': 'label_services',
+    'LockedPeriodService': 'locked_period_services',
+    'ModesOfPaymentService': 'modes_of_payment_services',
+    'NoxFinansInvoiceService': 'nox_finans_invoice_services',
+    'OfferService': 'offer_services',
+    'OrderService': 'order_services',
+    'PriceListService': 'price_list_services',
+    'PriceService': 'price_services',
+    'PrintTemplateService': 'print_template_services',
+    'SalaryTransactionService': 'salary_transaction_services',
+    'ScheduleTimeService': 'schedule_time_services',
+    'SIEService': 'sie_services',
+    'SupplierInvoiceAccrualService': 'supplier_invoice_accrual_services',
+    'SupplierInvoiceExternalURLConnectionService': 'supplier_invoice_external_url_connection_services',
+    'SupplierInvoiceFileConnectionService': 'supplier_invoice_file_connection_services',
+    'SupplierInvoicePaymentService': 'supplier_invoice_payment_services',
+    'SupplierInvoiceService': 'supplier_invoice_services',
+    'SupplierService': 'supplier_services',
+    'TaxReductionService': 'tax_reduction_services',
+    'TermsOfDeliveryService': 'terms_of_delivery_services',
+    'TermsOfPaymentService': 'terms_of_payment_services',
+    'TrustedDomainService': 'trusted_email_domain_services',
+    'TrustedSenderService': 'trusted_email_sender_services',
+    'UnitService': 'unit_services',
+    'VoucherFileConnectionService': 'voucher_file_connection_services',
+    'VoucherSeriesService': 'voucher_series_services',
+    'VoucherService': 'voucher_services',
+    'WayOfDeliveryService': 'way_of_delivery_services',
+}
+
+__all__ = list(SERVICE_MODULES)
+
+
+def __getattr__(name):
+    module_name = SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError("module '{module}' has no attribute '{name}'".format(module=__name__, name=name))
+    service_class = getattr(importlib.import_module('.' + module_name, __name__), name)
+    globals()[name] = service_class
+    return service_class
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SERVICE_MODULES))
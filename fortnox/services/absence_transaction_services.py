@@ -1,4 +1,7 @@
-class AbsenceTransactionsService(object):
+from .helpers import BulkActions
+
+
+class AbsenceTransactionsService(BulkActions):
     """
     :class:`fortnox.AbsenceTransactions` is used by :class:`fortnox.Client` to make
     actions related to Absence Transactions resource.
@@ -11,6 +14,7 @@ class AbsenceTransactionsService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['EmployeeId', 'CauseCode', 'Date', 'Extent']
     SERVICE = "AbsenceTransaction"
+    PATH = "/absencetransactions"
 
     def __init__(self, http_client):
         """
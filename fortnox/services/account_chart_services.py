@@ -1,4 +1,7 @@
-class AccountChartsService(object):
+from .helpers import IterAllAction
+
+
+class AccountChartsService(IterAllAction):
     """
     :class:`fortnox.AccountChartsService` is used by :class:`fortnox.Client` to make
     actions related to Account Charts resource.
@@ -11,6 +14,7 @@ class AccountChartsService(object):
     """
     OPTS_KEYS_TO_PERSIST = []
     SERVICE = "AccountChart"
+    PATH = "/accountcharts"
 
     def __init__(self, http_client):
         """
@@ -1,6 +1,6 @@
-from .helpers import collect_all_items_from_paginators
+from .helpers import BulkActions, collect_all_items_from_paginators
 
-class AccountsService(object):
+class AccountsService(BulkActions):
     """
     :class:`fortnox.AccountsService` is used by :class:`fortnox.Client` to make
     actions related to <specific-service> resource.
@@ -13,6 +13,7 @@ class AccountsService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Number', 'Description']
     SERVICE = "Account"
+    PATH = "/accounts"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class ArchiveService(object):
+from .helpers import IterAllAction, RetrieveManyAction, CreateManyAction, upload_directory, download_folder
+
+
+class ArchiveService(IterAllAction, RetrieveManyAction, CreateManyAction):
     """
     :class:`fortnox.ArchiveService` is used by :class:`fortnox.Client` to make
     actions related to ArchiveService resource.
@@ -11,6 +14,7 @@ class ArchiveService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Name']
     SERVICE = "Folder"
+    PATH = "/archive"
 
     def __init__(self, http_client):
         """
@@ -53,6 +57,41 @@ class ArchiveService(object):
         _, _, archive = self.http_client.get("/archive/{id}".format(id=id))
         return archive
 
+    def download(self, file_id, destination, **options):
+        """
+        Download a file
+
+        Streams the file to disk or to a file object in chunks, checksummed as it goes; an interrupted
+        download to a path is resumed where it stopped
+
+        :calls: ``get /archive/{file_id}``
+        :param str file_id: Unique identifier of a file.
+        :param destination: File path or writable binary file object.
+        :param dict options: (optional) ``chunk_size``, ``checksum`` algorithm, ``resume`` and ``progress``
+            callback, see :meth:`HttpClient.download <fortnox.HttpClient.download>`.
+        :return: Path, size and checksum of the downloaded file.
+        :rtype: DownloadResult
+        """
+        return self.http_client.download("/archive/{file_id}".format(file_id=file_id), destination, **options)
+
+    def download_folder(self, folder, directory, progress=None, max_workers=None, **options):
+        """
+        Download the files of a folder
+
+        Every file of the folder is streamed to the directory, several downloads run in parallel within the rate limit
+
+        :calls: ``get /archive/{folder}`` and ``get /archive/{file_id}`` for every file
+        :param str folder: Id or path of the folder.
+        :param str directory: Directory the files are written to, created if missing.
+        :param callable progress: (optional) Called with the file name, the bytes written and the total.
+        :param int max_workers: (optional) Maximum number of downloads in flight. Default: the client's ``max_workers``.
+        :param dict options: (optional) Options of every download, see :meth:`download`.
+        :return: One result per file, in the order of the folder listing, and throughput stats.
+        :rtype: BulkResult
+        """
+        return download_folder(self, "/archive/{folder}".format(folder=folder), directory, max_workers, progress,
+                               **options)
+
     def create(self, *args, **kwargs):
         """
         Create a ArchiveService
@@ -62,7 +101,9 @@ class ArchiveService(object):
 
         :calls: ``post /archive``
         :param tuple *args: (optional) Single object representing ArchiveService resource.
-        :param dict **kwargs: (optional) Customer attributes.
+        :param dict **kwargs: (optional) Customer attributes. A ``file`` may be a path, an open binary file, bytes
+            or an iterator of bytes, it is streamed in chunks of ``chunk_size`` bytes to the folder given by ``path``
+            or ``folderid``, and an optional ``progress`` callback is called with the bytes sent and the total.
         :return: Dictionary that support attriubte-style access and represents newely created Customer resource.
         :rtype: dict
         """
@@ -73,9 +114,29 @@ class ArchiveService(object):
         initial_attributes = args[0] if args else kwargs
         attributes = dict((k, v) for k, v in initial_attributes.items())
         attributes.update({'service': self.SERVICE})
-        _, _, archive = self.http_client.post("/archive", body=attributes)
+        # files are uploaded to the folder given by its path or id
+        params = dict((k, attributes.pop(k)) for k in ('path', 'folderid') if k in attributes)
+        _, _, archive = self.http_client.post("/archive", body=attributes, params=params or None)
         return archive
 
+    def upload_directory(self, directory, pattern='*', path=None, progress=None, max_workers=None):
+        """
+        Upload the files of a directory
+
+        Streams every file matching the pattern from disk, several uploads run in parallel within the rate limit
+
+        :calls: ``post /archive`` for every file
+        :param str directory: Directory holding the files.
+        :param str pattern: (optional) Glob pattern of the files to upload. Default: every file.
+        :param str path: (optional) Archive folder receiving the files.
+        :param callable progress: (optional) Called with the file name, the bytes sent and the total.
+        :param int max_workers: (optional) Maximum number of uploads in flight. Default: the client's ``max_workers``.
+        :return: One result per file, in the order of the sorted file paths, and throughput stats.
+        :rtype: BulkResult
+        """
+        attributes = {'path': path} if path else {}
+        return upload_directory(self, directory, pattern, max_workers, progress, **attributes)
+
     def destroy(self, id):
         """
         Delete a ArchiveService
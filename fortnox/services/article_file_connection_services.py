@@ -1,4 +1,7 @@
-class ArticleFileConnectionsService(object):
+from .helpers import IterAllAction, RetrieveManyAction, CreateManyAction
+
+
+class ArticleFileConnectionsService(IterAllAction, RetrieveManyAction, CreateManyAction):
     """
     :class:`fortnox.ArticleFileConnectionsService` is used by :class:`fortnox.Client` to make
     actions related to ArticleFileConnections resource.
@@ -11,6 +14,7 @@ class ArticleFileConnectionsService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['FileId', 'ArticleNumber']
     SERVICE = "ArticleFileConnection"
+    PATH = "/articlefileconnections"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class ArticleService(object):
+from .helpers import BulkActions
+
+
+class ArticleService(BulkActions):
     """
     :class:`fortnox.ArticleService` is used by :class:`fortnox.Client` to make
     actions related to Articles resource.
@@ -11,6 +14,7 @@ class ArticleService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['ArticleNumber', 'Description']
     SERVICE = "Article"
+    PATH = "/articles"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class AssetFileConnectionService(object):
+from .helpers import IterAllAction, RetrieveManyAction, CreateManyAction
+
+
+class AssetFileConnectionService(IterAllAction, RetrieveManyAction, CreateManyAction):
     """
     :class:`fortnox.AssetFileConnectionService File Connection` is used by :class:`fortnox.Client` to make
     actions related to Asset File Connection resource.
@@ -11,6 +14,7 @@ class AssetFileConnectionService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['FileId', 'AssetId']
     SERVICE = "AssetFileConnection"
+    PATH = "/assetfileconnections"
 
     def __init__(self, http_client):
         """
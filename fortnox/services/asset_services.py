@@ -1,4 +1,7 @@
-class AssetService(object):
+from .helpers import BulkActions
+
+
+class AssetService(BulkActions):
     """
     :class:`fortnox.AssetService` is used by :class:`fortnox.Client` to make
     actions related to Assets resource.
@@ -12,6 +15,7 @@ class AssetService(object):
     OPTS_KEYS_TO_PERSIST = ['Number', 'Description', 'TypeId', 'AcquisitionDate',
                             'AcquisitionStart', 'DepreciationFinal', 'AcquisitionValue']
     SERVICE = "Asset"
+    PATH = "/assets"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class AssetTypeService(object):
+from .helpers import BulkActions
+
+
+class AssetTypeService(BulkActions):
     """
     :class:`fortnox.AssetTypeService` is used by :class:`fortnox.Client` to make
     actions related to Asset Type resource.
@@ -13,6 +16,7 @@ class AssetTypeService(object):
                             'AccountDepreciationId', 'AccountValueLossId',
                             'Type']
     SERVICE = "AssetType"
+    PATH = "/assets/types"
 
     def __init__(self, http_client):
         """
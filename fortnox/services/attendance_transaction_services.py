@@ -1,4 +1,7 @@
-class AttendanceTransactionsService(object):
+from .helpers import BulkActions
+
+
+class AttendanceTransactionsService(BulkActions):
     """
     :class:`fortnox.AttendanceTransactionsService` is used by :class:`fortnox.Client` to make
     actions related to Attendance Transactions resource.
@@ -11,6 +14,7 @@ class AttendanceTransactionsService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['EmployeeId', 'CauseCode', 'Date', 'Hours']
     SERVICE = "AttendanceTransaction"
+    PATH = "/attendancetransactions"
 
     def __init__(self, http_client):
         """
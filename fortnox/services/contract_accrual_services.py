@@ -1,4 +1,7 @@
-class ContractAccrualService(object):
+from .helpers import BulkActions
+
+
+class ContractAccrualService(BulkActions):
     """
     :class:`fortnox.ContractAccrualService` is used by :class:`fortnox.Client` to make
     actions related to ContractAccruals resource.
@@ -27,6 +30,7 @@ class ContractAccrualService(object):
         ]
     """
     SERVICE = "ContractAccrual"
+    PATH = "/contractaccruals"
 
     def __init__(self, http_client):
         """
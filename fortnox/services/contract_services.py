@@ -1,4 +1,7 @@
-class ContractService(object):
+from .helpers import BulkActions
+
+
+class ContractService(BulkActions):
     """
     :class:`fortnox.ContractService` is used by :class:`fortnox.Client` to make
     actions related to Contracts resource.
@@ -26,6 +29,7 @@ class ContractService(object):
         ]
     """
     SERVICE = "Contract"
+    PATH = "/contracts"
 
     def __init__(self, http_client):
         """
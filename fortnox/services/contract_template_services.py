@@ -1,4 +1,7 @@
-class ContractTemplateService(object):
+from .helpers import BulkActions
+
+
+class ContractTemplateService(BulkActions):
     """
     :class:`fortnox.ContractTemplateService` is used by :class:`fortnox.Client` to make
     actions related to ContractTemplate resource.
@@ -26,6 +29,7 @@ class ContractTemplateService(object):
         ]
     """
     SERVICE = "ContractTemplate"
+    PATH = "/contracttemplates"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class CostCenterService(object):
+from .helpers import BulkActions
+
+
+class CostCenterService(BulkActions):
     """
     :class:`fortnox.CostCenterService` is used by :class:`fortnox.Client` to make
     actions related to CostCenter resource.
@@ -11,6 +14,7 @@ class CostCenterService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Code', 'Description']
     SERVICE = "CostCenter"
+    PATH = "/costcenters"
 
     def __init__(self, http_client):
         """
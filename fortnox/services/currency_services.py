@@ -1,4 +1,7 @@
-class CurrencyService(object):
+from .helpers import BulkActions
+
+
+class CurrencyService(BulkActions):
     """
     :class:`fortnox.CurrencyService` is used by :class:`fortnox.Client` to make
     actions related to Currency resource.
@@ -11,6 +14,7 @@ class CurrencyService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Code', 'Description']
     SERVICE = "Currency"
+    PATH = "/currencies"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class CustomerService(object):
+from .helpers import BulkActions
+
+
+class CustomerService(BulkActions):
     """
     :class:`fortnox.CustomerService` is used by :class:`fortnox.Client` to make
     actions related to Customer resource.
@@ -11,6 +14,7 @@ class CustomerService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Name']
     SERVICE = "Customer"
+    PATH = "/customers"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class EmployeeService(object):
+from .helpers import BulkActions
+
+
+class EmployeeService(BulkActions):
     """
     :class:`fortnox.EmployeeService` is used by :class:`fortnox.Client` to make
     actions related to Employee resource.
@@ -11,6 +14,7 @@ class EmployeeService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['EmployeeId', 'FirstName', 'LastName']
     SERVICE = "Employee"
+    PATH = "/employees"
 
     def __init__(self, http_client):
         """
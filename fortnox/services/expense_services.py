@@ -1,4 +1,7 @@
-class ExpenseService(object):
+from .helpers import IterAllAction, RetrieveManyAction, CreateManyAction
+
+
+class ExpenseService(IterAllAction, RetrieveManyAction, CreateManyAction):
     """
     :class:`fortnox.ExpenseService` is used by :class:`fortnox.Client` to make
     actions related to Expense resource.
@@ -11,6 +14,7 @@ class ExpenseService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Code', 'Text', 'Account']
     SERVICE = "Expense"
+    PATH = "/expenses"
 
     def __init__(self, http_client):
         """
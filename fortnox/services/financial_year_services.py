@@ -1,4 +1,7 @@
-class FinancialYearService(object):
+from .helpers import IterAllAction, RetrieveManyAction, CreateManyAction
+
+
+class FinancialYearService(IterAllAction, RetrieveManyAction, CreateManyAction):
     """
     :class:`fortnox.FinancialYearService` is used by :class:`fortnox.Client` to make
     actions related to FinancialYear resource.
@@ -11,6 +14,7 @@ class FinancialYearService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['FromDate', 'ToDate', 'AccountChartType']
     SERVICE = "FinancialYear"
+    PATH = "/financialyears"
 
     def __init__(self, http_client):
         """
@@ -1,7 +1,60 @@
+import collections
+import contextvars
+import functools
+import glob
+import itertools
+import os
+import queue
+import time
+
+from fortnox.errors import BaseError
+
+"""
+Outcome of one item of a bulk operation.
+
+:attribute int index: Position of the item in the input.
+:attribute bool ok: Whether the request succeeded.
+:attribute value: Resource returned by the api, ``None`` on failure.
+:attribute Exception error: Error raised by the request, ``None`` on success.
+"""
+BulkItemResult = collections.namedtuple('BulkItemResult', ['index', 'ok', 'value', 'error'])
+
+
+class BulkResult(collections.namedtuple('BulkResult', ['results', 'elapsed'])):
+    """
+    Outcome of a bulk operation: one :class:`BulkItemResult` per input item, in input order,
+    and the seconds the whole batch took.
+    """
+
+    @property
+    def succeeded(self):
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self):
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def throughput(self):
+        """
+        Items processed per second.
+        """
+        return len(self.results) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self):
+        return '{total} items in {elapsed:.1f}s ({throughput:.1f}/s): {ok} succeeded, {failed} failed'.format(
+            total=len(self.results), elapsed=self.elapsed, throughput=self.throughput,
+            ok=len(self.succeeded), failed=len(self.failed))
+
+
 def collect_all_items_from_paginators(self: object, params: dict, url: str, targeted_service: str) -> list:
     '''
     Returns all items from paginated response and returns as list
 
+    The first page tells how many pages there are, the remaining ones are fetched
+    concurrently on the http client's worker pool (each request still goes through
+    its rate limiter) and joined in page order.
+
     :parameters: 
         self -> service class object.
         params -> dict : params passed to the func of the service object.
@@ -20,9 +73,408 @@ def collect_all_items_from_paginators(self: object, params: dict, url: str, targ
     services = raw_response.get(targeted_service) ## gets the targeted service of 1st page
     
     if total_pages > 1:
-        ## gets the targeted service from page 2 to last page and concat then in services
-        for page in range(2, total_pages+1):
-            params['page'] = page
-            _, _, response = self.http_client.get(url, params=params)
-            services = services + response
+        ## gets the targeted service from page 2 to last page concurrently and chains them after the 1st page
+        pages = map_bounded(self.http_client.executor,
+                            lambda page: self.http_client.get(url, params=dict(params, page=page))[2],
+                            range(2, total_pages + 1),
+                            self.http_client.config.max_workers)
+        services = list(itertools.chain(services, *pages))
     return services
+
+
+def iterate_pages_from_paginators(self: object, params: dict, url: str, prefetch: bool = False,
+                                  start_page: int = 1):
+    '''
+    Yields the items of every page of a paginated response, one page at a time
+
+    A page is only requested once the previous one has been consumed, so memory stays
+    bounded by a single page whatever the size of the collection.
+
+    :parameters:
+        self -> service class object.
+        params -> dict : params passed to the func of the service object.
+        url -> str: where the request will be performed.
+        prefetch -> bool: fetch the next page on the http client's worker pool while the current one is consumed.
+        start_page -> int: first page to fetch.
+    :return: Generator of (page number, list of items) tuples.
+    :rtype: generator
+    '''
+    def fetch(page):
+        _, _, raw_response = self.http_client.get(url, params=dict(params, page=page), raw=True)
+        return raw_response
+
+    page = start_page
+    raw_response = fetch(page)
+    while True:
+        meta_data = raw_response.get('MetaInformation') or {}
+        total_pages = meta_data.get('@TotalPages', page)
+        next_page = None
+        if prefetch and page < total_pages:
+            next_page = submit(self.http_client.executor, fetch, page + 1)
+
+        items = get_collection(raw_response)
+        try:
+            yield page, items if isinstance(items, list) else [items]
+        except GeneratorExit:
+            if next_page is not None:
+                next_page.cancel()
+            raise
+
+        if page >= total_pages:
+            return
+        page += 1
+        raw_response = next_page.result() if next_page is not None else fetch(page)
+
+
+def iterate_all_items_from_paginators(self: object, params: dict, url: str, prefetch: bool = False):
+    '''
+    Yields every item of a paginated response, fetching pages lazily
+
+    :parameters:
+        self -> service class object.
+        params -> dict : params passed to the func of the service object.
+        url -> str: where the request will be performed.
+        prefetch -> bool: fetch the next page in the background while the current one is consumed.
+    :return: Generator of dictionaries that support attriubte-style access.
+    :rtype: generator
+    '''
+    for _, items in iterate_pages_from_paginators(self, params, url, prefetch=prefetch):
+        yield from items
+
+
+def submit(executor, func, *args):
+    '''
+    Schedules func(*args) on an executor in a copy of the current context
+
+    Context variables, such as the current span of a tracer, are thus seen by the call and the
+    requests it sends are nested in the span of the caller.
+
+    :parameters:
+        executor -> concurrent.futures.Executor: pool running the call.
+        func -> callable: function to call.
+        args -> tuple: arguments of the call.
+    :return: Future of the call.
+    :rtype: concurrent.futures.Future
+    '''
+    return executor.submit(contextvars.copy_context().run, func, *args)
+
+
+def map_bounded(executor, func, items, max_workers: int):
+    '''
+    Yields func(item) for every item, in input order, running at most max_workers calls at once
+
+    :parameters:
+        executor -> concurrent.futures.Executor: pool running the calls.
+        func -> callable: function called with every item.
+        items -> iterable: items to process, consumed lazily.
+        max_workers -> int: maximum number of calls in flight.
+    :return: Generator of results; an exception raised by a call is raised when its result is reached.
+    :rtype: generator
+    '''
+    pending = collections.deque()
+    for item in items:
+        if len(pending) >= max_workers:
+            yield pending.popleft().result()
+        pending.append(submit(executor, func, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def map_completed(executor, func, items, max_workers: int):
+    '''
+    Yields (item, func(item)) for every item, as soon as each call finishes, running at most max_workers calls at once
+
+    :parameters:
+        executor -> concurrent.futures.Executor: pool running the calls.
+        func -> callable: function called with every item.
+        items -> iterable: items to process, consumed lazily.
+        max_workers -> int: maximum number of calls in flight.
+    :return: Generator of (item, result) tuples in completion order; an exception raised by a call is raised
+        when its result is reached, and the calls not started yet are cancelled.
+    :rtype: generator
+    '''
+    # futures are queued by their done callback, i.e. in the order the calls finish
+    finished = queue.Queue()
+    pending = {}
+    try:
+        for item in items:
+            while len(pending) >= max_workers:
+                future = finished.get()
+                yield pending.pop(future), future.result()
+            future = submit(executor, func, item)
+            pending[future] = item
+            future.add_done_callback(finished.put)
+        while pending:
+            future = finished.get()
+            yield pending.pop(future), future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def get_collection(raw_response: dict) -> list:
+    '''
+    Returns the collection held by a raw (still enveloped) list response
+
+    :parameters:
+        raw_response -> dict: raw json response of a list endpoint, e.g. ``{'MetaInformation': {...}, 'Invoices': [...]}``.
+    :return: The first value of the response which is not its MetaInformation, or an empty list.
+    :rtype: list
+    '''
+    for key in raw_response:
+        if key != 'MetaInformation':
+            # read through indexing, which is where lazily decoded responses wrap their values
+            return raw_response[key]
+    return []
+
+
+def run_many(self: object, func, items, max_workers: int = None) -> BulkResult:
+    '''
+    Calls func for every item concurrently on the http client's worker pool and collects one result per item
+
+    Each request still goes through the http client's rate limiter and retry policy. A failing item
+    is recorded with its error and does not stop the others.
+
+    :parameters:
+        self -> service class object.
+        func -> callable: function sending the request of one item, e.g. the service's create.
+        items -> iterable: items to process.
+        max_workers -> int: maximum number of requests in flight, defaults to the client's max_workers.
+    :return: Results in input order along with throughput stats.
+    :rtype: BulkResult
+    '''
+    def call(indexed_item):
+        index, item = indexed_item
+        try:
+            return BulkItemResult(index, True, func(item), None)
+        except Exception as e:
+            return BulkItemResult(index, False, None, e)
+
+    started = time.monotonic()
+    results = list(map_bounded(self.http_client.executor, call, enumerate(items),
+                               max_workers or self.http_client.config.max_workers))
+    return BulkResult(results, time.monotonic() - started)
+
+
+def iterate_retrieve_many(self: object, ids, max_workers: int = None, skip_missing: bool = False, **options):
+    '''
+    Retrieves several resources concurrently on the http client's worker pool, yielding each one as soon as it arrives
+
+    Duplicate ids are retrieved once. Each request still goes through the http client's rate limiter
+    and retry policy.
+
+    :parameters:
+        self -> service class object with a retrieve.
+        ids -> iterable: ids to retrieve, tuples of arguments for a retrieve taking several, e.g. ``(voucher_series, id)``.
+        max_workers -> int: maximum number of requests in flight, defaults to the client's max_workers.
+        skip_missing -> bool: leave out the ids answered with 404 instead of raising.
+        options -> dict: other options of every retrieve, e.g. the ``financialyear`` of accounts.
+    :return: Generator of (id, resource) tuples in completion order; any other error is raised when reached.
+    :rtype: generator
+    '''
+    def retrieve(id):
+        try:
+            return self.retrieve(*(id if isinstance(id, tuple) else (id,)), **options)
+        except BaseError as e:
+            if skip_missing and e.http_status == 404:
+                return None
+            raise
+
+    for id, resource in map_completed(self.http_client.executor, retrieve, dict.fromkeys(ids),
+                                      max_workers or self.http_client.config.max_workers):
+        if resource is not None or not skip_missing:
+            yield id, resource
+
+
+def retrieve_many(self: object, ids, max_workers: int = None, skip_missing: bool = False, **options) -> dict:
+    '''
+    Retrieves several resources concurrently on the http client's worker pool and maps them by id
+
+    :parameters:
+        self -> service class object with a retrieve.
+        ids -> iterable: ids to retrieve, tuples of arguments for a retrieve taking several, e.g. ``(voucher_series, id)``.
+        max_workers -> int: maximum number of requests in flight, defaults to the client's max_workers.
+        skip_missing -> bool: leave out the ids answered with 404 instead of raising.
+        options -> dict: other options of every retrieve, e.g. the ``financialyear`` of accounts.
+    :return: Resources by id, in the order of the ids.
+    :rtype: dict
+    '''
+    ids = list(dict.fromkeys(ids))
+    resources = dict(iterate_retrieve_many(self, ids, max_workers, skip_missing, **options))
+    return dict((id, resources[id]) for id in ids if id in resources)
+
+
+class IterAllAction(object):
+    """
+    Lazy iteration over every page of a service's ``list``, which lives at the ``PATH`` of the service.
+    The collection is found in the response envelope by :func:`get_collection`.
+    """
+
+    PATH = None
+
+    def iter_all(self, prefetch=False, **params):
+        """
+        Iterate over all resources
+
+        Lazily walks through every page, a page is only fetched once the previous one has been consumed
+
+        :calls: ``get /{resource}``
+        :param bool prefetch: (optional) Fetch the next page in the background while the current one is consumed.
+        :param dict params: (optional) Search options.
+        :return: Generator of dictionaries that support attriubte-style access.
+        :rtype: generator
+        """
+        yield from iterate_all_items_from_paginators(self, params, self.PATH, prefetch=prefetch)
+
+
+class RetrieveManyAction(object):
+    """
+    Concurrent retrieval of several resources with the ``retrieve`` of a service.
+    """
+
+    def retrieve_many(self, ids, max_workers=None, skip_missing=False, **options):
+        """
+        Retrieve several resources
+
+        Sends the retrievals concurrently on the http client's worker pool, within its rate limit
+        Duplicate ids are retrieved once
+
+        :calls: ``get /{resource}/{id}`` for every id
+        :param iterable ids: Unique identifiers, tuples of the arguments of ``retrieve`` when it takes several,
+            e.g. ``(voucher_series, id)``.
+        :param int max_workers: (optional) Maximum number of requests in flight. Default: the client's ``max_workers``.
+        :param bool skip_missing: (optional) Leave out the ids which do not exist instead of raising. Default: ``False``.
+        :param dict options: (optional) Other arguments of every ``retrieve``, e.g. the ``financialyear`` of accounts.
+        :return: Dictionary of resources by id, in the order of the ids.
+        :rtype: dict
+        """
+        return retrieve_many(self, ids, max_workers, skip_missing, **options)
+
+    def iter_retrieve_many(self, ids, max_workers=None, skip_missing=False, **options):
+        """
+        Retrieve several resources, one at a time as they arrive
+
+        Same as :meth:`retrieve_many` but yields every resource as soon as its request completes,
+        without waiting for the whole batch
+
+        :calls: ``get /{resource}/{id}`` for every id
+        :param iterable ids: Unique identifiers, tuples of the arguments of ``retrieve`` when it takes several,
+            e.g. ``(voucher_series, id)``.
+        :param int max_workers: (optional) Maximum number of requests in flight. Default: the client's ``max_workers``.
+        :param bool skip_missing: (optional) Leave out the ids which do not exist instead of raising. Default: ``False``.
+        :param dict options: (optional) Other arguments of every ``retrieve``, e.g. the ``financialyear`` of accounts.
+        :return: Generator of (id, resource) tuples, in the order the requests complete.
+        :rtype: generator
+        """
+        yield from iterate_retrieve_many(self, ids, max_workers, skip_missing, **options)
+
+
+class CreateManyAction(object):
+    """
+    Concurrent creation of several resources with the ``create`` of a service.
+    """
+
+    def create_many(self, items, max_workers=None):
+        """
+        Create several resources
+
+        Sends the creations concurrently on the http client's worker pool, within its rate limit
+        A failing item does not stop the others, its error is recorded in its result
+
+        :calls: ``post /{resource}`` for every item
+        :param iterable items: Dictionaries of resource attributes.
+        :param int max_workers: (optional) Maximum number of requests in flight. Default: the client's ``max_workers``.
+        :return: One result per item, in input order, with the created resource or the error, and throughput stats.
+        :rtype: BulkResult
+        """
+        return run_many(self, self.create, items, max_workers)
+
+
+class UpdateManyAction(object):
+    """
+    Concurrent update of several resources with the ``update`` of a service.
+    """
+
+    def update_many(self, items, max_workers=None):
+        """
+        Update several resources
+
+        Sends the updates concurrently on the http client's worker pool, within its rate limit
+        A failing item does not stop the others, its error is recorded in its result
+
+        :calls: ``put /{resource}/{id}`` for every item
+        :param iterable items: ``(id, attributes)`` tuples, the arguments of ``update``.
+        :param int max_workers: (optional) Maximum number of requests in flight. Default: the client's ``max_workers``.
+        :return: One result per item, in input order, with the updated resource or the error, and throughput stats.
+        :rtype: BulkResult
+        """
+        return run_many(self, lambda item: self.update(*item), items, max_workers)
+
+
+class BulkActions(IterAllAction, RetrieveManyAction, CreateManyAction, UpdateManyAction):
+    """
+    Every paging and bulk action, for services which list, retrieve, create and update their resource.
+    """
+
+
+def upload_directory(self: object, directory: str, pattern: str = '*', max_workers: int = None,
+                     progress=None, **attributes) -> BulkResult:
+    '''
+    Uploads every file of a directory matching pattern in parallel through the service's create
+
+    Files are streamed from disk, never read in memory at once.
+
+    :parameters:
+        self -> service class object with a create accepting a ``file``.
+        directory -> str: directory holding the files.
+        pattern -> str: glob pattern of the files to upload.
+        max_workers -> int: maximum number of uploads in flight, defaults to the client's max_workers.
+        progress -> callable: called with the file name, the bytes sent so far and the total size.
+        attributes -> dict: other attributes of every upload, e.g. the ``path`` of the destination folder.
+    :return: One result per file, in the order of the sorted file paths, along with throughput stats.
+    :rtype: BulkResult
+    '''
+    paths = sorted(path for path in glob.glob(os.path.join(directory, pattern)) if os.path.isfile(path))
+    items = []
+    for path in paths:
+        file_name = os.path.basename(path)
+        items.append(dict(attributes, file=path, file_name=file_name,
+                          progress=functools.partial(progress, file_name) if progress is not None else None))
+    return run_many(self, self.create, items, max_workers)
+
+
+def download_folder(self: object, url: str, directory: str, max_workers: int = None,
+                    progress=None, **options) -> BulkResult:
+    '''
+    Downloads every file of a folder in parallel through the service's download
+
+    Files are streamed to disk, never held in memory at once; files sharing a name are prefixed with their id.
+
+    :parameters:
+        self -> service class object with a download accepting a file id and a destination.
+        url -> str: sub url of the folder, e.g. ``/inbox/inbox_s``.
+        directory -> str: directory the files are written to, created if missing.
+        max_workers -> int: maximum number of downloads in flight, defaults to the client's max_workers.
+        progress -> callable: called with the file name, the bytes written so far and the total size.
+        options -> dict: other options of every download, e.g. ``checksum`` or ``chunk_size``.
+    :return: One DownloadResult per file, in the order of the folder listing, along with throughput stats.
+    :rtype: BulkResult
+    '''
+    _, _, folder = self.http_client.get(url)
+    os.makedirs(directory, exist_ok=True)
+
+    names = set()
+    items = []
+    for file in folder.get('Files') or []:
+        name = os.path.basename(str(file.get('Name') or file.get('Id')))
+        if name in names:
+            name = '{id}_{name}'.format(id=file.get('Id'), name=name)
+        names.add(name)
+        items.append((file.get('Id'), name))
+
+    def download(item):
+        file_id, name = item
+        return self.download(file_id, os.path.join(directory, name),
+                             progress=functools.partial(progress, name) if progress is not None else None, **options)
+
+    return run_many(self, download, items, max_workers)
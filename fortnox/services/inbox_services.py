@@ -1,4 +1,7 @@
-class InboxService(object):
+from .helpers import IterAllAction, RetrieveManyAction, CreateManyAction, upload_directory, download_folder
+
+
+class InboxService(IterAllAction, RetrieveManyAction, CreateManyAction):
     """
     :class:`fortnox.InboxService` is used by :class:`fortnox.Client` to make
     actions related to Inbox resource.
@@ -11,6 +14,7 @@ class InboxService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['file', 'path']
     SERVICE = "Folders"
+    PATH = "/inbox"
 
     def __init__(self, http_client):
         """
@@ -179,6 +183,41 @@ class InboxService(object):
         _, _, folder = self.http_client.get("/inbox/{file_id}".format(file_id=file_id))
         return folder
 
+    def download(self, file_id, destination, **options):
+        """
+        Download a file
+
+        Streams the file to disk or to a file object in chunks, checksummed as it goes; an interrupted
+        download to a path is resumed where it stopped
+
+        :calls: ``get /inbox/{file_id}``
+        :param str file_id: Unique identifier of a file.
+        :param destination: File path or writable binary file object.
+        :param dict options: (optional) ``chunk_size``, ``checksum`` algorithm, ``resume`` and ``progress``
+            callback, see :meth:`HttpClient.download <fortnox.HttpClient.download>`.
+        :return: Path, size and checksum of the downloaded file.
+        :rtype: DownloadResult
+        """
+        return self.http_client.download("/inbox/{file_id}".format(file_id=file_id), destination, **options)
+
+    def download_folder(self, folder, directory, progress=None, max_workers=None, **options):
+        """
+        Download the files of a folder
+
+        Every file of the folder is streamed to the directory, several downloads run in parallel within the rate limit
+
+        :calls: ``get /inbox/{folder}`` and ``get /inbox/{file_id}`` for every file
+        :param str folder: Id or path of the folder, e.g. ``inbox_s``.
+        :param str directory: Directory the files are written to, created if missing.
+        :param callable progress: (optional) Called with the file name, the bytes written and the total.
+        :param int max_workers: (optional) Maximum number of downloads in flight. Default: the client's ``max_workers``.
+        :param dict options: (optional) Options of every download, see :meth:`download`.
+        :return: One result per file, in the order of the folder listing, and throughput stats.
+        :rtype: BulkResult
+        """
+        return download_folder(self, "/inbox/{folder}".format(folder=folder), directory, max_workers, progress,
+                               **options)
+
     def create(self, *args, **kwargs):
         """
         Create a Inbox
@@ -188,7 +227,9 @@ class InboxService(object):
 
         :calls: ``post /inbox``
         :param tuple *args: (optional) Single object representing Inbox resource.
-        :param dict **kwargs: (optional) folder attributes.
+        :param dict **kwargs: (optional) folder attributes. A ``file`` may be a path, an open binary file, bytes
+            or an iterator of bytes, it is streamed in chunks of ``chunk_size`` bytes and an optional ``progress``
+            callback is called with the bytes sent and the total.
         :return: Dictionary that support attriubte-style access and represents newely created Inbox resource.
         :rtype: dict
         """
@@ -211,11 +252,30 @@ class InboxService(object):
         file_name = attributes.pop('file_name', None)
         for k in self.OPTS_KEYS_TO_PERSIST:
             kwargs.pop(k, None)
-        # buffered file
-        attributes = {'file': file, 'file_name': file_name}
+        # streamed file, read chunk by chunk while it is sent
+        attributes = {'file': file, 'file_name': file_name,
+                      'chunk_size': attributes.pop('chunk_size', None), 'progress': attributes.pop('progress', None)}
         _, _, folder = self.http_client.post(path_name, body=attributes, **kwargs)
         return folder
 
+    def upload_directory(self, directory, pattern='*', path=None, progress=None, max_workers=None):
+        """
+        Upload the files of a directory
+
+        Streams every file matching the pattern from disk, several uploads run in parallel within the rate limit
+
+        :calls: ``post /inbox`` for every file
+        :param str directory: Directory holding the files.
+        :param str pattern: (optional) Glob pattern of the files to upload. Default: every file.
+        :param str path: (optional) Inbox folder receiving the files, e.g. ``inbox_v``.
+        :param callable progress: (optional) Called with the file name, the bytes sent and the total.
+        :param int max_workers: (optional) Maximum number of uploads in flight. Default: the client's ``max_workers``.
+        :return: One result per file, in the order of the sorted file paths, and throughput stats.
+        :rtype: BulkResult
+        """
+        attributes = {'path': path} if path else {}
+        return upload_directory(self, directory, pattern, max_workers, progress, **attributes)
+
     def destroy(self, file_id):
         """
         Delete a file or folder
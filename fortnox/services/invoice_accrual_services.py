@@ -1,4 +1,7 @@
-class InvoiceAccrualService(object):
+from .helpers import BulkActions
+
+
+class InvoiceAccrualService(BulkActions):
     """
     :class:`fortnox.InvoiceAccrualService` is used by :class:`fortnox.Client` to make
     actions related to InvoiceAccrual resource.
@@ -30,6 +33,7 @@ class InvoiceAccrualService(object):
     """
 
     SERVICE = "InvoiceAccrual"
+    PATH = "/invoiceaccruals"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class InvoiceFileConnectionService(object):
+from .helpers import RetrieveManyAction
+
+
+class InvoiceFileConnectionService(RetrieveManyAction):
     """
     :class:`fortnox.InvoiceFileConnectionService` is used by :class:`fortnox.Client` to make
     actions related to InvoiceFileConnection resource.
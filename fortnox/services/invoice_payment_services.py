@@ -1,4 +1,7 @@
-class InvoicePaymentService(object):
+from .helpers import BulkActions
+
+
+class InvoicePaymentService(BulkActions):
     """
     :class:`fortnox.InvoicePaymentService` is used by :class:`fortnox.Client` to make
     actions related to InvoicePayment resource.
@@ -11,6 +14,7 @@ class InvoicePaymentService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['InvoiceNumber', 'Amount', 'AmountCurrency']
     SERVICE = "InvoicePayment"
+    PATH = "/invoicepayments"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class InvoiceService(object):
+from .helpers import BulkActions
+
+
+class InvoiceService(BulkActions):
     """
     :class:`fortnox.InvoiceService` is used by :class:`fortnox.Client` to make
     actions related to InvoiceService resource.
@@ -11,6 +14,7 @@ class InvoiceService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['InvoiceRows', 'CustomerNumber']
     SERVICE = "Invoice"
+    PATH = "/invoices"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class LabelService(object):
+from .helpers import BulkActions
+
+
+class LabelService(BulkActions):
     """
     :class:`fortnox.LabelService` is used by :class:`fortnox.Client` to make
     actions related to Label resource.
@@ -11,6 +14,7 @@ class LabelService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Description']
     SERVICE = "Label"
+    PATH = "/labels"
 
     def __init__(self, http_client):
         """
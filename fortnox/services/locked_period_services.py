@@ -1,4 +1,7 @@
-class LockedPeriodService(object):
+from .helpers import IterAllAction
+
+
+class LockedPeriodService(IterAllAction):
     """
     :class:`fortnox.LockedPeriodService` is used by :class:`fortnox.Client` to make
     actions related to LockedPeriod resource.
@@ -11,6 +14,7 @@ class LockedPeriodService(object):
     """
     OPTS_KEYS_TO_PERSIST = []
     SERVICE = "LockedPeriod"
+    PATH = "/settings/lockedperiod"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class ModesOfPaymentService(object):
+from .helpers import BulkActions
+
+
+class ModesOfPaymentService(BulkActions):
     """
     :class:`fortnox.ModesOfPaymentService` is used by :class:`fortnox.Client` to make
     actions related to ModesOfPayment resource.
@@ -11,6 +14,7 @@ class ModesOfPaymentService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Code', 'Description']
     SERVICE = "ModesOfPayment"
+    PATH = "/modesofpayments"
 
     def __init__(self, http_client):
         """
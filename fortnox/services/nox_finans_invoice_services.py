@@ -1,4 +1,7 @@
-class NoxFinansInvoiceService(object):
+from .helpers import BulkActions
+
+
+class NoxFinansInvoiceService(BulkActions):
     """
     :class:`fortnox.NoxFinansInvoiceService` is used by :class:`fortnox.Client` to make
     actions related to NoxFinansInvoice resource.
@@ -11,6 +14,7 @@ class NoxFinansInvoiceService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['InvoiceNumber', 'SendMethod', 'Service']
     SERVICE = "NoxFinansInvoice"
+    PATH = "/noxfinansinvoices"
 
     def __init__(self, http_client):
         """
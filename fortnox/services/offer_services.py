@@ -1,4 +1,7 @@
-class OfferService(object):
+from .helpers import BulkActions
+
+
+class OfferService(BulkActions):
     """
     :class:`fortnox.OfferService` is used by :class:`fortnox.Client` to make
     actions related to Offer resource.
@@ -29,6 +32,7 @@ class OfferService(object):
     """
 
     SERVICE = "Offer"
+    PATH = "/offers"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class OrderService(object):
+from .helpers import BulkActions
+
+
+class OrderService(BulkActions):
     """
     :class:`fortnox.OrderService` is used by :class:`fortnox.Client` to make
     actions related to Order resource.
@@ -33,6 +36,7 @@ class OrderService(object):
     """
 
     SERVICE = "Order"
+    PATH = "/orders"
 
     def __init__(self, http_client):
         """
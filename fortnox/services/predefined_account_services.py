@@ -1,4 +1,7 @@
-class PredefinedAccountService(object):
+from .helpers import IterAllAction, RetrieveManyAction, UpdateManyAction
+
+
+class PredefinedAccountService(IterAllAction, RetrieveManyAction, UpdateManyAction):
     """
     :class:`fortnox.PredefinedAccountService` is used by :class:`fortnox.Client` to make
     actions related to Predefined Account resource.
@@ -11,6 +14,7 @@ class PredefinedAccountService(object):
     """
     OPTS_KEYS_TO_PERSIST = []
     SERVICE = "PreDefinedAccount"
+    PATH = "/predefinedaccounts"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class PredefinedVoucherSeriesService(object):
+from .helpers import IterAllAction, RetrieveManyAction, UpdateManyAction
+
+
+class PredefinedVoucherSeriesService(IterAllAction, RetrieveManyAction, UpdateManyAction):
     """
     :class:`fortnox.PredefinedVoucherSeriesService` is used by :class:`fortnox.Client` to make
     actions related to Predefined Voucher Series resource.
@@ -11,6 +14,7 @@ class PredefinedVoucherSeriesService(object):
     """
     OPTS_KEYS_TO_PERSIST = []
     SERVICE = "PreDefinedVoucherSeries"
+    PATH = "/predefinedvoucherseries"
 
     def __init__(self, http_client):
         """
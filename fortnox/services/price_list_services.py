@@ -1,4 +1,7 @@
-class PriceListService(object):
+from .helpers import BulkActions
+
+
+class PriceListService(BulkActions):
     """
     :class:`fortnox.PriceListService` is used by :class:`fortnox.Client` to make
     actions related to PriceList resource.
@@ -11,6 +14,7 @@ class PriceListService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Code', 'Description', 'Comments', 'PreSelected']
     SERVICE = "PriceList"
+    PATH = "/pricelists"
 
     def __init__(self, http_client):
         """
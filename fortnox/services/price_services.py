@@ -1,4 +1,7 @@
-class PriceService(object):
+from .helpers import BulkActions
+
+
+class PriceService(BulkActions):
     """
     :class:`fortnox.PriceService` is used by :class:`fortnox.Client` to make
     actions related to Price resource.
@@ -11,6 +14,7 @@ class PriceService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['ArticleNumber', 'FromQuantity', 'Price', 'PriceList']
     SERVICE = "Price"
+    PATH = "/prices"
 
     def __init__(self, http_client):
         """
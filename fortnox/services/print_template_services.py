@@ -1,4 +1,7 @@
-class PrintTemplateService(object):
+from .helpers import IterAllAction
+
+
+class PrintTemplateService(IterAllAction):
     """
     :class:`fortnox.PrintTemplateService` is used by :class:`fortnox.Client` to make
     actions related to PrintTemplate resource.
@@ -11,6 +14,7 @@ class PrintTemplateService(object):
     """
     OPTS_KEYS_TO_PERSIST = []
     SERVICE = "PrintTemplate"
+    PATH = "/printtemplates"
 
     def __init__(self, http_client):
         """
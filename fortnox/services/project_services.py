@@ -1,4 +1,7 @@
-class ProjectService(object):
+from .helpers import BulkActions
+
+
+class ProjectService(BulkActions):
     """
     :class:`fortnox.ProjectService` is used by :class:`fortnox.Client` to make
     actions related to Project resource.
@@ -11,6 +14,7 @@ class ProjectService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Description', ]
     SERVICE = "Project"
+    PATH = "/projects"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class SalaryTransactionService(object):
+from .helpers import BulkActions
+
+
+class SalaryTransactionService(BulkActions):
     """
     :class:`fortnox.SalaryTransactionService` is used by :class:`fortnox.Client` to make
     actions related to SalaryTransaction resource.
@@ -11,6 +14,7 @@ class SalaryTransactionService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['EmployeeId', 'SalaryCode', 'Date', 'Number', 'Amount']
     SERVICE = "SalaryTransaction"
+    PATH = "/salarytransactions"
 
     def __init__(self, http_client):
         """
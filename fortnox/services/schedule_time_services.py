@@ -1,4 +1,7 @@
-class ScheduleTimeService(object):
+from .helpers import IterAllAction, RetrieveManyAction, UpdateManyAction
+
+
+class ScheduleTimeService(IterAllAction, RetrieveManyAction, UpdateManyAction):
     """
     :class:`fortnox.ScheduleTimeService` is used by :class:`fortnox.Client` to make
     actions related to ScheduleTime resource.
@@ -11,6 +14,7 @@ class ScheduleTimeService(object):
     """
     OPTS_KEYS_TO_PERSIST = []
     SERVICE = "ScheduleTime"
+    PATH = "/scheduletimes"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class SIEService(object):
+from .helpers import IterAllAction, RetrieveManyAction
+
+
+class SIEService(IterAllAction, RetrieveManyAction):
     """
     :class:`fortnox.SIEService` is used by :class:`fortnox.Client` to make
     actions related to SIE resource.
@@ -11,6 +14,7 @@ class SIEService(object):
     """
     OPTS_KEYS_TO_PERSIST = []
     SERVICE = "SIE"
+    PATH = "/sie"
 
     def __init__(self, http_client):
         """
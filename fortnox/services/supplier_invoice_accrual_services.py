@@ -1,4 +1,7 @@
-class SupplierInvoiceAccrualService(object):
+from .helpers import BulkActions
+
+
+class SupplierInvoiceAccrualService(BulkActions):
     """
     :class:`fortnox.SupplierInvoiceAccrualService` is used by :class:`fortnox.Client` to make
     actions related to SupplierInvoiceAccrual resource.
@@ -30,6 +33,7 @@ class SupplierInvoiceAccrualService(object):
     """
 
     SERVICE = "SupplierInvoiceAccrual"
+    PATH = "/supplierinvoiceaccruals"
 
     def __init__(self, http_client):
         """
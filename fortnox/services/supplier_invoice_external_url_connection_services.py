@@ -1,4 +1,7 @@
-class SupplierInvoiceExternalURLConnectionService(object):
+from .helpers import BulkActions
+
+
+class SupplierInvoiceExternalURLConnectionService(BulkActions):
     """
     :class:`fortnox.SupplierInvoiceExternalURLConnectionService` is used by :class:`fortnox.Client` to make
     actions related to SupplierInvoiceExternalURLConnection resource.
@@ -11,6 +14,7 @@ class SupplierInvoiceExternalURLConnectionService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['SupplierInvoiceNumber', 'SupplierInvoiceNumber']
     SERVICE = "SupplierInvoiceExternalURLConnection"
+    PATH = "/supplierinvoiceexternalurlconnections"
 
     def __init__(self, http_client):
         """
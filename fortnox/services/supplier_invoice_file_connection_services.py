@@ -1,4 +1,7 @@
-class SupplierInvoiceFileConnectionService(object):
+from .helpers import IterAllAction, RetrieveManyAction, CreateManyAction
+
+
+class SupplierInvoiceFileConnectionService(IterAllAction, RetrieveManyAction, CreateManyAction):
     """
     :class:`fortnox.SupplierInvoiceFileConnectionService` is used by :class:`fortnox.Client` to make
     actions related to SupplierInvoiceFileConnection resource.
@@ -11,6 +14,7 @@ class SupplierInvoiceFileConnectionService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['FileId', 'SupplierInvoiceNumber']
     SERVICE = "SupplierInvoiceFileConnection"
+    PATH = "/supplierinvoicefileconnections"
 
     def __init__(self, http_client):
         """
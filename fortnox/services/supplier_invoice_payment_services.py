@@ -1,4 +1,7 @@
-class SupplierInvoicePaymentService(object):
+from .helpers import BulkActions
+
+
+class SupplierInvoicePaymentService(BulkActions):
     """
     :class:`fortnox.SupplierInvoicePaymentService` is used by :class:`fortnox.Client` to make
     actions related to SupplierInvoicePayment resource.
@@ -11,6 +14,7 @@ class SupplierInvoicePaymentService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Amount', 'InvoiceNumber']
     SERVICE = "SupplierInvoicePayment"
+    PATH = "/supplierinvoicepayments"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class SupplierInvoiceService(object):
+from .helpers import BulkActions
+
+
+class SupplierInvoiceService(BulkActions):
     """
     :class:`fortnox.SupplierInvoiceService` is used by :class:`fortnox.Client` to make
     actions related to SupplierInvoice resource.
@@ -44,6 +47,7 @@ class SupplierInvoiceService(object):
     """
 
     SERVICE = "SupplierInvoice"
+    PATH = "/supplierinvoices"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class SupplierService(object):
+from .helpers import BulkActions
+
+
+class SupplierService(BulkActions):
     """
     :class:`fortnox.SupplierService` is used by :class:`fortnox.Client` to make
     actions related to Supplier resource.
@@ -11,6 +14,7 @@ class SupplierService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Name']
     SERVICE = "Supplier"
+    PATH = "/suppliers"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class TaxReductionService(object):
+from .helpers import BulkActions
+
+
+class TaxReductionService(BulkActions):
     """
     :class:`fortnox.TaxReductionService` is used by :class:`fortnox.Client` to make
     actions related to TaxReduction resource.
@@ -12,6 +15,7 @@ class TaxReductionService(object):
     OPTS_KEYS_TO_PERSIST = ['AskedAmount', 'CustomerName', 'ReferenceDocumentType',
                             'ReferenceNumber', 'SocialSecurityNumber']
     SERVICE = "TaxReduction"
+    PATH = "/taxreductions"
 
     def __init__(self, http_client):
         """
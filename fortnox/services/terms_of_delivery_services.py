@@ -1,4 +1,7 @@
-class TermsOfDeliveryService(object):
+from .helpers import BulkActions
+
+
+class TermsOfDeliveryService(BulkActions):
     """
     :class:`fortnox.TermsOfDeliveryService` is used by :class:`fortnox.Client` to make
     actions related to TermsOfDelivery resource.
@@ -11,6 +14,7 @@ class TermsOfDeliveryService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Code', 'Description']
     SERVICE = "TermsOfDelivery"
+    PATH = "/termsofdeliveries"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class TermsOfPaymentService(object):
+from .helpers import BulkActions
+
+
+class TermsOfPaymentService(BulkActions):
     """
     :class:`fortnox.TermsOfPaymentService` is used by :class:`fortnox.Client` to make
     actions related to TermsOfPayment resource.
@@ -11,6 +14,7 @@ class TermsOfPaymentService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Code', 'Description']
     SERVICE = "TermsOfPayment"
+    PATH = "/termsofpayments"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class TrustedDomainService(object):
+from .helpers import IterAllAction, RetrieveManyAction, CreateManyAction
+
+
+class TrustedDomainService(IterAllAction, RetrieveManyAction, CreateManyAction):
     """
     :class:`fortnox.TrustedDomainService` is used by :class:`fortnox.Client` to make
     actions related to TrustedDomain resource.
@@ -11,6 +14,7 @@ class TrustedDomainService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Domain']
     SERVICE = "TrustedDomain"
+    PATH = "/emailtrusteddomains"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class TrustedSenderService(object):
+from .helpers import IterAllAction, RetrieveManyAction, CreateManyAction
+
+
+class TrustedSenderService(IterAllAction, RetrieveManyAction, CreateManyAction):
     """
     :class:`fortnox.TrustedSenderService` is used by :class:`fortnox.Client` to make
     actions related to TrustedSender resource.
@@ -11,6 +14,7 @@ class TrustedSenderService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Email']
     SERVICE = "TrustedSender"
+    PATH = "/emailsenders"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class UnitService(object):
+from .helpers import BulkActions
+
+
+class UnitService(BulkActions):
     """
     :class:`fortnox.UnitService` is used by :class:`fortnox.Client` to make
     actions related to Unit resource.
@@ -11,6 +14,7 @@ class UnitService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Code', 'Description']
     SERVICE = "Unit"
+    PATH = "/units"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class VoucherFileConnectionService(object):
+from .helpers import IterAllAction, RetrieveManyAction, CreateManyAction
+
+
+class VoucherFileConnectionService(IterAllAction, RetrieveManyAction, CreateManyAction):
     """
     :class:`fortnox.VoucherFileConnectionService` is used by :class:`fortnox.Client` to make
     actions related to VoucherFileConnection resource.
@@ -11,6 +14,7 @@ class VoucherFileConnectionService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['FileId', 'VoucherNumber', 'VoucherSeries']
     SERVICE = "VoucherFileConnection"
+    PATH = "/voucherfileconnections"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class VoucherSeriesService(object):
+from .helpers import BulkActions
+
+
+class VoucherSeriesService(BulkActions):
     """
     :class:`fortnox.VoucherSeriesService` is used by :class:`fortnox.Client` to make
     actions related to VoucherSeries resource.
@@ -11,6 +14,7 @@ class VoucherSeriesService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Code', 'Description']
     SERVICE = "VoucherSeries"
+    PATH = "/voucherseries"
 
     def __init__(self, http_client):
         """
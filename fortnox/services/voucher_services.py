@@ -1,4 +1,7 @@
-class VoucherService(object):
+from .helpers import IterAllAction, RetrieveManyAction, CreateManyAction
+
+
+class VoucherService(IterAllAction, RetrieveManyAction, CreateManyAction):
     """
     :class:`fortnox.VoucherService` is used by :class:`fortnox.Client` to make
     actions related to Voucher resource.
@@ -31,6 +34,7 @@ class VoucherService(object):
     """
 
     SERVICE = "Voucher"
+    PATH = "/vouchers"
 
     def __init__(self, http_client):
         """
@@ -1,4 +1,7 @@
-class WayOfDeliveryService(object):
+from .helpers import BulkActions
+
+
+class WayOfDeliveryService(BulkActions):
     """
     :class:`fortnox.WayOfDeliveryService` is used by :class:`fortnox.Client` to make
     actions related to WayOfDelivery resource.
@@ -11,6 +14,7 @@ class WayOfDeliveryService(object):
     """
     OPTS_KEYS_TO_PERSIST = ['Code', 'Description']
     SERVICE = "WayOfDelivery"
+    PATH = "/wayofdeliveries"
 
     def __init__(self, http_client):
         """
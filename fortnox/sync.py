@@ -0,0 +1,257 @@
+import collections
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+from fortnox.errors import ConfigurationError
+from fortnox.services.helpers import iterate_pages_from_paginators
+
+"""
+Resource kept in sync.
+
+:attribute str service: Name of the service property on :class:`Client <fortnox.Client>`.
+:attribute str path: Sub url of the list endpoint.
+:attribute tuple key: Fields identifying a record.
+"""
+SyncResource = collections.namedtuple('SyncResource', ['service', 'path', 'key'])
+
+"""
+Outcome of a sync run.
+
+:attribute str resource: Name of the resource.
+:attribute list changes: Records created or modified since the previous run, once each.
+:attribute str high_water_mark: ``lastmodified`` value the next run will start from.
+"""
+SyncResult = collections.namedtuple('SyncResult', ['resource', 'changes', 'high_water_mark'])
+
+"""
+Format of the ``lastmodified`` filter.
+"""
+LAST_MODIFIED_FORMAT = '%Y-%m-%d %H:%M'
+
+
+def fortnox_now():
+    """
+    Current time in Sweden, the time zone ``lastmodified`` is expressed in.
+    """
+    if ZoneInfo is None:
+        return datetime.now()
+    return datetime.now(ZoneInfo('Europe/Stockholm'))
+
+
+class MemoryCheckpointStore(object):
+    """
+    Checkpoints kept for the lifetime of the process.
+    """
+
+    def __init__(self):
+        self.__checkpoints = {}
+
+    def load(self, resource):
+        """
+        :param str resource: Name of the resource.
+        :return: Checkpoint of the resource, an empty dictionary if there is none.
+        :rtype: dict
+        """
+        return dict(self.__checkpoints.get(resource, {}))
+
+    def save(self, resource, checkpoint):
+        """
+        :param str resource: Name of the resource.
+        :param dict checkpoint: Checkpoint to persist.
+        """
+        self.__checkpoints[resource] = dict(checkpoint)
+
+
+class JSONCheckpointStore(object):
+    """
+    Checkpoints persisted to a json file, so that a restarted job resumes where it stopped.
+
+    The file is replaced atomically on every save and never left half written.
+    """
+
+    def __init__(self, path):
+        """
+        :param str path: Json file holding the checkpoints of every resource, created if missing.
+        """
+        self.path = path
+        self.__lock = threading.Lock()
+
+    def read(self):
+        try:
+            with open(self.path, 'r') as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return {}
+
+    def load(self, resource):
+        with self.__lock:
+            return self.read().get(resource, {})
+
+    def save(self, resource, checkpoint):
+        with self.__lock:
+            checkpoints = self.read()
+            checkpoints[resource] = checkpoint
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.checkpoints')
+            try:
+                with os.fdopen(fd, 'w') as fp:
+                    json.dump(checkpoints, fp, indent=2, sort_keys=True)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+
+class SyncEngine(object):
+    """
+    Downloads only the records changed since the previous run, using the ``lastmodified`` filter.
+
+    Every resource has a high-water mark: the time the last completed run started. A run asks for
+    the records modified since that mark, pages through them, drops records already seen during
+    the run and moves the mark forward once the last page is consumed. The page reached is
+    checkpointed as the run goes, so a job that is stopped and restarted resumes from that page.
+
+    ``lastmodified`` only has a precision of one minute, so a record modified in the minute a run
+    started may be reported again by the next run.
+
+    Usage::
+
+      >>> engine = fortnox.SyncEngine(client, fortnox.JSONCheckpointStore('checkpoints.json'))
+      >>> for invoice in engine.iter_changes('invoices'):
+      ...     warehouse.upsert(invoice)
+    """
+
+    RESOURCES = {
+        'articles': SyncResource('articles', '/articles', ('ArticleNumber',)),
+        'customers': SyncResource('customers', '/customers', ('CustomerNumber',)),
+        'invoices': SyncResource('invoices', '/invoices', ('DocumentNumber',)),
+        'offers': SyncResource('offers', '/offers', ('DocumentNumber',)),
+        'orders': SyncResource('orders', '/orders', ('DocumentNumber',)),
+        'supplier_invoices': SyncResource('supplier_invoices', '/supplierinvoices', ('GivenNumber',)),
+        'suppliers': SyncResource('suppliers', '/suppliers', ('SupplierNumber',)),
+        'vouchers': SyncResource('vouchers', '/vouchers', ('VoucherSeries', 'VoucherNumber', 'Year')),
+    }
+
+    def __init__(self, client, store=None, resources=None, page_size=500, clock=fortnox_now):
+        """
+        :param :class:`fortnox.Client` client: Client the records are fetched with.
+        :param store: (optional) Checkpoint store. Default: :class:`MemoryCheckpointStore <MemoryCheckpointStore>`.
+        :param dict resources: (optional) :class:`SyncResource <SyncResource>` by name. Default: ``RESOURCES``.
+        :param int page_size: (optional) Records requested per page. Default: **500**.
+        :param callable clock: (optional) Returns the current time in Fortnox's time zone.
+        """
+        self.client = client
+        self.store = store if store is not None else MemoryCheckpointStore()
+        self.resources = dict(self.RESOURCES if resources is None else resources)
+        self.page_size = page_size
+        self.clock = clock
+
+    def resource(self, name):
+        try:
+            return self.resources[name]
+        except KeyError:
+            raise ConfigurationError('Unknown sync resource {name}, '
+                                     'known resources are: {known}.'.format(name=name,
+                                                                            known=', '.join(sorted(self.resources))))
+
+    def high_water_mark(self, name):
+        """
+        :param str name: Name of the resource.
+        :return: ``lastmodified`` value the next run starts from, ``None`` before the first complete run.
+        :rtype: str
+        """
+        return self.store.load(name).get('high_water_mark')
+
+    def reset(self, name):
+        """
+        Forget the checkpoint of a resource, its next run downloads every record again.
+
+        :param str name: Name of the resource.
+        """
+        self.store.save(name, {})
+
+    def iter_change_pages(self, name, **params):
+        """
+        Iterate over the records of a resource changed since the previous run, one page at a time.
+
+        A page is checkpointed once the consumer asks for the next one, so it may process the whole
+        page, e.g. write it to a database, before the run is allowed to move past it.
+
+        :param str name: Name of the resource, e.g. ``invoices``.
+        :param dict params: (optional) Additional search options.
+        :return: Generator of lists of dictionaries that support attriubte-style access.
+        :rtype: generator
+        """
+        resource = self.resource(name)
+        checkpoint = self.store.load(name)
+        run = checkpoint.get('run')
+        if run is None:
+            run = {
+                'since': checkpoint.get('high_water_mark'),
+                'started': self.clock().strftime(LAST_MODIFIED_FORMAT),
+                'page': 1,
+            }
+
+        params = dict(params, limit=self.page_size)
+        if run['since']:
+            params['lastmodified'] = run['since']
+
+        service = getattr(self.client, resource.service)
+        seen = set()
+        for page, items in iterate_pages_from_paginators(service, params, resource.path, start_page=run['page']):
+            changes = []
+            for item in items:
+                key = tuple(item.get(field) for field in resource.key)
+                if key not in seen:
+                    seen.add(key)
+                    changes.append(item)
+            if changes:
+                yield changes
+            run['page'] = page + 1
+            self.store.save(name, dict(checkpoint, run=run))
+
+        self.store.save(name, {'high_water_mark': run['started']})
+
+    def iter_changes(self, name, **params):
+        """
+        Iterate over the records of a resource changed since the previous run.
+
+        The high-water mark only moves once the generator is exhausted. Stopping earlier keeps the
+        checkpoint of the last consumed page, and the next run resumes from the page after it.
+
+        :param str name: Name of the resource, e.g. ``invoices``.
+        :param dict params: (optional) Additional search options.
+        :return: Generator of dictionaries that support attriubte-style access.
+        :rtype: generator
+        """
+        for changes in self.iter_change_pages(name, **params):
+            yield from changes
+
+    def sync(self, name, **params):
+        """
+        Collect the records of a resource changed since the previous run.
+
+        :param str name: Name of the resource, e.g. ``invoices``.
+        :param dict params: (optional) Additional search options.
+        :rtype: SyncResult
+        """
+        changes = list(self.iter_changes(name, **params))
+        return SyncResult(name, changes, self.high_water_mark(name))
+
+    def sync_all(self, names=None):
+        """
+        Sync several resources one after the other.
+
+        :param list names: (optional) Names of the resources. Default: every known resource.
+        :return: :class:`SyncResult <SyncResult>` by resource name.
+        :rtype: dict
+        """
+        return dict((name, self.sync(name)) for name in (names or sorted(self.resources)))
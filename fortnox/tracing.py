@@ -0,0 +1,196 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import threading
+import time
+
+"""
+Attribute names set on the spans.
+"""
+SERVICE_ATTRIBUTE = 'fortnox.service'
+RESOURCE_ATTRIBUTE = 'fortnox.resource'
+ENDPOINT_ATTRIBUTE = 'fortnox.endpoint'
+PAGE_ATTRIBUTE = 'fortnox.page'
+ITEM_COUNT_ATTRIBUTE = 'fortnox.item_count'
+METHOD_ATTRIBUTE = 'http.request.method'
+URL_ATTRIBUTE = 'url.full'
+STATUS_ATTRIBUTE = 'http.response.status_code'
+
+
+def is_tracer(tracer):
+    """
+    Whether an object can be used as tracer: it has a ``start_as_current_span(name, attributes=None)``
+    returning a context manager of a span with a ``set_attribute(key, value)`` method, as
+    OpenTelemetry tracers do.
+    """
+    return callable(getattr(tracer, 'start_as_current_span', None))
+
+
+def item_count(result):
+    """
+    :return: Number of items of a result, ``None`` if it is not a collection, e.g. a single resource.
+    :rtype: int
+    """
+    items = getattr(result, 'results', result)
+    return len(items) if isinstance(items, list) else None
+
+
+class TracedService(object):
+    """
+    Wraps every public method of a service in a span named after it, e.g. ``InvoiceService.list``.
+
+    Spans carry the service, the resource, the requested page and the number of items returned;
+    the http spans of the requests sent by the method are nested in it. The span of a generator,
+    e.g. ``iter_all``, lasts until the generator is exhausted or closed. Attributes other than
+    methods are read from the service itself.
+
+    Normally you won't instantiate this class directly, :class:`Client <fortnox.Client>` wraps
+    its services when a ``tracer`` is configured.
+    """
+
+    def __init__(self, service, tracer):
+        """
+        :param service: Service to trace.
+        :param tracer: Tracer the spans are started with.
+        """
+        self.__service = service
+        self.__tracer = tracer
+        self.__name = type(service).__name__
+        self.__resource = self.__name[:-len('Service')] if self.__name.endswith('Service') else self.__name
+
+    def __getattr__(self, name):
+        value = getattr(self.__service, name)
+        if name.startswith('_') or not inspect.ismethod(value):
+            return value
+        traced = self.trace(value, name)
+        # later lookups find the wrapper without going through __getattr__
+        setattr(self, name, traced)
+        return traced
+
+    def trace(self, method, name):
+        span_name = '{service}.{method}'.format(service=self.__name, method=name)
+        tracer = self.__tracer
+        service_name, resource = self.__name, self.__resource
+
+        def span_attributes(kwargs):
+            attributes = {SERVICE_ATTRIBUTE: service_name, RESOURCE_ATTRIBUTE: resource}
+            if kwargs.get('page') is not None:
+                attributes[PAGE_ATTRIBUTE] = kwargs['page']
+            return attributes
+
+        def end_span(span, result):
+            count = item_count(result)
+            if count is not None:
+                span.set_attribute(ITEM_COUNT_ATTRIBUTE, count)
+            return result
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def traced(*args, **kwargs):
+                with tracer.start_as_current_span(span_name, attributes=span_attributes(kwargs)) as span:
+                    return end_span(span, await method(*args, **kwargs))
+        elif inspect.isasyncgenfunction(method):
+            @functools.wraps(method)
+            async def traced(*args, **kwargs):
+                # the span stays open while the items are consumed, the requests run in it
+                with tracer.start_as_current_span(span_name, attributes=span_attributes(kwargs)) as span:
+                    count = 0
+                    try:
+                        async for item in method(*args, **kwargs):
+                            count += 1
+                            yield item
+                    finally:
+                        span.set_attribute(ITEM_COUNT_ATTRIBUTE, count)
+        elif inspect.isgeneratorfunction(method):
+            @functools.wraps(method)
+            def traced(*args, **kwargs):
+                # the span stays open while the items are consumed, the requests run in it
+                with tracer.start_as_current_span(span_name, attributes=span_attributes(kwargs)) as span:
+                    count = 0
+                    try:
+                        for item in method(*args, **kwargs):
+                            count += 1
+                            yield item
+                    finally:
+                        span.set_attribute(ITEM_COUNT_ATTRIBUTE, count)
+        else:
+            @functools.wraps(method)
+            def traced(*args, **kwargs):
+                with tracer.start_as_current_span(span_name, attributes=span_attributes(kwargs)) as span:
+                    return end_span(span, method(*args, **kwargs))
+
+        return traced
+
+    def __repr__(self):
+        return '<TracedService {service!r}>'.format(service=self.__service)
+
+
+class RecordedSpan(object):
+    """
+    Span kept in memory by :class:`RecordingTracer`.
+
+    :attribute str name: Name of the span.
+    :attribute dict attributes: Attributes of the span.
+    :attribute RecordedSpan parent: Span that was current when this one started, ``None`` for a root.
+    :attribute float start: Start, in seconds of :func:`time.perf_counter`.
+    :attribute float end: End, ``None`` while the span is open.
+    :attribute Exception error: Error raised inside the span.
+    """
+
+    __slots__ = ('name', 'attributes', 'parent', 'start', 'end', 'error')
+
+    def __init__(self, name, attributes=None, parent=None):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+        self.start = time.perf_counter()
+        self.end = None
+        self.error = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    @property
+    def duration(self):
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def __repr__(self):
+        return '<RecordedSpan {name} {duration:.6f}s>'.format(name=self.name, duration=self.duration)
+
+
+class RecordingTracer(object):
+    """
+    Minimal tracer keeping finished spans in memory, to see where time goes without an
+    OpenTelemetry setup, e.g. in a benchmark or a test.
+
+    Usage::
+
+      >>> tracer = fortnox.RecordingTracer()
+      >>> client = fortnox.Client(access_token='...', client_secret='...', tracer=tracer)
+      >>> client.invoices.list()
+      >>> [(span.name, span.duration) for span in tracer.spans]
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.current = contextvars.ContextVar('fortnox_current_span', default=None)
+        self.lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = RecordedSpan(name, attributes, parent=self.current.get())
+        token = self.current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = e
+            raise
+        finally:
+            span.end = time.perf_counter()
+            self.current.reset(token)
+            with self.lock:
+                self.spans.append(span)
+
+    def children(self, span):
+        return [child for child in self.spans if child.parent is span]
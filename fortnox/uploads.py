@@ -0,0 +1,132 @@
+import io
+import os
+import tempfile
+
+from requests_toolbelt import MultipartEncoder
+
+"""
+Bytes read from a file at once while building a multipart upload.
+"""
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+"""
+Size above which an upload of unknown size is spooled to disk rather than memory.
+"""
+SPOOL_MAX_SIZE = 4 * 1024 * 1024
+
+
+def open_upload(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Turn an upload source into a readable file object without reading it in memory.
+
+    :param source: File path, open binary file, bytes, or iterator of bytes chunks. Iterators have no
+        known size, they are spooled to a temporary file which stays in memory up to ``SPOOL_MAX_SIZE``.
+    :param int chunk_size: (optional) Bytes copied at once when spooling an iterator.
+    :return: Tuple of the file object, whether the caller owns (and must close) it, and its name if known.
+    :rtype: tuple
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, 'rb'), True, os.path.basename(source)
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source), True, None
+    if hasattr(source, 'read'):
+        name = getattr(source, 'name', None)
+        return source, False, os.path.basename(name) if isinstance(name, str) else None
+
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    for chunk in source:
+        spooled.write(chunk)
+    spooled.seek(0)
+    return spooled, True, None
+
+
+class UploadBody(object):
+    """
+    Streams a multipart file upload in chunks of ``chunk_size`` bytes and reports its progress.
+
+    Files it opened are closed once the whole body has been read. A body built from a path, bytes or
+    a seekable file object can be read again from the start with :meth:`rewind`, e.g. to retry a
+    rate limited upload; one built from an iterator or a stream that is not seekable cannot.
+    """
+
+    def __init__(self, source, file_name=None, chunk_size=DEFAULT_CHUNK_SIZE, progress=None,
+                 content_type='application/octet-stream'):
+        """
+        :param source: File path, open binary file, bytes or iterator of bytes chunks.
+        :param str file_name: (optional) Name of the uploaded file. Default: the name of the file.
+        :param int chunk_size: (optional) Bytes sent at once. Default: **64 KB**.
+        :param callable progress: (optional) Called with the bytes sent so far and the total after every chunk.
+        :param str content_type: (optional) Content type of the file part.
+        """
+        self.source = source
+        self.file, self.owned, name = open_upload(source, chunk_size)
+        self.file_name = file_name or name or 'upload'
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.file_type = content_type
+        # position the upload of a caller's file object starts at, None if it cannot be read again
+        self.start = self.file.tell() if not self.owned and self.is_seekable(self.file) else None
+        self.encoder = MultipartEncoder(fields={'file': (self.file_name, self.file, content_type)})
+        self.bytes_read = 0
+
+    @staticmethod
+    def is_seekable(file):
+        try:
+            return file.seekable()
+        except (AttributeError, OSError, ValueError):
+            return False
+
+    @property
+    def is_rewindable(self):
+        """
+        Whether the body can be read again from the start, see :meth:`rewind`.
+        """
+        return isinstance(self.source, (str, os.PathLike, bytes, bytearray)) or self.start is not None
+
+    def rewind(self):
+        """
+        Start over to send the body again, with the same multipart boundary.
+
+        :raises io.UnsupportedOperation: if the body was built from an iterator or a file object
+            that is not seekable.
+        """
+        if not self.is_rewindable:
+            raise io.UnsupportedOperation('The upload cannot be sent again, '
+                                          'upload a path, bytes or a seekable file object.')
+        if self.owned:
+            self.close()
+            self.file = open_upload(self.source, self.chunk_size)[0]
+        else:
+            self.file.seek(self.start)
+        self.encoder = MultipartEncoder(fields={'file': (self.file_name, self.file, self.file_type)},
+                                        boundary=self.encoder.boundary_value)
+        self.bytes_read = 0
+
+    @property
+    def content_type(self):
+        return self.encoder.content_type
+
+    @property
+    def len(self):
+        return self.encoder.len
+
+    def __len__(self):
+        return self.encoder.len
+
+    def read(self, size=-1):
+        """
+        Read the next chunk of the encoded body, ``size`` is ignored in favour of ``chunk_size``.
+        """
+        chunk = self.encoder.read(self.chunk_size)
+        if chunk:
+            self.bytes_read += len(chunk)
+            if self.progress is not None:
+                self.progress(self.bytes_read, self.len)
+        else:
+            self.close()
+        return chunk
+
+    def close(self):
+        if self.owned and not self.file.closed:
+            self.file.close()
+
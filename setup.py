@@ -22,11 +22,16 @@ setuptools.setup(
     url="https://github.com/xalien10/pyfortnox",
     packages=setuptools.find_packages(
         exclude=[
-            'tests', 'tests.*',
+            'tests', 'tests.*', 'benchmarks', 'benchmarks.*',
         ]
     ),
     include_package_data=True,
     install_requires=install_requires,
+    extras_require={
+        'async': ['httpx>=0.23'],
+        'fast': ['orjson'],
+        'export': ['pyarrow'],
+    },
     zip_safe=False,
     platforms='any',
     classifiers=[
@@ -34,5 +39,5 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
 )
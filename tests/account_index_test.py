@@ -0,0 +1,118 @@
+import threading
+import time
+import unittest
+from datetime import datetime
+
+from munch import munchify
+
+from fortnox import AccountIndex, RowError
+
+
+def account(number, year=5, **attributes):
+    return munchify(dict({'Number': number, 'Year': year, 'Active': True, 'Description': 'Account {0}'.format(number),
+                          'VATCode': None, 'SRU': 7201, 'CostCenterSettings': 'ALLOWED',
+                          'ProjectSettings': 'ALLOWED'}, **attributes))
+
+
+class FakeAccountsService(object):
+    """
+    Lists the accounts of every financial year, only those changed since ``lastmodified`` when it is given.
+    """
+
+    def __init__(self, accounts, changed=()):
+        self.accounts = accounts
+        self.changed = changed
+        self.calls = []
+
+    def list(self, **params):
+        self.calls.append(params)
+        accounts = self.changed if 'lastmodified' in params else self.accounts
+        return [item for item in accounts if params.get('financialyear') in (None, item.Year)]
+
+
+class AccountIndexTest(unittest.TestCase):
+    """
+    Test cases for AccountIndex class
+    """
+
+    def setUp(self):
+        self.service = FakeAccountsService([account(number) for number in (1930, 2440, 3001, 3010, 3999, 4010)] +
+                                           [account(1930, year=4, Description='Old bank')])
+        self.clock = lambda: datetime(2026, 10, 18, 9, 30)
+        self.index = AccountIndex.build(self.service, financial_years=[4, 5], clock=self.clock)
+
+    def test_lookup_by_number_and_year(self):
+        self.assertEqual(self.index[1930].Description, 'Account 1930')
+        self.assertEqual(self.index.get('1930', year=4).Description, 'Old bank')
+        self.assertIsNone(self.index.get(3001, year=4))
+        self.assertNotIn(1234, self.index)
+        self.assertEqual(self.index.years, [4, 5])
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual(self.service.calls, [{'financialyear': 4}, {'financialyear': 5}])
+
+    def test_range_queries_include_both_bounds(self):
+        self.assertEqual([item.Number for item in self.index.between(3000, 3999)], [3001, 3010, 3999])
+        self.assertEqual(self.index.between(5000, 5999), [])
+        self.assertEqual([item.Number for item in self.index.between(1000, 1999, year=4)], [1930])
+
+    def test_refresh_only_fetches_changed_accounts(self):
+        self.service.changed = [account(3010, Active=False), account(3020)]
+        self.assertEqual(self.index.refresh(self.service), 2)
+        self.assertEqual(self.service.calls[-1], {'financialyear': 5, 'lastmodified': '2026-10-18 09:30'})
+        self.assertFalse(self.index.is_active(3010))
+        self.assertEqual([item.Number for item in self.index.between(3000, 3999)], [3001, 3010, 3020, 3999])
+
+    def test_validate_rows(self):
+        self.index.update([account(4010, CostCenterSettings='MANDATORY'), account(2440, Active=False),
+                           account(3001, ProjectSettings='NOTALLOWED')])
+        rows = [{'Account': 1930, 'Debit': 100}, {'Account': 4010}, {'Account': 2440}, {'Account': 9999},
+                {'Account': 3001, 'Project': '7'}, {'Account': 4010, 'CostCenter': 'SALES'}]
+        self.assertEqual(self.index.validate_rows(rows), [
+            RowError(1, 4010, 'Account 4010 requires a cost center'),
+            RowError(2, 2440, 'Account 2440 is inactive'),
+            RowError(3, 9999, 'Account 9999 does not exist'),
+            RowError(4, 3001, 'Account 3001 does not allow a project'),
+        ])
+        self.assertEqual(self.index.validate(1930, year=4), [])
+
+    def test_validating_many_rows_needs_no_api_call(self):
+        index = AccountIndex(account(number) for number in range(1000, 9000))
+        rows = [{'Account': 1000 + number % 8000} for number in range(100000)]
+        started = time.perf_counter()
+        self.assertEqual(index.validate_rows(rows), [])
+        self.assertLess(time.perf_counter() - started, 2)
+
+    def test_updates_do_not_change_what_readers_hold(self):
+        accounts = self.index.accounts()
+        revenue = self.index.between(3000, 3999)
+        self.index.update([account(3020), account(3001, Active=False)])
+        self.assertNotIn(3020, accounts)
+        self.assertTrue(accounts[3001].Active)
+        self.assertEqual([item.Number for item in revenue], [3001, 3010, 3999])
+        self.assertIn(3020, self.index)
+
+    def test_lookups_run_alongside_updates(self):
+        errors = []
+
+        def read():
+            try:
+                for _ in range(200):
+                    for item in self.index.accounts().values():
+                        self.assertTrue(item.Active)
+                    self.index.between(5000, 9999)
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for number in range(5000, 5500):
+            self.index.update([account(number)])
+        for reader in readers:
+            reader.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.index.between(5000, 9999)), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import json
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from fortnox import AsyncClient, AsyncHttpClient, Configuration, RecordingTracer, RetryPolicy
+
+
+class AsyncClientTest(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for AsyncClient class
+    """
+
+    def setUp(self):
+        self.options = {
+            'base_url': 'https://api.fortnox.se',
+            'access_token': 'this-is-my-access-token',
+            'timeout': 20,
+            'client_secret': 'my-test-client-secret'
+        }
+        self.requests = []
+
+    def handler(self, request):
+        self.requests.append(request)
+        if request.method == 'DELETE':
+            return httpx.Response(204)
+        if request.url.path == '/3/accounts':
+            page = int(request.url.params.get('page', 1))
+            data = {
+                "MetaInformation": {"@TotalResources": 3, "@TotalPages": 3, "@CurrentPage": page},
+                "Accounts": [{"Number": 1000 + page}]
+            }
+            return httpx.Response(200, json=data)
+        if request.method == 'POST':
+            return httpx.Response(201, json={'Customer': json.loads(request.content)['Customer']})
+        return httpx.Response(200, json={'Voucher': {'VoucherNumber': 7}})
+
+    def mocked_session(self):
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+    async def test_services_are_generated_from_sync_services(self):
+        with patch.object(AsyncHttpClient, 'build_session', lambda _: self.mocked_session()):
+            async with AsyncClient(**self.options) as client:
+                self.assertTrue(hasattr(client.customers, 'destroy'))
+                self.assertFalse(hasattr(client.vouchers, 'destroy'))
+
+                customer = await client.customers.create(Name='Acme')
+                self.assertEqual(customer.Name, 'Acme')
+                self.assertTrue(await client.customers.destroy(10))
+
+                voucher = await client.vouchers.retrieve('A', 7)
+                self.assertEqual(voucher.VoucherNumber, 7)
+                self.assertEqual(self.requests[-1].url.path, '/3/vouchers/sublist/A/7')
+
+    async def test_accounts_list_walks_through_every_page(self):
+        with patch.object(AsyncHttpClient, 'build_session', lambda _: self.mocked_session()):
+            async with AsyncClient(**self.options) as client:
+                accounts = await client.accounts.list()
+        self.assertEqual([account.Number for account in accounts], [1001, 1002, 1003])
+
+    async def test_iter_all_span_covers_every_page(self):
+        tracer = RecordingTracer()
+        with patch.object(AsyncHttpClient, 'build_session', lambda _: self.mocked_session()):
+            async with AsyncClient(tracer=tracer, **self.options) as client:
+                accounts = [account.Number async for account in client.accounts.iter_all()]
+        self.assertEqual(accounts, [1001, 1002, 1003])
+        service_span = next(span for span in tracer.spans if span.name == 'AsyncAccountsService.iter_all')
+        self.assertEqual(service_span.attributes['fortnox.item_count'], 3)
+        self.assertEqual(len([span for span in tracer.spans if span.parent is service_span]), 3)
+
+    async def test_rate_limited_uploads_are_retried(self):
+        sent = []
+
+        def handler(request):
+            sent.append(request.read())
+            if len(sent) == 1:
+                return httpx.Response(429)
+            return httpx.Response(200, json={'File': {'Name': 'a.pdf'}})
+
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(AsyncHttpClient, 'build_session', lambda _: session):
+            async with AsyncHttpClient(Configuration(retry_policy=RetryPolicy(backoff_base=0, jitter=False),
+                                                     **self.options)) as client:
+                _, _, file = await client.post('/inbox', body={'file': b'%PDF', 'file_name': 'a.pdf'})
+        self.assertEqual(file.Name, 'a.pdf')
+        self.assertEqual(len(sent), 2)
+        self.assertEqual(sent[1], sent[0])
+        self.assertIn(b'%PDF', sent[1])
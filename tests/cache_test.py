@@ -0,0 +1,354 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from requests import Response
+
+from fortnox import (HttpClient, Configuration, ConfigurationError, ResponseCache, HttpCache, MemoryBackend,
+                     SQLiteBackend, DirectoryBackend, MmapBackend)
+from fortnox.cache import CacheEntry
+from fortnox.decoders import Decoder
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ResponseCacheTest(unittest.TestCase):
+    """
+    Test cases for ResponseCache class
+    """
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(MemoryBackend(clock=self.clock))
+        self.config = Configuration(access_token='this-is-my-access-token', client_secret='my-test-client-secret',
+                                    rate_limit=None, cache=self.cache)
+
+    def make_response(self, data):
+        response = Response()
+        response._content = json.dumps(data).encode('utf-8')
+        response.status_code = 200
+        response.headers = {'Content-Type': 'application/json'}
+        return response
+
+    def test_reference_data_is_served_from_cache(self):
+        client = HttpClient(self.config)
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = self.make_response({'Unit': {'Code': 'st'}})
+            first = client.get('/units/st')[2]
+            second = client.get('/units/st')[2]
+            self.assertEqual(mocked_request.call_count, 1)
+            self.assertEqual(second.Code, 'st')
+            self.assertIsNot(first, second)
+
+            self.clock.now = 3601
+            client.get('/units/st')
+            self.assertEqual(mocked_request.call_count, 2)
+
+    def test_writes_invalidate_the_resource(self):
+        client = HttpClient(self.config)
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = self.make_response({'Units': [{'Code': 'st'}], 'MetaInformation': {}})
+            client.get('/units')
+            mocked_request.return_value = self.make_response({'Unit': {'Code': 'kg'}})
+            client.post('/units', body={'Code': 'kg'})
+            client.get('/units')
+            self.assertEqual(mocked_request.call_count, 3)
+
+    def test_resources_without_policy_are_not_cached(self):
+        client = HttpClient(self.config)
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = self.make_response({'Invoice': {'DocumentNumber': '1'}})
+            client.get('/invoices/1')
+            client.get('/invoices/1')
+            self.assertEqual(mocked_request.call_count, 2)
+
+    def test_keys_are_namespaced_by_access_token(self):
+        self.assertNotEqual(self.cache.key('token-a', '/units'), self.cache.key('token-b', '/units'))
+        self.assertNotIn('token-a', self.cache.key('token-a', '/units'))
+
+    def test_memory_backend_evicts_least_recently_used(self):
+        backend = MemoryBackend(maxsize=2)
+        for key in ('a', 'b'):
+            backend.set(key, CacheEntry(200, {}, b''))
+        backend.get('a')
+        backend.set('c', CacheEntry(200, {}, b''))
+        self.assertIsNotNone(backend.get('a'))
+        self.assertIsNone(backend.get('b'))
+
+    def test_sqlite_backend_is_shared_through_the_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.db')
+            writer, reader = SQLiteBackend(path, maxsize=2), SQLiteBackend(path, maxsize=2)
+            writer.set('ns:/units:/units?', CacheEntry(200, {'Content-Type': 'application/json'}, b'{}'), ttl=60)
+            self.assertEqual(reader.get('ns:/units:/units?').content, b'{}')
+
+            reader.delete_prefix('ns:/units:')
+            self.assertIsNone(writer.get('ns:/units:/units?'))
+
+            for key in ('a', 'b', 'c'):
+                writer.set(key, CacheEntry(200, {}, b''))
+            self.assertEqual(len(writer), 2)
+            writer.close()
+            reader.close()
+
+    def test_memory_backend_evicts_beyond_max_bytes(self):
+        backend = MemoryBackend(max_bytes=10)
+        backend.set('a', CacheEntry(200, {}, b'1234'))
+        backend.set('b', CacheEntry(200, {}, b'1234'))
+        backend.set('c', CacheEntry(200, {}, b'1234'))
+        self.assertIsNone(backend.get('a'))
+        self.assertEqual(backend.size, 8)
+        backend.set('d', CacheEntry(200, {}, b'12345678901'))
+        self.assertIsNone(backend.get('d'))
+        self.assertEqual(len(backend), 2)
+
+    def test_directory_backend_survives_reopening(self):
+        with tempfile.TemporaryDirectory() as directory:
+            backend = DirectoryBackend(directory, max_bytes=1024)
+            backend.set('ns:/units:/units?', CacheEntry(200, {'ETag': '"1"'}, b'{"Units": []}'))
+            backend.set('ns:/accounts:/accounts?', CacheEntry(200, {}, b'{}'), ttl=-1)
+
+            reopened = DirectoryBackend(directory, max_bytes=1024)
+            entry = reopened.get('ns:/units:/units?')
+            self.assertEqual(entry, CacheEntry(200, {'ETag': '"1"'}, b'{"Units": []}'))
+            self.assertIsNone(reopened.get('ns:/accounts:/accounts?'))
+            self.assertEqual(len(reopened), 1)
+
+            reopened.delete_prefix('ns:/units:')
+            self.assertEqual(len(reopened), 0)
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_directory_backend_evicts_beyond_max_bytes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            backend = DirectoryBackend(directory, max_bytes=400)
+            for key in ('a', 'b', 'c'):
+                backend.set(key, CacheEntry(200, {}, b'x' * 100))
+                backend.get('a')
+            self.assertIsNotNone(backend.get('a'))
+            self.assertIsNone(backend.get('b'))
+            self.assertLessEqual(backend.size, 400)
+            self.assertEqual(len(os.listdir(directory)), len(backend))
+
+
+    def test_directory_backend_keeps_an_entry_set_while_its_expired_one_is_dropped(self):
+        with tempfile.TemporaryDirectory() as directory:
+            expiring = threading.Event()
+            setter = threading.Thread(target=lambda: backend.set('a', CacheEntry(200, {}, b'new')))
+
+            def clock():
+                # a concurrent set of the same key starts while the expired entry is being dropped
+                if expiring.is_set() and setter.ident is None:
+                    setter.start()
+                    time.sleep(0.05)
+                return time.time()
+
+            backend = DirectoryBackend(directory, clock=clock)
+            backend.set('a', CacheEntry(200, {}, b'old'), ttl=-1)
+            expiring.set()
+            self.assertIsNone(backend.get('a'))
+            setter.join()
+            self.assertEqual(backend.get('a').content, b'new')
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+
+class HttpCacheTest(unittest.TestCase):
+    """
+    Test cases for HttpCache class
+    """
+
+    def setUp(self):
+        self.cache = HttpCache()
+        self.client = HttpClient(Configuration(access_token='this-is-my-access-token',
+                                               client_secret='my-test-client-secret',
+                                               rate_limit=None, http_cache=self.cache))
+
+    def make_response(self, status_code, data=None, headers=None):
+        response = Response()
+        response._content = json.dumps(data).encode('utf-8') if data is not None else b''
+        response.status_code = status_code
+        response.headers = dict({'Content-Type': 'application/json'}, **(headers or {}))
+        return response
+
+    def test_not_modified_responses_are_served_from_the_cache(self):
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = self.make_response(200, {'Accounts': [{'Number': 1930}]},
+                                                             {'ETag': '"v1"', 'Last-Modified': 'Mon, 05 Oct 2026'})
+            self.client.get('/accounts')
+            self.assertNotIn('If-None-Match', mocked_request.call_args[1]['headers'])
+
+            mocked_request.return_value = self.make_response(304)
+            status, _, accounts = self.client.get('/accounts')
+            headers = mocked_request.call_args[1]['headers']
+            self.assertEqual(headers['If-None-Match'], '"v1"')
+            self.assertEqual(headers['If-Modified-Since'], 'Mon, 05 Oct 2026')
+            self.assertEqual(status, 200)
+            self.assertEqual(accounts[0].Number, 1930)
+
+    def test_not_modified_without_stored_response_has_no_body(self):
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = self.make_response(304, headers={'ETag': '"v1"'})
+            status, headers, invoice = self.client.get('/invoices/1', headers={'If-None-Match': '"v1"'})
+            self.assertEqual(mocked_request.call_args[1]['headers']['If-None-Match'], '"v1"')
+        self.assertEqual(status, 304)
+        self.assertEqual(headers['ETag'], '"v1"')
+        self.assertIsNone(invoice)
+        self.assertEqual(len(self.cache.backend), 0)
+
+    def test_unchanged_bodies_are_not_parsed_again(self):
+        with patch('requests.Session.request') as mocked_request, \
+                patch.object(self.client.decoder, 'loads', wraps=self.client.decoder.loads) as loads:
+            mocked_request.return_value = self.make_response(200, {'Accounts': [{'Number': 1930}]})
+            first = self.client.get('/accounts')[2]
+            mocked_request.return_value = self.make_response(200, {'Accounts': [{'Number': 1930}]})
+            self.assertEqual(self.client.get('/accounts')[2], first)
+            self.assertEqual(loads.call_count, 1)
+
+            mocked_request.return_value = self.make_response(200, {'Accounts': [{'Number': 2440}]})
+            self.assertEqual(self.client.get('/accounts')[2][0].Number, 2440)
+
+    def test_reused_responses_are_not_shared(self):
+        for mode in ('munch', 'attr', 'dict'):
+            self.client.decoder = Decoder(mode)
+            with patch('requests.Session.request') as mocked_request:
+                mocked_request.return_value = self.make_response(200, {'Accounts': [{'Number': 1930}]})
+                first = self.client.get('/accounts', params={'mode': mode})[2]
+                first[0]['Number'] = 2440
+                first.append({'Number': 3001})
+                mocked_request.return_value = self.make_response(200, {'Accounts': [{'Number': 1930}]})
+                second = self.client.get('/accounts', params={'mode': mode})[2]
+                self.assertIsNot(second, first)
+                self.assertEqual(second, [{'Number': 1930}])
+
+    def test_writes_drop_stored_responses(self):
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = self.make_response(200, {'Accounts': []}, {'ETag': '"v1"'})
+            self.client.get('/accounts')
+            self.client.put('/accounts/1930', body={'Description': 'Bank'})
+            self.client.get('/accounts')
+            self.assertNotIn('If-None-Match', mocked_request.call_args[1]['headers'])
+
+    def test_other_resources_are_not_stored(self):
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = self.make_response(200, {'Invoice': {}}, {'ETag': '"v1"'})
+            self.client.get('/invoices/1')
+            self.client.get('/invoices/1')
+            self.assertNotIn('If-None-Match', mocked_request.call_args[1]['headers'])
+        self.assertEqual(len(self.cache.backend), 0)
+
+
+class MmapBackendTest(unittest.TestCase):
+    """
+    Test cases for MmapBackend class
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'fortnox.cache')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_entries_are_read_without_copy(self):
+        backend = MmapBackend(self.path)
+        backend.set('ns:/units:/units?', CacheEntry(200, {'ETag': '"1"'}, b'{"Units": []}'))
+        entry = backend.get('ns:/units:/units?')
+        self.assertIsInstance(entry.content, memoryview)
+        self.assertEqual(bytes(entry.content), b'{"Units": []}')
+        self.assertEqual(entry.headers, {'ETag': '"1"'})
+        backend.close()
+
+    def test_entries_survive_reopening(self):
+        backend = MmapBackend(self.path)
+        backend.set('ns:/units:/units?', CacheEntry(200, {}, b'units'))
+        backend.set('ns:/units:/units/st?', CacheEntry(200, {}, b'st'))
+        backend.set('ns:/accounts:/accounts?', CacheEntry(200, {}, b'accounts'))
+        backend.set('ns:/accounts:/accounts?', CacheEntry(200, {}, b'accounts 2'))
+        backend.set('ns:/prices:/prices?', CacheEntry(200, {}, b'prices'), ttl=-1)
+        backend.delete_prefix('ns:/units:')
+        backend.close()
+
+        reopened = MmapBackend(self.path)
+        self.assertEqual(len(reopened), 2)
+        self.assertIsNone(reopened.get('ns:/units:/units?'))
+        self.assertIsNone(reopened.get('ns:/prices:/prices?'))
+        self.assertEqual(bytes(reopened.get('ns:/accounts:/accounts?').content), b'accounts 2')
+        reopened.close()
+
+    def test_incomplete_record_is_cut_off(self):
+        backend = MmapBackend(self.path)
+        backend.set('a', CacheEntry(200, {}, b'first'))
+        backend.close()
+        size = os.path.getsize(self.path)
+        with open(self.path, 'ab') as handle:
+            handle.write(MmapBackend.RECORD.pack(10, 100) + b'{"key"')
+
+        reopened = MmapBackend(self.path)
+        self.assertEqual(bytes(reopened.get('a').content), b'first')
+        self.assertEqual(os.path.getsize(self.path), size)
+        reopened.set('b', CacheEntry(200, {}, b'second'))
+        reopened.close()
+        reopened = MmapBackend(self.path)
+        self.assertEqual(bytes(reopened.get('b').content), b'second')
+        reopened.close()
+
+    def test_evicts_and_compacts_beyond_max_bytes(self):
+        backend = MmapBackend(self.path, max_bytes=8192)
+        backend.set('kept', CacheEntry(200, {}, b'k' * 1000))
+        kept = backend.get('kept').content
+        for number in range(40):
+            backend.get('kept')
+            backend.set(str(number), CacheEntry(200, {}, bytes([number]) * 1000))
+        self.assertLessEqual(backend.size, 8192)
+        self.assertLessEqual(os.path.getsize(self.path), 2 * 8192)
+        self.assertEqual(bytes(backend.get('kept').content), b'k' * 1000)
+        self.assertEqual(bytes(backend.get('39').content), bytes([39]) * 1000)
+        self.assertIsNone(backend.get('0'))
+        self.assertEqual(bytes(kept), b'k' * 1000)
+        backend.clear()
+        self.assertEqual(len(backend), 0)
+        self.assertEqual(bytes(kept), b'k' * 1000)
+        backend.close()
+
+    def test_file_is_locked_until_closed(self):
+        backend = MmapBackend(self.path)
+        with self.assertRaises(ConfigurationError):
+            MmapBackend(self.path)
+        backend.close()
+        MmapBackend(self.path).close()
+
+    def test_warm_restart_sends_no_request(self):
+        def make_client():
+            cache = ResponseCache(MmapBackend(self.path), policies={'/articles': 3600})
+            return HttpClient(Configuration(access_token='this-is-my-access-token',
+                                            client_secret='my-test-client-secret', rate_limit=None, cache=cache))
+
+        with patch('requests.Session.request') as mocked_request:
+            response = Response()
+            response._content = json.dumps({'Articles': [{'ArticleNumber': '1'}]}).encode('utf-8')
+            response.status_code = 200
+            response.headers = {'Content-Type': 'application/json'}
+            mocked_request.return_value = response
+            client = make_client()
+            client.get('/articles', params={'page': 1})
+            client.config.cache.backend.close()
+
+            client = make_client()
+            articles = client.get('/articles', params={'page': 1})[2]
+            self.assertEqual(mocked_request.call_count, 1)
+            self.assertEqual(articles[0].ArticleNumber, '1')
+            client.config.cache.backend.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
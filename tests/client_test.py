@@ -0,0 +1,46 @@
+import subprocess
+import sys
+import unittest
+
+import fortnox
+from fortnox import Client
+
+
+class ClientTest(unittest.TestCase):
+    """
+    Test cases for Client class
+    """
+
+    def setUp(self):
+        self.client = Client(access_token='this-is-my-access-token', client_secret='my-test-client-secret')
+
+    def test_services_are_created_on_first_access(self):
+        customers = self.client.customers
+        self.assertIsInstance(customers, fortnox.services.CustomerService)
+        self.assertIs(customers, self.client.customers)
+        self.assertIs(customers.http_client, self.client.http_client)
+
+    def test_services_are_exported_lazily(self):
+        self.assertIs(fortnox.InvoiceService, fortnox.services.InvoiceService)
+        self.assertIn('InvoiceService', dir(fortnox))
+        with self.assertRaises(AttributeError):
+            fortnox.UnknownService
+
+
+    def test_import_leaves_optional_dependencies_unloaded(self):
+        code = 'import sys, fortnox; print(" ".join(sorted(set(sys.argv[1:]) & set(sys.modules))))'
+        modules = ['asyncio', 'httpx', 'pyarrow', 'mmap', 'sqlite3', 'fortnox.account_index', 'fortnox.cache',
+                   'fortnox.mirror', 'fortnox.pool', 'fortnox.sync']
+        output = subprocess.check_output([sys.executable, '-c', code] + modules)
+        self.assertEqual(output.strip(), b'')
+
+    def test_lazy_names_resolve_to_their_modules(self):
+        import fortnox.cache
+        import fortnox.mirror
+        self.assertIs(fortnox.MmapBackend, fortnox.cache.MmapBackend)
+        self.assertIs(fortnox.Mirror, fortnox.mirror.Mirror)
+        self.assertIn('AccountIndex', dir(fortnox))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from requests import Response
+
+from fortnox import Client, RequestError
+from fortnox.coalescing import SingleFlight
+
+
+def make_response(status_code, data):
+    response = Response()
+    response._content = json.dumps(data).encode('utf-8')
+    response.status_code = status_code
+    response.headers = {"Content-Type": "application/json"}
+    return response
+
+
+class SingleFlightTest(unittest.TestCase):
+    """
+    Test cases for request coalescing
+    """
+
+    def setUp(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def make_client(self, **options):
+        return Client(access_token='this-is-my-access-token', client_secret='my-test-client-secret',
+                      rate_limit=None, retry_policy=None, **options)
+
+    def slow_response(self, status_code=200):
+        def request(method, url, **kwargs):
+            with self.lock:
+                self.calls.append((url, kwargs.get('params')))
+            time.sleep(0.1)
+            if status_code != 200:
+                return make_response(status_code, {'ErrorInformation': {'message': 'Not found'}})
+            return make_response(200, {'Account': {'Number': 3010}})
+        return request
+
+    def concurrently(self, func, count=5):
+        barrier = threading.Barrier(count)
+        results = [None] * count
+
+        def run(index):
+            barrier.wait()
+            try:
+                results[index] = func()
+            except Exception as e:
+                results[index] = e
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_identical_gets_share_one_request(self):
+        client = self.make_client(coalesce_requests=True)
+        with patch('requests.Session.request', side_effect=self.slow_response()):
+            accounts = self.concurrently(lambda: client.accounts.retrieve(3010))
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(all(account is accounts[0] for account in accounts))
+        self.assertEqual(accounts[0].Number, 3010)
+        self.assertEqual(len(client.http_client.single_flight), 0)
+
+    def test_different_params_are_not_shared(self):
+        client = self.make_client(coalesce_requests=True)
+        years = iter(range(5))
+        with patch('requests.Session.request', side_effect=self.slow_response()):
+            self.concurrently(lambda: client.accounts.retrieve(3010, financialyear=next(years)))
+        self.assertEqual(len(self.calls), 5)
+
+    def test_errors_are_shared(self):
+        client = self.make_client(coalesce_requests=True)
+        with patch('requests.Session.request', side_effect=self.slow_response(404)):
+            errors = self.concurrently(lambda: client.accounts.retrieve(3010))
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(all(isinstance(error, RequestError) for error in errors))
+
+    def test_coalescing_is_opt_in(self):
+        client = self.make_client()
+        self.assertIsNone(client.http_client.single_flight)
+        with patch('requests.Session.request', side_effect=self.slow_response()):
+            self.concurrently(lambda: client.accounts.retrieve(3010))
+        self.assertEqual(len(self.calls), 5)
+
+    def test_key_ignores_parameter_order_and_empty_values(self):
+        self.assertEqual(SingleFlight.key('GET', '/accounts', {'b': 1, 'a': 2, 'c': None}, 'token'),
+                         SingleFlight.key('get', '/accounts', {'a': 2, 'b': 1}, 'token'))
+        self.assertNotEqual(SingleFlight.key('get', '/accounts', None, 'token'),
+                            SingleFlight.key('get', '/accounts', None, 'other-token'))
+
+
+if __name__ == '__main__':
+    unittest.main()
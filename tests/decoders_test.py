@@ -0,0 +1,86 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from munch import Munch
+from requests import Response
+
+from fortnox import Configuration, ConfigurationError, HttpClient
+from fortnox.decoders import AttrDict, AttrList, Decoder
+from fortnox.services import InvoiceService
+
+
+class DecoderTest(unittest.TestCase):
+    """
+    Test cases for Decoder class
+    """
+
+    def setUp(self):
+        self.body = json.dumps({
+            'MetaInformation': {'@TotalPages': 1},
+            'Invoices': [{'DocumentNumber': '1', 'InvoiceRows': [{'ArticleNumber': 'A1', 'Price': 10}]}],
+        }).encode('utf-8')
+        self.headers = {'Content-Type': 'application/json'}
+
+    def http_client(self, **options):
+        return HttpClient(Configuration(access_token='token', client_secret='secret', **options))
+
+    def test_munch_mode_is_the_default(self):
+        invoices = self.http_client().decode_body(self.headers, self.body)
+        self.assertIsInstance(invoices[0].InvoiceRows[0], Munch)
+        self.assertEqual(invoices[0].InvoiceRows[0].ArticleNumber, 'A1')
+
+    def test_dict_mode_returns_plain_dictionaries(self):
+        invoices = self.http_client(decode_mode='dict').decode_body(self.headers, self.body)
+        self.assertIs(type(invoices[0]), dict)
+        self.assertEqual(invoices[0]['InvoiceRows'][0]['Price'], 10)
+
+    def test_attr_mode_converts_nested_values_on_access(self):
+        invoices = self.http_client(decode_mode='attr').decode_body(self.headers, self.body)
+        invoice = invoices[0]
+        self.assertIsInstance(invoice, AttrDict)
+        self.assertIs(type(dict.__getitem__(invoice, 'InvoiceRows')), list)
+
+        rows = invoice.InvoiceRows
+        self.assertIsInstance(rows, AttrList)
+        self.assertEqual(rows[0].ArticleNumber, 'A1')
+        self.assertEqual([row.Price for row in rows], [10])
+        self.assertIs(invoice.InvoiceRows, rows)
+
+        invoice.Comments = 'paid'
+        self.assertEqual(invoice['Comments'], 'paid')
+        with self.assertRaises(AttributeError):
+            invoice.Missing
+
+    def test_attr_mode_items_of_paginated_lists_support_attributes(self):
+        response = Response()
+        response._content = self.body
+        response.status_code = 200
+        response.headers = self.headers
+        service = InvoiceService(self.http_client(decode_mode='attr', rate_limit=None))
+        with patch('requests.Session.request', return_value=response):
+            invoices = list(service.iter_all())
+        self.assertIsInstance(invoices[0], AttrDict)
+        self.assertEqual(invoices[0].DocumentNumber, '1')
+        self.assertEqual(invoices[0].InvoiceRows[0].ArticleNumber, 'A1')
+        self.assertEqual(dict(AttrDict({'Row': {'Price': 10}}).items())['Row'].Price, 10)
+
+    def test_raw_keeps_the_envelope_in_every_mode(self):
+        for mode in Decoder.MODES:
+            raw = self.http_client(decode_mode=mode).decode_body(self.headers, self.body, raw=True)
+            self.assertEqual(raw.get('MetaInformation').get('@TotalPages'), 1)
+            self.assertEqual(raw.get('Invoices')[0]['DocumentNumber'], '1')
+
+    def test_json_backends_decode_the_same_body(self):
+        decoders = [Decoder('dict', 'json'), Decoder('dict', 'auto')]
+        self.assertEqual(decoders[0].decode(self.body), decoders[1].decode(self.body))
+        self.assertIsNone(decoders[0].decode(b''))
+
+    def test_invalid_decode_mode_is_rejected(self):
+        config = Configuration(access_token='token', client_secret='secret', decode_mode='objects')
+        with self.assertRaises(ConfigurationError):
+            config.validate()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+import hashlib
+import io
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from munch import munchify
+from requests import Response
+from requests.exceptions import ChunkedEncodingError
+
+from fortnox import HttpClient, Configuration, RetryPolicy
+from fortnox.services.helpers import download_folder
+
+CONTENT = bytes(range(256)) * 40
+
+
+class DroppingStream(io.BytesIO):
+    """
+    Body whose connection drops after ``limit`` bytes.
+    """
+
+    def __init__(self, content, limit):
+        super(DroppingStream, self).__init__(content)
+        self.limit = limit
+
+    def read(self, size=-1):
+        if self.tell() >= self.limit:
+            raise ChunkedEncodingError('connection dropped')
+        return super(DroppingStream, self).read(min(size, self.limit - self.tell()))
+
+
+def make_response(headers, ignore_range=False, drop_after=None):
+    """
+    Serves CONTENT, or the range asked for unless ``ignore_range``.
+    """
+    response = Response()
+    requested = headers.get('Range')
+    if requested and not ignore_range:
+        start = int(requested[len('bytes='):-1])
+        body = CONTENT[start:]
+        response.status_code = 206
+        response.headers = {'Content-Range': 'bytes {0}-{1}/{2}'.format(start, len(CONTENT) - 1, len(CONTENT)),
+                            'Content-Length': str(len(body))}
+    else:
+        body = CONTENT
+        response.status_code = 200
+        response.headers = {'Content-Length': str(len(body))}
+    response.raw = DroppingStream(body, drop_after) if drop_after else io.BytesIO(body)
+    return response
+
+
+class DownloadTest(unittest.TestCase):
+    """
+    Test cases for HttpClient.download
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'invoice.pdf')
+        self.client = HttpClient(Configuration(access_token='this-is-my-access-token',
+                                               client_secret='my-test-client-secret', rate_limit=None,
+                                               retry_policy=RetryPolicy(backoff_base=0, jitter=False)))
+        self.checksum = hashlib.sha256(CONTENT).hexdigest()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_download_is_streamed_to_path(self):
+        progress = []
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.side_effect = lambda method, url, **kwargs: make_response(kwargs['headers'])
+            result = self.client.download('/inbox/1', self.path, chunk_size=1024,
+                                          progress=lambda written, total: progress.append((written, total)))
+
+        self.assertTrue(mocked_request.call_args[1]['stream'])
+        self.assertEqual(result, (self.path, len(CONTENT), self.checksum, False))
+        self.assertEqual(progress[0], (1024, len(CONTENT)))
+        self.assertEqual(progress[-1], (len(CONTENT), len(CONTENT)))
+        with open(self.path, 'rb') as handle:
+            self.assertEqual(handle.read(), CONTENT)
+        self.assertFalse(os.path.exists(self.path + '.part'))
+
+    def test_partial_file_is_resumed_with_range(self):
+        with open(self.path + '.part', 'wb') as handle:
+            handle.write(CONTENT[:1000])
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.side_effect = lambda method, url, **kwargs: make_response(kwargs['headers'])
+            result = self.client.download('/inbox/1', self.path)
+
+        self.assertEqual(mocked_request.call_args[1]['headers']['Range'], 'bytes=1000-')
+        self.assertEqual(result, (self.path, len(CONTENT), self.checksum, True))
+
+    def test_ignored_range_starts_over(self):
+        with open(self.path + '.part', 'wb') as handle:
+            handle.write(b'stale')
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.side_effect = lambda method, url, **kwargs: make_response(kwargs['headers'],
+                                                                                     ignore_range=True)
+            result = self.client.download('/inbox/1', self.path)
+
+        self.assertEqual(result.checksum, self.checksum)
+        self.assertFalse(result.resumed)
+        with open(self.path, 'rb') as handle:
+            self.assertEqual(handle.read(), CONTENT)
+
+    def test_dropped_connection_continues_where_it_stopped(self):
+        responses = iter([lambda headers: make_response(headers, drop_after=3000), make_response])
+        buffer = io.BytesIO()
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.side_effect = lambda method, url, **kwargs: next(responses)(kwargs['headers'])
+            result = self.client.download('/archive/1', buffer, chunk_size=1024)
+
+        self.assertEqual(mocked_request.call_args[1]['headers']['Range'], 'bytes=3000-')
+        self.assertEqual(buffer.getvalue(), CONTENT)
+        self.assertEqual(result.checksum, self.checksum)
+
+    def test_ignored_range_rewrites_a_file_object_from_its_start(self):
+        responses = iter([lambda headers: make_response(headers, drop_after=3000),
+                          lambda headers: make_response(headers, ignore_range=True)])
+        buffer = io.BytesIO()
+        buffer.write(b'header')
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.side_effect = lambda method, url, **kwargs: next(responses)(kwargs['headers'])
+            result = self.client.download('/archive/1', buffer, chunk_size=1024)
+
+        self.assertEqual(buffer.getvalue(), b'header' + CONTENT)
+        self.assertEqual(result.checksum, self.checksum)
+
+    def test_ignored_range_cannot_start_over_on_a_stream(self):
+        class Stream(io.BytesIO):
+            def seekable(self):
+                return False
+
+        responses = iter([lambda headers: make_response(headers, drop_after=3000),
+                          lambda headers: make_response(headers, ignore_range=True)])
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.side_effect = lambda method, url, **kwargs: next(responses)(kwargs['headers'])
+            with self.assertRaises(io.UnsupportedOperation):
+                self.client.download('/archive/1', Stream(), chunk_size=1024)
+
+    def test_failed_download_keeps_partial_file(self):
+        self.client.retry_policy = None
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.side_effect = lambda method, url, **kwargs: make_response(kwargs['headers'],
+                                                                                     drop_after=3000)
+            with self.assertRaises(ChunkedEncodingError):
+                self.client.download('/inbox/1', self.path)
+        self.assertEqual(os.path.getsize(self.path + '.part'), 3000)
+
+
+class FakeHttpClient(object):
+
+    def __init__(self):
+        self.config = Configuration(max_workers=2)
+        self.executor = ThreadPoolExecutor(max_workers=2)
+
+    def get(self, url, params=None, raw=False):
+        files = [{'Id': '1', 'Name': 'a.pdf'}, {'Id': '2', 'Name': 'b.pdf'}, {'Id': '3', 'Name': 'a.pdf'}]
+        return 200, {}, munchify({'Id': 'inbox_s', 'Files': files, 'Folders': []})
+
+
+class FakeService(object):
+
+    def __init__(self):
+        self.http_client = FakeHttpClient()
+
+    def download(self, file_id, destination, progress=None, **options):
+        with open(destination, 'wb') as handle:
+            handle.write(file_id.encode())
+        if progress is not None:
+            progress(1, 1)
+        return destination
+
+
+class DownloadFolderTest(unittest.TestCase):
+    """
+    Test cases for download_folder helper
+    """
+
+    def test_every_file_is_downloaded(self):
+        progress = []
+        with tempfile.TemporaryDirectory() as directory:
+            target = os.path.join(directory, 'inbox_s')
+            result = download_folder(FakeService(), '/inbox/inbox_s', target,
+                                     progress=lambda name, written, total: progress.append(name))
+            self.assertEqual([os.path.basename(item.value) for item in result.results], ['a.pdf', 'b.pdf', '3_a.pdf'])
+            with open(os.path.join(target, '3_a.pdf'), 'rb') as handle:
+                self.assertEqual(handle.read(), b'3')
+        self.assertEqual(sorted(progress), ['3_a.pdf', 'a.pdf', 'b.pdf'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+
+import pyarrow.ipc
+import pyarrow.parquet
+from munch import munchify
+
+from fortnox import Configuration, ArrowExporter
+from fortnox.export import RESOURCES, record_batch, schema
+
+
+class FakeHttpClient(object):
+    """
+    Serves two pages of vouchers and the details of every voucher.
+    """
+
+    def __init__(self):
+        self.config = Configuration(max_workers=2)
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.pages = [
+            [{'VoucherSeries': 'A', 'VoucherNumber': 1, 'Year': 1, 'TransactionDate': '2020-01-01'}],
+            [{'VoucherSeries': 'A', 'VoucherNumber': 2, 'Year': 1, 'TransactionDate': ''}],
+        ]
+
+    def get(self, url, params=None, raw=False):
+        if url != '/vouchers':
+            number = int(url.rsplit('/', 1)[1])
+            rows = [{'Account': 1930, 'Debit': 100, 'Credit': 0}, {'Account': 3001, 'Debit': 0, 'Credit': '100'}]
+            return 200, {}, munchify({'VoucherSeries': 'A', 'VoucherNumber': number, 'Year': 1, 'VoucherRows': rows})
+        page = params.get('page', 1)
+        return 200, {}, munchify({'MetaInformation': {'@TotalPages': 2}, 'Vouchers': self.pages[page - 1]})
+
+
+class FakeService(object):
+
+    def __init__(self, http_client):
+        self.http_client = http_client
+
+
+class FakeClient(object):
+
+    def __init__(self):
+        self.http_client = FakeHttpClient()
+        self.vouchers = FakeService(self.http_client)
+
+
+class ArrowExporterTest(unittest.TestCase):
+    """
+    Test cases for ArrowExporter class
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.exporter = ArrowExporter(FakeClient())
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_every_page_is_one_batch(self):
+        batches = list(self.exporter.iter_batches('vouchers'))
+        self.assertEqual([batch.num_rows for batch, _ in batches], [1, 1])
+        self.assertEqual([rows for _, rows in batches], [None, None])
+        self.assertEqual(batches[0][0].column('transaction_date').to_pylist(), [date(2020, 1, 1)])
+        self.assertEqual(batches[1][0].column('transaction_date').to_pylist(), [None])
+
+    def test_export_to_parquet_with_child_table(self):
+        path = os.path.join(self.directory.name, 'vouchers.parquet')
+        rows_path = os.path.join(self.directory.name, 'voucher_rows.parquet')
+        result = self.exporter.export('vouchers', path, rows_path=rows_path)
+        self.assertEqual((result.rows, result.child_rows), (2, 4))
+
+        rows = pyarrow.parquet.read_table(rows_path)
+        self.assertEqual(rows.schema.names[:4], ['voucher_series', 'voucher_number', 'year', 'row_index'])
+        self.assertEqual(rows.schema.field('credit').type, pyarrow.decimal128(18, 2))
+        self.assertEqual(rows.column('credit').to_pylist(), [Decimal('0.00'), Decimal('100.00')] * 2)
+        self.assertEqual(pyarrow.parquet.read_table(path).column('voucher_number').to_pylist(), [1, 2])
+
+    def test_export_to_feather(self):
+        path = os.path.join(self.directory.name, 'vouchers.feather')
+        self.exporter.export('vouchers', path, format='feather')
+        with pyarrow.ipc.open_file(path) as reader:
+            self.assertEqual(reader.num_record_batches, 2)
+
+
+    def test_prices_keep_their_decimals(self):
+        columns = RESOURCES['invoices'].row_columns
+        batch = record_batch(columns, [{'Price': 12.3456, 'Total': 24.6912}, {'Price': '', 'Total': 0}],
+                             schema(columns))
+        self.assertEqual(batch.column('price').to_pylist(), [Decimal('12.345600'), None])
+        self.assertEqual(batch.column('total').to_pylist(), [Decimal('24.69'), Decimal('0.00')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 from requests import Response
 
-from fortnox import HttpClient, Configuration
+from fortnox import HttpClient, Configuration, RateLimitError, RetryPolicy
 
 
 class HttpClientTest(unittest.TestCase):
@@ -25,7 +25,7 @@ class HttpClientTest(unittest.TestCase):
     def test_request_method(self):
         client = self.ClientClass(self.config)
         url = '/accounts'
-        with patch('requests.request') as mocked_request:
+        with patch('requests.Session.request') as mocked_request:
             data = {
                 "MetaInformation": {
                     "@TotalResources": 1210,
@@ -58,3 +58,72 @@ class HttpClientTest(unittest.TestCase):
             self.assertEqual(response[0], 200)
             self.assertEqual(response[1], {"Content-Type": "application/json"})
             self.assertEqual(response[2], data)
+
+    def test_session_is_reused_between_requests(self):
+        client = self.ClientClass(self.config)
+        session = client.session
+        self.assertIs(client.session, session)
+        adapter = session.get_adapter('https://api.fortnox.se')
+        self.assertEqual(adapter._pool_maxsize, self.config.pool_maxsize)
+
+    def test_close_releases_session(self):
+        with self.ClientClass(self.config) as client:
+            session = client.session
+        self.assertIsNot(client.session, session)
+
+    def make_response(self, status_code, data=None, headers=None):
+        response = Response()
+        response._content = json.dumps(data or {}).encode('utf-8')
+        response.status_code = status_code
+        response.headers = dict({"Content-Type": "application/json"}, **(headers or {}))
+        return response
+
+    def test_rate_limited_requests_are_retried(self):
+        events = []
+        self.config.retry_policy = RetryPolicy(on_retry=events.append)
+        client = self.ClientClass(self.config)
+        with patch('requests.Session.request') as mocked_request, patch('time.sleep') as mocked_sleep:
+            mocked_request.side_effect = [
+                self.make_response(429, headers={'Retry-After': '2'}),
+                self.make_response(200, {'Customer': {'Name': 'Acme'}}),
+            ]
+            _, _, customer = client.post('/customers', body={'Name': 'Acme', 'service': 'Customer'})
+        self.assertEqual(customer.Name, 'Acme')
+        mocked_sleep.assert_called_once_with(2)
+        self.assertEqual([(event.attempt, event.status) for event in events], [(1, 429)])
+
+    def test_rate_limited_uploads_are_retried(self):
+        self.config.retry_policy = RetryPolicy(backoff_base=0, jitter=False)
+        client = self.ClientClass(self.config)
+        sent = []
+
+        def request(method, url, data=None, **kwargs):
+            sent.append(b''.join(iter(lambda: data.read(), b'')))
+            return responses.pop(0)
+
+        responses = [self.make_response(429), self.make_response(200, {'File': {'Name': 'a.pdf'}})]
+        with patch('requests.Session.request', side_effect=request), patch('time.sleep'):
+            _, _, file = client.post('/inbox', body={'file': b'%PDF', 'file_name': 'a.pdf'})
+        self.assertEqual(file.Name, 'a.pdf')
+        self.assertEqual(len(sent), 2)
+        self.assertEqual(sent[1], sent[0])
+        self.assertIn(b'%PDF', sent[1])
+
+    def test_uploads_of_iterators_are_not_retried(self):
+        self.config.retry_policy = RetryPolicy(backoff_base=0, jitter=False)
+        client = self.ClientClass(self.config)
+        with patch('requests.Session.request') as mocked_request, patch('time.sleep'):
+            mocked_request.return_value = self.make_response(429)
+            with self.assertRaises(RateLimitError):
+                client.post('/inbox', body={'file': iter([b'%PDF']), 'file_name': 'a.pdf'})
+        self.assertEqual(mocked_request.call_count, 1)
+
+    def test_retries_give_up_after_max_attempts(self):
+        self.config.retry_policy = RetryPolicy(max_attempts=2)
+        client = self.ClientClass(self.config)
+        with patch('requests.Session.request') as mocked_request, patch('time.sleep'):
+            mocked_request.return_value = self.make_response(429, headers={'Retry-After': '1'})
+            with self.assertRaises(RateLimitError) as context:
+                client.get('/customers')
+        self.assertEqual(context.exception.retry_after, 1)
+        self.assertEqual(mocked_request.call_count, 2)
@@ -0,0 +1,123 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from requests import Response
+
+from fortnox import (
+    HttpClient, Configuration, ConfigurationError, RequestError, RetryPolicy, Hooks, MetricsCollector
+)
+from fortnox.hooks import endpoint_template
+
+
+def make_response(status_code, data=None, headers=None):
+    response = Response()
+    response._content = json.dumps(data or {}).encode('utf-8')
+    response.status_code = status_code
+    response.headers = dict({"Content-Type": "application/json"}, **(headers or {}))
+    return response
+
+
+class HooksTest(unittest.TestCase):
+    """
+    Test cases for Hooks class and endpoint templates
+    """
+
+    def setUp(self):
+        self.hooks = Hooks()
+        self.metrics = MetricsCollector(buckets=(0.1, 1))
+        self.config = Configuration(access_token='this-is-my-access-token', client_secret='my-test-client-secret',
+                                    rate_limit=None, hooks=self.hooks, metrics=self.metrics,
+                                    retry_policy=RetryPolicy(backoff_base=0, jitter=False))
+
+    def test_endpoint_template(self):
+        self.assertEqual(endpoint_template('/invoices/123'), '/invoices/{id}')
+        self.assertEqual(endpoint_template('/invoices/123/bookkeep'), '/invoices/{id}/bookkeep')
+        self.assertEqual(endpoint_template('/vouchers/A/12?financialyear=1'), '/vouchers/{id}/{id}')
+        self.assertEqual(endpoint_template('/inbox/inbox_s'), '/inbox/inbox_s')
+        self.assertEqual(endpoint_template('/customers'), '/customers')
+        self.assertEqual(endpoint_template('/vouchers/sublist/A/12'), '/vouchers/sublist/{id}/{id}')
+        self.assertEqual(endpoint_template('/customers/abc'), '/customers/{id}')
+        self.assertEqual(endpoint_template('/archive/my_folder'), '/archive/{id}')
+
+    def test_unknown_hook_is_rejected(self):
+        with self.assertRaises(ConfigurationError):
+            self.hooks.register('after_request', print)
+
+    def test_hooks_see_every_attempt(self):
+        events = []
+        for name in Hooks.EVENTS:
+            self.hooks.register(name, lambda event, name=name: events.append((name, event)))
+        client = HttpClient(self.config)
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.side_effect = [make_response(503), make_response(200, {'Invoice': {'Total': 10}})]
+            client.get('/invoices/42')
+
+        self.assertEqual([name for name, _ in events], ['before_request', 'on_retry', 'before_request',
+                                                        'after_response'])
+        response = events[-1][1]
+        self.assertEqual((response.endpoint, response.status, response.attempts), ('/invoices/{id}', 200, 2))
+        self.assertGreater(response.bytes_received, 0)
+        self.assertGreaterEqual(response.elapsed, response.network_time + response.decode_time)
+
+    def test_before_request_may_add_headers(self):
+        self.hooks.register('before_request', lambda event: event.headers.update({'X-Request-Id': 'abc'}))
+        client = HttpClient(self.config)
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = make_response(200)
+            client.get('/customers')
+        self.assertEqual(mocked_request.call_args[1]['headers']['X-Request-Id'], 'abc')
+
+    def test_errors_are_reported(self):
+        errors = []
+        self.hooks.register('on_error', errors.append)
+        client = HttpClient(self.config)
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = make_response(404, {'ErrorInformation': {'message': 'Not found'}})
+            with self.assertRaises(RequestError):
+                client.get('/customers/10')
+        self.assertEqual([(error.endpoint, error.status) for error in errors], [('/customers/{id}', 404)])
+
+
+class MetricsCollectorTest(unittest.TestCase):
+    """
+    Test cases for MetricsCollector class
+    """
+
+    def setUp(self):
+        self.metrics = MetricsCollector(buckets=(0.1, 1))
+        self.client = HttpClient(Configuration(access_token='this-is-my-access-token',
+                                               client_secret='my-test-client-secret', rate_limit=None,
+                                               metrics=self.metrics, retry_policy=None))
+
+    def test_requests_are_recorded_by_endpoint_template(self):
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = make_response(200, {'Invoice': {'Total': 10}})
+            self.client.get('/invoices/1')
+            self.client.get('/invoices/2')
+            self.client.put('/invoices/2', body={'Total': 20, 'service': 'Invoice'})
+
+        self.assertEqual(self.metrics.latency[('GET', '/invoices/{id}')].count, 2)
+        self.assertEqual(self.metrics.responses[('PUT', '/invoices/{id}', 200)], 1)
+        self.assertEqual(self.metrics.bytes_sent[('PUT', '/invoices/{id}')], len('{"Invoice": {"Total": 20}}'))
+
+    def test_prometheus_text(self):
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = make_response(200, {'Invoice': {'Total': 10}})
+            self.client.get('/invoices/1')
+            mocked_request.return_value = make_response(500)
+            with self.assertRaises(Exception):
+                self.client.get('/invoices/2')
+
+        text = self.metrics.to_prometheus()
+        self.assertIn('# TYPE fortnox_request_duration_seconds histogram', text)
+        self.assertIn('fortnox_request_duration_seconds_bucket{method="GET",endpoint="/invoices/{id}",le="+Inf"} 2',
+                      text)
+        self.assertIn('fortnox_responses_total{method="GET",endpoint="/invoices/{id}",status="500"} 1', text)
+        self.assertIn('fortnox_errors_total{method="GET",endpoint="/invoices/{id}",error="ServerError"} 1', text)
+        self.assertIn('fortnox_rate_limit_wait_seconds_total 0.0', text)
+        self.assertTrue(text.endswith('\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+
+from munch import munchify
+
+from fortnox import Configuration, Mirror
+
+
+class FakeHttpClient(object):
+    """
+    Serves single page list responses and invoice details from in-memory records.
+    """
+
+    def __init__(self, collections, details):
+        self.collections = collections
+        self.details = details
+        self.config = Configuration(max_workers=2)
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.requests = []
+
+    def get(self, url, params=None, raw=False):
+        self.requests.append((url, dict(params or {})))
+        if url in self.details:
+            return 200, {}, munchify(self.details[url])
+        key, items = self.collections[url]
+        return 200, {}, munchify({'MetaInformation': {'@TotalPages': 1}, key: items})
+
+
+class FakeService(object):
+
+    def __init__(self, http_client):
+        self.http_client = http_client
+
+
+class FakeClient(object):
+
+    def __init__(self, collections, details):
+        self.http_client = FakeHttpClient(collections, details)
+        for name in ('accounts', 'customers', 'invoices'):
+            setattr(self, name, FakeService(self.http_client))
+
+
+class MirrorTest(unittest.TestCase):
+    """
+    Test cases for Mirror class
+    """
+
+    def setUp(self):
+        invoices = [
+            {'DocumentNumber': '1', 'CustomerNumber': '10', 'DueDate': '2020-02-01', 'Balance': 100, 'Cancelled': False},
+            {'DocumentNumber': '2', 'CustomerNumber': '10', 'DueDate': '2020-01-01', 'Balance': 0, 'Cancelled': False},
+            {'DocumentNumber': '3', 'CustomerNumber': '20', 'DueDate': '2020-01-15', 'Balance': 50, 'Cancelled': False},
+        ]
+        self.client = FakeClient({
+            '/accounts': ('Accounts', [{'Number': 1930, 'Year': 1, 'Description': 'Bank'}]),
+            '/customers': ('Customers', [{'CustomerNumber': '10', 'Name': 'Acme AB'}]),
+            '/invoices': ('Invoices', invoices),
+        }, dict(('/invoices/{0}'.format(invoice['DocumentNumber']),
+                 dict(invoice, InvoiceRows=[{'ArticleNumber': 'A', 'Price': 10}, {'ArticleNumber': 'B', 'Price': 5}]))
+                for invoice in invoices))
+        self.mirror = Mirror(self.client, ':memory:')
+        self.mirror.engine.clock = lambda: datetime(2020, 1, 1, 12, 0)
+
+    def tearDown(self):
+        self.mirror.close()
+
+    def test_refresh_loads_resources_and_rows(self):
+        counts = self.mirror.refresh(['accounts', 'customers', 'invoices'])
+        self.assertEqual(counts, {'accounts': 1, 'customers': 1, 'invoices': 3})
+        self.assertEqual(self.mirror.account(1930).Description, 'Bank')
+        self.assertEqual([customer.Name for customer in self.mirror.find_customers('acme')], ['Acme AB'])
+        self.assertEqual([row.ArticleNumber for row in self.mirror.invoice_rows('1')], ['A', 'B'])
+
+    def test_unpaid_invoices_are_answered_offline(self):
+        self.mirror.refresh(['invoices'])
+        requests = len(self.client.http_client.requests)
+        self.assertEqual([invoice.DocumentNumber for invoice in self.mirror.unpaid_invoices()], ['3', '1'])
+        self.assertEqual([invoice.DocumentNumber for invoice in self.mirror.unpaid_invoices('10')], ['1'])
+        self.assertEqual(len(self.client.http_client.requests), requests)
+
+    def test_refresh_is_incremental(self):
+        self.mirror.refresh(['invoices'])
+        self.client.http_client.collections['/invoices'] = ('Invoices', [])
+        self.assertEqual(self.mirror.refresh(['invoices']), {'invoices': 0})
+        url, params = self.client.http_client.requests[-1]
+        self.assertEqual(params['lastmodified'], '2020-01-01 12:00')
+
+    def test_account_turnover_is_summed_exactly(self):
+        rows = [{'Account': 1930, 'Debit': 0.1, 'Credit': 0}] * 3 + [
+            {'Account': 1930, 'Debit': 0, 'Credit': 0.3},
+            {'Account': 1930, 'Debit': 5, 'Credit': 0, 'Removed': True},
+        ]
+        voucher = {'VoucherSeries': 'A', 'VoucherNumber': 1, 'Year': 1, 'TransactionDate': '2020-01-01',
+                   'VoucherRows': rows}
+        self.mirror.upsert('vouchers', [voucher])
+        self.mirror.write_rows('vouchers', voucher)
+        turnover = self.mirror.account_turnover(1930)
+        self.assertIsInstance(turnover, Decimal)
+        self.assertEqual(turnover, 0)
+
+    def test_schema_has_indexes(self):
+        indexes = [row[0] for row in self.mirror.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'invoices'")]
+        self.assertIn('invoices_customer_number_balance', indexes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+import unittest
+from decimal import Decimal
+
+from munch import munchify
+
+from fortnox.models import Invoice, InvoiceRow, Voucher
+
+
+class ModelTest(unittest.TestCase):
+    """
+    Test cases for the resource models
+    """
+
+    def setUp(self):
+        self.invoice = {
+            '@url': 'https://api.fortnox.se/3/invoices/1',
+            'DocumentNumber': '1',
+            'Total': 1250.5,
+            'Booked': True,
+            'CostCenter': None,
+            'InvoiceRows': [{'ArticleNumber': 'A1', 'DeliveredQuantity': '2.00', 'Price': 625.25, 'AccountNumber': 3001}],
+        }
+
+    def test_fields_are_coerced(self):
+        invoice = Invoice.from_dict(munchify(self.invoice))
+        self.assertEqual(invoice.url, 'https://api.fortnox.se/3/invoices/1')
+        self.assertEqual(invoice.Total, Decimal('1250.5'))
+        self.assertIs(invoice.Booked, True)
+        self.assertIsNone(invoice.Balance)
+
+        row = invoice.InvoiceRows[0]
+        self.assertIsInstance(row, InvoiceRow)
+        self.assertEqual(row.DeliveredQuantity, Decimal('2.00'))
+        self.assertEqual(row.AccountNumber, 3001)
+
+    def test_models_have_no_instance_dict(self):
+        invoice = Invoice.from_dict(self.invoice)
+        self.assertFalse(hasattr(invoice, '__dict__'))
+        with self.assertRaises(AttributeError):
+            invoice.Unknown = 1
+
+    def test_unknown_keys_survive_a_round_trip(self):
+        invoice = Invoice.from_dict(self.invoice)
+        self.assertIsNone(invoice.CostCenter)
+
+        data = invoice.to_dict(exclude_none=True)
+        self.assertEqual(data['@url'], self.invoice['@url'])
+        self.assertEqual(data['CostCenter'], None)
+        self.assertEqual(data['InvoiceRows'][0]['Price'], Decimal('625.25'))
+        self.assertEqual(Invoice.from_dict(data), invoice)
+
+    def test_equal_amounts_share_one_decimal(self):
+        vouchers = Voucher.from_list([
+            {'VoucherNumber': 1, 'VoucherRows': [{'Account': 1930, 'Debit': 0, 'Credit': 100}]},
+            {'VoucherNumber': 2, 'VoucherRows': [{'Account': 1910, 'Debit': 0, 'Credit': 50}]},
+        ])
+        self.assertIs(vouchers[0].VoucherRows[0].Debit, vouchers[1].VoucherRows[0].Debit)
+
+
+    def test_models_are_reachable_from_the_package(self):
+        code = 'import fortnox; print(fortnox.models.Voucher.__name__)'
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.strip(), b'Voucher')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from requests import Response
+
+from fortnox import ClientPool, ConfigurationError, ResponseCache, MemoryBackend
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ClientPoolTest(unittest.TestCase):
+    """
+    Test cases for ClientPool class
+    """
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(MemoryBackend())
+        self.pool = ClientPool(client_secret='my-test-client-secret', idle_timeout=60, max_clients=3,
+                               clock=self.clock, cache=self.cache)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_tenants_share_session_and_worker_pool(self):
+        first = self.pool.client('company-1', access_token='token-1')
+        second = self.pool.client('company-2', access_token='token-2')
+        self.assertIsNot(first, second)
+        self.assertIs(first.http_client.session, second.http_client.session)
+        self.assertIs(first.http_client.executor, second.http_client.executor)
+        self.assertIs(first.http_client.rate_limiter, second.http_client.rate_limiter)
+        self.assertIs(self.pool['company-1'], first)
+        self.assertEqual(first.config.access_token, 'token-1')
+
+    def test_tenants_have_their_own_quota_and_cache_namespace(self):
+        first = self.pool.client('company-1', access_token='token-1')
+        second = self.pool.client('company-2', access_token='token-2')
+        limiter = self.pool.rate_limiter
+        self.assertIsNot(limiter.bucket(first.http_client.rate_limit_key),
+                         limiter.bucket(second.http_client.rate_limit_key))
+
+        response = Response()
+        response._content = json.dumps({'Unit': {'Code': 'st'}}).encode('utf-8')
+        response.status_code = 200
+        response.headers = {'Content-Type': 'application/json'}
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = response
+            first.units.retrieve('st')
+            second.units.retrieve('st')
+            first.units.retrieve('st')
+        self.assertEqual(mocked_request.call_count, 2)
+
+    def test_closing_a_tenant_keeps_the_shared_session(self):
+        first = self.pool.client('company-1', access_token='token-1')
+        session = first.http_client.session
+        first.close()
+        self.assertIs(first.http_client.session, session)
+        self.assertFalse(self.pool.executor._shutdown)
+
+    def test_idle_tenants_are_evicted(self):
+        first = self.pool.client('company-1', access_token='token-1')
+        self.clock.now = 30
+        self.pool.client('company-2', access_token='token-2')
+        self.clock.now = 70
+        self.assertEqual(self.pool.evict_idle(), 1)
+        self.assertNotIn('company-1', self.pool)
+        self.assertIn('company-2', self.pool)
+
+        again = self.pool.client('company-1', access_token='token-1')
+        self.assertIsNot(again, first)
+
+    def test_least_recently_used_tenants_are_evicted_beyond_max_clients(self):
+        for number in range(4):
+            self.pool.client('company-{0}'.format(number), access_token='token-{0}'.format(number))
+        self.assertEqual(self.pool.tenants, ['company-1', 'company-2', 'company-3'])
+
+    def test_unknown_tenant_needs_an_access_token(self):
+        with self.assertRaises(ConfigurationError):
+            self.pool['company-1']
+
+    def test_new_access_token_rebuilds_the_client(self):
+        first = self.pool.client('company-1', access_token='token-1')
+        second = self.pool.client('company-1', access_token='token-2')
+        self.assertIsNot(first, second)
+        self.assertEqual(second.config.access_token, 'token-2')
+        self.assertEqual(len(self.pool), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
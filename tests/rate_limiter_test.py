@@ -0,0 +1,45 @@
+import unittest
+
+from fortnox import RateLimiter, TokenBucket
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RateLimiterTest(unittest.TestCase):
+    """
+    Test cases for TokenBucket and RateLimiter classes
+    """
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_bucket_allows_burst_then_paces(self):
+        bucket = TokenBucket(rate=4, capacity=5, clock=self.clock)
+        self.assertEqual([bucket.reserve() for _ in range(5)], [0.0] * 5)
+        self.assertAlmostEqual(bucket.reserve(), 0.25)
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+
+        self.clock.now = 10
+        self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_default_limits_stay_under_fortnox_quota(self):
+        limiter = RateLimiter(clock=self.clock)
+        send_times = []
+        for _ in range(60):
+            send_times.append(self.clock.now + limiter.reserve('token'))
+        for start in send_times:
+            in_window = [t for t in send_times if start <= t < start + 5]
+            self.assertLessEqual(len(in_window), 25)
+
+    def test_buckets_are_kept_per_access_token(self):
+        limiter = RateLimiter(rate=1, burst=1, clock=self.clock)
+        self.assertEqual(limiter.reserve('first'), 0.0)
+        self.assertEqual(limiter.reserve('second'), 0.0)
+        self.assertAlmostEqual(limiter.reserve('first'), 1.0)
@@ -0,0 +1,40 @@
+import unittest
+
+from fortnox import RetryPolicy
+from fortnox.retry import parse_retry_after
+
+
+class RetryPolicyTest(unittest.TestCase):
+    """
+    Test cases for RetryPolicy class
+    """
+
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=4, backoff_base=1, backoff_cap=3, jitter=False)
+
+    def test_backoff_grows_exponentially_up_to_cap(self):
+        delays = [self.policy.get_delay('GET', attempt, status=503) for attempt in range(1, 4)]
+        self.assertEqual(delays, [1, 2, 3])
+        self.assertIsNone(self.policy.get_delay('GET', 4, status=503))
+
+    def test_retry_after_is_honoured(self):
+        self.assertEqual(self.policy.get_delay('GET', 1, status=429, retry_after=10), 10)
+
+    def test_non_idempotent_methods_are_only_retried_when_safe(self):
+        self.assertIsNone(self.policy.get_delay('POST', 1, status=503))
+        self.assertEqual(self.policy.get_delay('POST', 1, status=429), 1)
+        self.assertIsNone(self.policy.get_delay('POST', 1, error=ConnectionError(), sent=True))
+        self.assertEqual(self.policy.get_delay('POST', 1, error=ConnectionError(), sent=False), 1)
+
+    def test_client_errors_are_not_retried(self):
+        self.assertIsNone(self.policy.get_delay('GET', 1, status=400))
+
+    def test_jitter_stays_within_backoff(self):
+        policy = RetryPolicy(backoff_base=2, random=lambda: 0.5)
+        self.assertEqual(policy.get_delay('GET', 1, status=500), 1)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after('3'), 3)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
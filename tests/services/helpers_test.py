@@ -0,0 +1,167 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from munch import munchify
+
+import fortnox.services
+from fortnox import Configuration, RequestError
+from fortnox.services import AccountsService, ArticleService
+from fortnox.services.helpers import collect_all_items_from_paginators, map_bounded, map_completed
+
+
+class FakeHttpClient(object):
+    """
+    Serves ``total_pages`` pages of two accounts each, slower for the first pages.
+    """
+
+    def __init__(self, total_pages):
+        self.total_pages = total_pages
+        self.config = Configuration(max_workers=3)
+        self.executor = ThreadPoolExecutor(max_workers=3)
+        self.requested_pages = []
+        self.lock = threading.Lock()
+        self.gates = {}
+
+    def put(self, url, body=None):
+        if body.get('Description') is None:
+            raise RequestError(400, {'ErrorInformation': {'code': 2000, 'message': 'Description is missing'}})
+        time.sleep(0.01 * (16 - len(url)))
+        return 200, {}, munchify(dict(body, ArticleNumber=url.rsplit('/', 1)[1]))
+
+    def get(self, url, params=None, raw=False):
+        if url.startswith('/articles/'):
+            number = url.rsplit('/', 1)[1]
+            with self.lock:
+                self.requested_pages.append(number)
+            if number == '404':
+                raise RequestError(404, {'ErrorInformation': {'code': 2000428, 'message': 'Not found'}})
+            if number in self.gates:
+                self.gates[number].wait(5)
+            return 200, {}, munchify({'ArticleNumber': number})
+        page = params.get('page', 1)
+        with self.lock:
+            self.requested_pages.append(page)
+        time.sleep(0.01 * (self.total_pages - page))
+        items = [{'Number': page * 10 + i} for i in range(2)]
+        if raw:
+            return 200, {}, munchify({'MetaInformation': {'@TotalPages': self.total_pages}, 'Accounts': items})
+        return 200, {}, munchify(items)
+
+
+class FakeService(object):
+
+    def __init__(self, http_client):
+        self.http_client = http_client
+
+
+class HelpersTest(unittest.TestCase):
+    """
+    Test cases for services helpers
+    """
+
+    def test_pages_are_joined_in_page_order(self):
+        http_client = FakeHttpClient(total_pages=5)
+        params = {'financialyear': 1}
+        accounts = collect_all_items_from_paginators(FakeService(http_client), params, '/accounts', 'Accounts')
+        self.assertEqual([account.Number for account in accounts],
+                         [page * 10 + i for page in range(1, 6) for i in range(2)])
+        self.assertEqual(sorted(http_client.requested_pages), [1, 2, 3, 4, 5])
+        self.assertEqual(params, {'financialyear': 1})
+
+    def test_iter_all_fetches_pages_lazily(self):
+        http_client = FakeHttpClient(total_pages=3)
+        accounts = AccountsService(http_client).iter_all(financialyear=1)
+        self.assertEqual(http_client.requested_pages, [])
+
+        self.assertEqual(next(accounts).Number, 10)
+        self.assertEqual(http_client.requested_pages, [1])
+        self.assertEqual([account.Number for account in accounts], [11, 20, 21, 30, 31])
+        self.assertEqual(http_client.requested_pages, [1, 2, 3])
+
+    def test_iter_all_prefetches_next_page(self):
+        http_client = FakeHttpClient(total_pages=3)
+        accounts = AccountsService(http_client).iter_all(prefetch=True)
+        next(accounts)
+        http_client.executor.shutdown(wait=True)
+        self.assertEqual(http_client.requested_pages, [1, 2])
+
+    def test_map_bounded_limits_calls_in_flight(self):
+        in_flight = []
+        running = [0]
+        lock = threading.Lock()
+
+        def work(item):
+            with lock:
+                running[0] += 1
+                in_flight.append(running[0])
+            time.sleep(0.005)
+            with lock:
+                running[0] -= 1
+            return item * 2
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(map_bounded(executor, work, range(20), max_workers=2))
+        self.assertEqual(results, [item * 2 for item in range(20)])
+        self.assertLessEqual(max(in_flight), 2)
+
+    def test_update_many_keeps_input_order_and_collects_errors(self):
+        articles = ArticleService(FakeHttpClient(total_pages=1))
+        items = [('1', {'Description': 'One'}), ('22', {}), ('333', {'Description': 'Three'})]
+        result = articles.update_many(items)
+        self.assertEqual([item.index for item in result.results], [0, 1, 2])
+        self.assertEqual([item.value.ArticleNumber for item in result.succeeded], ['1', '333'])
+        self.assertEqual(len(result.failed), 1)
+        self.assertIsInstance(result.failed[0].error, RequestError)
+        self.assertGreater(result.throughput, 0)
+        self.assertIn('2 succeeded, 1 failed', result.summary())
+
+    def test_map_completed_yields_in_completion_order(self):
+        gates = dict((item, threading.Event()) for item in 'abc')
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = map_completed(executor, lambda item: gates[item].wait(5) and item.upper(), 'abc',
+                                    max_workers=3)
+            gates['b'].set()
+            completed = [next(results)]
+            gates['c'].set()
+            completed.append(next(results))
+            gates['a'].set()
+            completed.extend(results)
+        self.assertEqual(completed, [('b', 'B'), ('c', 'C'), ('a', 'A')])
+
+    def test_retrieve_many_collapses_duplicates_and_keeps_id_order(self):
+        http_client = FakeHttpClient(total_pages=1)
+        articles = ArticleService(http_client).retrieve_many(['333', '1', '333', '22', '1'])
+        self.assertEqual(list(articles), ['333', '1', '22'])
+        self.assertEqual(articles['22'].ArticleNumber, '22')
+        self.assertEqual(sorted(http_client.requested_pages), ['1', '22', '333'])
+
+    def test_iter_retrieve_many_yields_as_requests_complete(self):
+        http_client = FakeHttpClient(total_pages=1)
+        http_client.gates = dict((number, threading.Event()) for number in ('1', '22', '333'))
+        releases = {'1': '22', '22': '333'}
+        articles = ArticleService(http_client).iter_retrieve_many(['333', '1', '22'])
+        http_client.gates['1'].set()
+        ids = []
+        for number, _ in articles:
+            ids.append(number)
+            if number in releases:
+                http_client.gates[releases[number]].set()
+        self.assertEqual(ids, ['1', '22', '333'])
+
+    def test_retrieve_many_missing_ids(self):
+        articles = ArticleService(FakeHttpClient(total_pages=1))
+        with self.assertRaises(RequestError):
+            articles.retrieve_many(['1', '404'])
+        self.assertEqual(list(articles.retrieve_many(['1', '404'], skip_missing=True)), ['1'])
+
+    def test_bulk_actions_are_only_mixed_into_services_supporting_them(self):
+        for name in fortnox.services.SERVICE_MODULES:
+            service = getattr(fortnox.services, name)
+            for bulk_action, action in (('retrieve_many', 'retrieve'), ('create_many', 'create'),
+                                        ('update_many', 'update'), ('iter_all', 'list')):
+                if hasattr(service, bulk_action):
+                    self.assertTrue(hasattr(service, action), (name, bulk_action))
+            if hasattr(service, 'iter_all'):
+                self.assertTrue(service.PATH.startswith('/'), name)
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from munch import munchify
+
+from fortnox import SyncEngine, JSONCheckpointStore
+
+
+class FakeHttpClient(object):
+    """
+    Serves invoices page by page, the pages are given by the test.
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def get(self, url, params=None, raw=False):
+        self.requests.append(dict(params))
+        page = params.get('page', 1)
+        items = self.pages[page - 1] if page <= len(self.pages) else []
+        return 200, {}, munchify({'MetaInformation': {'@TotalPages': len(self.pages)}, 'Invoices': items})
+
+
+class FakeService(object):
+
+    def __init__(self, http_client):
+        self.http_client = http_client
+
+
+class FakeClient(object):
+
+    def __init__(self, pages):
+        self.invoices = FakeService(FakeHttpClient(pages))
+
+
+class SyncEngineTest(unittest.TestCase):
+    """
+    Test cases for SyncEngine class
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = JSONCheckpointStore(os.path.join(self.directory.name, 'checkpoints.json'))
+        self.now = datetime(2020, 1, 1, 10, 30, 15)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def engine(self, pages):
+        return SyncEngine(FakeClient(pages), self.store, clock=lambda: self.now)
+
+    def test_changes_are_deduplicated_and_high_water_mark_moves(self):
+        engine = self.engine([[{'DocumentNumber': '1'}, {'DocumentNumber': '2'}], [{'DocumentNumber': '2'}]])
+        result = engine.sync('invoices')
+        self.assertEqual([invoice.DocumentNumber for invoice in result.changes], ['1', '2'])
+        self.assertEqual(result.high_water_mark, '2020-01-01 10:30')
+        self.assertNotIn('lastmodified', engine.client.invoices.http_client.requests[0])
+
+        self.now = datetime(2020, 1, 1, 11, 0)
+        engine = self.engine([[{'DocumentNumber': '3'}]])
+        self.assertEqual([invoice.DocumentNumber for invoice in engine.sync('invoices').changes], ['3'])
+        self.assertEqual(engine.client.invoices.http_client.requests[0]['lastmodified'], '2020-01-01 10:30')
+        self.assertEqual(engine.high_water_mark('invoices'), '2020-01-01 11:00')
+
+    def test_interrupted_run_resumes_from_the_next_page(self):
+        pages = [[{'DocumentNumber': '1'}], [{'DocumentNumber': '2'}], [{'DocumentNumber': '3'}]]
+        changes = self.engine(pages).iter_changes('invoices')
+        next(changes)
+        next(changes)
+        changes.close()
+        self.assertIsNone(self.engine(pages).high_water_mark('invoices'))
+
+        self.now = datetime(2020, 1, 1, 12, 0)
+        engine = self.engine(pages)
+        result = engine.sync('invoices')
+        self.assertEqual([invoice.DocumentNumber for invoice in result.changes], ['2', '3'])
+        self.assertEqual(engine.client.invoices.http_client.requests[0]['page'], 2)
+        self.assertEqual(result.high_water_mark, '2020-01-01 10:30')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from requests import Response
+
+from fortnox import Client, ConfigurationError, RequestError, RecordingTracer, TracedService
+from fortnox.services import InvoiceService
+
+
+def make_response(status_code, data):
+    response = Response()
+    response._content = json.dumps(data).encode('utf-8')
+    response.status_code = status_code
+    response.headers = {"Content-Type": "application/json"}
+    return response
+
+
+class TracingTest(unittest.TestCase):
+    """
+    Test cases for service and request spans
+    """
+
+    def setUp(self):
+        self.tracer = RecordingTracer()
+        self.client = Client(access_token='this-is-my-access-token', client_secret='my-test-client-secret',
+                             rate_limit=None, retry_policy=None, tracer=self.tracer)
+
+    def span(self, name):
+        return next(span for span in self.tracer.spans if span.name == name)
+
+    def test_service_span_holds_http_and_decode_spans(self):
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = make_response(200, {'MetaInformation': {'@TotalPages': 3},
+                                                              'Invoices': [{'DocumentNumber': '1'},
+                                                                           {'DocumentNumber': '2'}]})
+            self.client.invoices.list(page=2)
+
+        service_span = self.span('InvoiceService.list')
+        http_span = self.span('GET /invoices')
+        decode_span = self.span('decode')
+        self.assertIsNone(service_span.parent)
+        self.assertIs(http_span.parent, service_span)
+        self.assertIs(decode_span.parent, http_span)
+        self.assertEqual(service_span.attributes, {'fortnox.service': 'InvoiceService', 'fortnox.resource': 'Invoice',
+                                                   'fortnox.page': 2, 'fortnox.item_count': 2})
+        self.assertEqual(http_span.attributes['fortnox.page'], 2)
+        self.assertEqual(http_span.attributes['http.response.status_code'], 200)
+        self.assertEqual(http_span.attributes['fortnox.item_count'], 2)
+
+    def test_generator_span_lasts_until_exhausted(self):
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = make_response(200, {'MetaInformation': {'@TotalPages': 2},
+                                                              'Invoices': [{'DocumentNumber': '1'},
+                                                                           {'DocumentNumber': '2'}]})
+            invoices = self.client.invoices.iter_all()
+            self.assertEqual(self.tracer.spans, [])
+            next(invoices)
+            self.assertEqual(mocked_request.call_count, 1)
+            self.assertEqual(len(list(invoices)), 3)
+
+        service_span = self.span('InvoiceService.iter_all')
+        http_spans = [span for span in self.tracer.spans if span.name == 'GET /invoices']
+        self.assertEqual(len(http_spans), 2)
+        self.assertTrue(all(span.parent is service_span for span in http_spans))
+        self.assertEqual(service_span.attributes['fortnox.item_count'], 4)
+        self.assertGreaterEqual(service_span.end, http_spans[-1].end)
+
+    def test_pages_fetched_concurrently_are_nested_in_the_service_span(self):
+        def request(method, url, params=None, **kwargs):
+            return make_response(200, {'MetaInformation': {'@TotalPages': 4},
+                                       'Accounts': [{'Number': params.get('page', 1)}]})
+
+        with patch('requests.Session.request', side_effect=request):
+            accounts = self.client.accounts.list()
+        self.assertEqual([account.Number for account in accounts], [1, 2, 3, 4])
+
+        service_span = self.span('AccountsService.list')
+        http_spans = [span for span in self.tracer.spans if span.name == 'GET /accounts']
+        self.assertEqual(sorted(span.attributes.get('fortnox.page', 1) for span in http_spans), [1, 2, 3, 4])
+        self.assertTrue(all(span.parent is service_span for span in http_spans))
+
+    def test_errors_are_recorded(self):
+        with patch('requests.Session.request') as mocked_request:
+            mocked_request.return_value = make_response(404, {'ErrorInformation': {'message': 'Not found'}})
+            with self.assertRaises(RequestError):
+                self.client.invoices.retrieve(10)
+
+        http_span = self.span('GET /invoices/{id}')
+        self.assertEqual(http_span.attributes['http.response.status_code'], 404)
+        self.assertIsInstance(self.span('InvoiceService.retrieve').error, RequestError)
+
+    def test_services_are_not_wrapped_without_tracer(self):
+        self.assertIsInstance(self.client.invoices, TracedService)
+        client = Client(access_token='this-is-my-access-token', client_secret='my-test-client-secret')
+        self.assertIsInstance(client.invoices, InvoiceService)
+        self.assertIsNone(client.http_client.tracer)
+
+    def test_invalid_tracer_is_rejected(self):
+        with self.assertRaises(ConfigurationError):
+            Client(access_token='this-is-my-access-token', client_secret='my-test-client-secret', tracer=object())
+
+
+if __name__ == '__main__':
+    unittest.main()
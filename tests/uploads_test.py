@@ -0,0 +1,125 @@
+import io
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from fortnox import Configuration
+from fortnox.services.helpers import upload_directory
+from fortnox.uploads import UploadBody
+
+
+class FakeHttpClient(object):
+
+    def __init__(self):
+        self.config = Configuration(max_workers=2)
+        self.executor = ThreadPoolExecutor(max_workers=2)
+
+
+class FakeService(object):
+    """
+    Reads every upload body to its end, the way the http client sends it.
+    """
+
+    def __init__(self):
+        self.http_client = FakeHttpClient()
+        self.uploads = []
+
+    def create(self, attributes):
+        attributes = dict(attributes)
+        file_name = attributes.pop('file_name')
+        body = UploadBody(attributes.pop('file'), file_name=file_name, chunk_size=4,
+                          progress=attributes.pop('progress'))
+        while body.read():
+            pass
+        self.uploads.append((file_name, attributes))
+        return {'Name': file_name}
+
+
+class UploadBodyTest(unittest.TestCase):
+    """
+    Test cases for UploadBody class
+    """
+
+    def read_all(self, body):
+        chunks = []
+        chunk = body.read()
+        while chunk:
+            chunks.append(chunk)
+            chunk = body.read()
+        return chunks
+
+    def test_path_is_streamed_in_chunks(self):
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as handle:
+            handle.write(b'x' * 100)
+        try:
+            progress = []
+            body = UploadBody(handle.name, chunk_size=16, progress=lambda sent, total: progress.append((sent, total)))
+            chunks = self.read_all(body)
+
+            self.assertEqual(body.file_name, os.path.basename(handle.name))
+            self.assertTrue(all(len(chunk) <= 16 for chunk in chunks))
+            self.assertIn(b'x' * 100, b''.join(chunks))
+            self.assertEqual(progress[-1], (len(body), len(body)))
+            self.assertTrue(body.file.closed)
+        finally:
+            os.remove(handle.name)
+
+    def test_iterator_is_spooled(self):
+        content = b''.join(self.read_all(UploadBody(iter([b'abc', b'def']), file_name='data.csv')))
+        self.assertIn(b'filename="data.csv"', content)
+        self.assertIn(b'abcdef', content)
+
+    def test_open_file_is_left_open(self):
+        with tempfile.TemporaryFile() as handle:
+            handle.write(b'abc')
+            handle.seek(0)
+            body = UploadBody(handle, file_name='a.txt')
+            self.read_all(body)
+            self.assertFalse(handle.closed)
+
+
+    def test_rewound_body_is_sent_again(self):
+        with tempfile.TemporaryFile() as handle:
+            handle.write(b'..abc')
+            handle.seek(2)
+            for source in (b'abc', handle):
+                body = UploadBody(source, file_name='a.txt', chunk_size=8)
+                first = b''.join(self.read_all(body))
+                body.rewind()
+                self.assertEqual(b''.join(self.read_all(body)), first)
+                self.assertIn(b'\r\n\r\nabc\r\n', first)
+
+    def test_iterators_cannot_be_rewound(self):
+        body = UploadBody(iter([b'abc']))
+        self.read_all(body)
+        self.assertFalse(body.is_rewindable)
+        with self.assertRaises(io.UnsupportedOperation):
+            body.rewind()
+
+
+class UploadDirectoryTest(unittest.TestCase):
+    """
+    Test cases for upload_directory helper
+    """
+
+    def test_every_matching_file_is_uploaded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ('b.pdf', 'a.pdf', 'c.txt'):
+                with open(os.path.join(directory, name), 'wb') as handle:
+                    handle.write(name.encode() * 10)
+            os.mkdir(os.path.join(directory, 'sub.pdf'))
+
+            progress = {}
+            service = FakeService()
+            result = upload_directory(service, directory, '*.pdf', progress=lambda name, sent, total:
+                                      progress.__setitem__(name, (sent, total)), path='inbox_v')
+
+        self.assertEqual([item.value['Name'] for item in result.results], ['a.pdf', 'b.pdf'])
+        self.assertEqual(sorted(progress), ['a.pdf', 'b.pdf'])
+        self.assertTrue(all(sent == total for sent, total in progress.values()))
+        self.assertEqual([attributes for _, attributes in service.uploads], [{'path': 'inbox_v'}] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()